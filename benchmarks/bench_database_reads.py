@@ -0,0 +1,84 @@
+"""
+Compares the pydantic read path of `DatabaseManager` with the lightweight
+tuple path on a synthetic gallery.
+
+Run from the repository root:
+    python -m benchmarks.bench_database_reads --students 10000
+"""
+import argparse
+import time
+import uuid
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from src.database.database_manager import DatabaseManager
+from src.database.db_models import Student, AttendanceRecord
+
+
+def populate(manager: DatabaseManager, n_students: int, n_attendance: int):
+    rng = np.random.default_rng(0)
+    student_ids = []
+    for i in range(n_students):
+        embedding = rng.standard_normal(512).astype(np.float32)
+        embedding /= np.linalg.norm(embedding)
+        student = Student(
+            student_id=f"S{i:06d}",
+            student_name=f"Student {i}",
+            student_image_path=f"data/students/{i}.jpg",
+            student_face_embedding=embedding
+        )
+        manager.add_student(student)
+        student_ids.append(student.student_id)
+
+    start = datetime(2025, 9, 1, 8, 0, 0)
+    for i in range(n_attendance):
+        manager.add_attendance_record(AttendanceRecord(
+            attend_id=str(uuid.uuid4()),
+            student_id=student_ids[i % n_students],
+            recorded_frame=f"data/frames/{i}.jpg",
+            attend_datetime=start + timedelta(minutes=i)
+        ))
+
+
+def timeit(fn, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--students", type=int, default=5000)
+    parser.add_argument("--attendance", type=int, default=20000)
+    parser.add_argument("--k", type=int, default=50)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    manager = DatabaseManager(db_path=":memory:")
+    populate(manager, args.students, args.attendance)
+    query = np.random.default_rng(1).standard_normal(512).astype(np.float32)
+
+    cases = [
+        ("get_all_students", lambda: manager.get_all_students(page_size=args.students),
+                             lambda: manager.get_student_rows(page_size=args.students)),
+        ("get_all_attendance", lambda: manager.get_all_attendance(page_size=args.attendance),
+                               lambda: manager.get_attendance_rows(page_size=args.attendance)),
+        ("find_similar_students", lambda: manager.find_similar_students(query, k=args.k),
+                                  lambda: manager.find_similar_student_rows(query, k=args.k)),
+    ]
+
+    print(f"{'case':<24}{'pydantic (ms)':>16}{'rows (ms)':>12}{'speedup':>10}")
+    for name, model_path, row_path in cases:
+        model_time = timeit(model_path, args.repeats)
+        row_time = timeit(row_path, args.repeats)
+        print(f"{name:<24}{model_time * 1e3:>16.2f}{row_time * 1e3:>12.2f}{model_time / row_time:>9.1f}x")
+
+    manager.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Times the InsightFace ONNX models under the deployment's ONNX Runtime session
+settings and records those settings next to the results, so runs with
+different thread counts or optimization levels can be compared.
+
+Each model is run on random input of its own shape, so only ONNX Runtime is
+needed (not InsightFace). Run from the repository root:
+    python -m benchmarks.bench_inference --config config.yaml --output results.json
+"""
+import argparse
+import glob
+import json
+import os
+import platform
+import time
+
+import numpy as np
+
+from src.utils.config import load_config
+
+
+def input_feed(session, det_size: int) -> dict:
+    feed = {}
+    for model_input in session.get_inputs():
+        # Dynamic dimensions are reported as strings or None; the detector runs at det_size
+        shape = [dim if isinstance(dim, int) else (1 if i == 0 else det_size) for i, dim in enumerate(model_input.shape)]
+        feed[model_input.name] = np.random.default_rng(0).random(shape, dtype=np.float32)
+    return feed
+
+
+def bench_model(onnx_file: str, session_config, det_size: int, warmup: int, repeats: int) -> dict:
+    import onnxruntime
+
+    start = time.perf_counter()
+    session = onnxruntime.InferenceSession(
+        onnx_file, sess_options=session_config.build_session_options(),
+        providers=session_config.providers, provider_options=session_config.build_provider_options()
+    )
+    load_ms = (time.perf_counter() - start) * 1000
+
+    feed = input_feed(session, det_size)
+    for _ in range(warmup):
+        session.run(None, feed)
+
+    timings = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        session.run(None, feed)
+        timings.append((time.perf_counter() - t0) * 1000)
+
+    return {
+        "model": os.path.basename(onnx_file),
+        "providers": session.get_providers(),
+        "load_ms": load_ms,
+        "p50_ms": float(np.percentile(timings, 50)),
+        "p95_ms": float(np.percentile(timings, 95)),
+        "min_ms": float(min(timings)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--config", default=None, help="Deployment config file, defaults to config.yaml")
+    parser.add_argument("--model-dir", default="model_cache/models/buffalo_l")
+    parser.add_argument("--det-size", type=int, default=640)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--output", default=None, help="Write the results as JSON to this file")
+    args = parser.parse_args()
+
+    import onnxruntime
+
+    session_config = load_config(args.config).onnxruntime
+    onnx_files = sorted(glob.glob(os.path.join(args.model_dir, "*.onnx")))
+    if not onnx_files:
+        parser.error(f"No ONNX models found in {args.model_dir}")
+
+    results = {
+        "machine": {
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            "cpu_count": os.cpu_count(),
+            "onnxruntime": onnxruntime.__version__,
+        },
+        "session_config": session_config.model_dump(),
+        "det_size": args.det_size,
+        "models": [],
+    }
+
+    for onnx_file in onnx_files:
+        result = bench_model(onnx_file, session_config, args.det_size, args.warmup, args.repeats)
+        results["models"].append(result)
+        print(f"{result['model']:<24} load {result['load_ms']:8.1f} ms   "
+              f"p50 {result['p50_ms']:8.2f} ms   p95 {result['p95_ms']:8.2f} ms")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Compares two benchmark suite results and flags regressions.
+
+Run from the repository root:
+    python -m benchmarks.compare benchmarks/results/base.json benchmarks/results/new.json --threshold 0.10
+
+Exits with status 1 when any case's median got slower by more than the threshold.
+"""
+import argparse
+import json
+import sys
+
+
+def result_key(result: dict) -> tuple:
+    params = {key: value for key, value in result["params"].items() if key != "build_seconds"}
+    return result["name"], tuple(sorted(params.items()))
+
+
+def compare(base: dict, new: dict, threshold: float) -> tuple[list[tuple], bool]:
+    """
+    Matches cases by name and parameters.
+
+    Returns:
+        (name, params, base median, new median, ratio) rows, and whether any ratio exceeds 1 + threshold.
+    """
+    base_results = {result_key(result): result for result in base["results"] if "median" in result}
+    rows, regressed = [], False
+    for result in new["results"]:
+        key = result_key(result)
+        if "median" not in result or key not in base_results:
+            continue
+        base_median = base_results[key]["median"]
+        ratio = result["median"] / base_median if base_median else float("inf")
+        regressed = regressed or ratio > 1 + threshold
+        rows.append((key[0], dict(key[1]), base_median, result["median"], ratio))
+    return rows, regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("base", help="Results of the reference commit.")
+    parser.add_argument("new", help="Results to check.")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Allowed slowdown of the median, 0.10 = 10%%.")
+    args = parser.parse_args()
+
+    with open(args.base) as f:
+        base = json.load(f)
+    with open(args.new) as f:
+        new = json.load(f)
+
+    rows, regressed = compare(base, new, args.threshold)
+    print(f"base {base['meta'].get('commit')} -> new {new['meta'].get('commit')}")
+    print(f"{'case':<24}{'params':<36}{'base (ms)':>12}{'new (ms)':>12}{'change':>10}")
+    for name, params, base_median, new_median, ratio in rows:
+        params_text = ", ".join(f"{key}={value}" for key, value in params.items())
+        flag = "  <-- regression" if ratio > 1 + args.threshold else ""
+        print(f"{name:<24}{params_text:<36}{base_median:>12.3f}{new_median:>12.3f}{(ratio - 1) * 100:>+9.1f}%{flag}")
+
+    sys.exit(1 if regressed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,335 @@
+"""
+Runs the CPU benchmark suite on synthetic data and stores the results as JSON,
+so runs on different commits can be compared with `benchmarks.compare`.
+
+Covers:
+    - add_student, find_similar_students and a hall-scoped search at several gallery sizes
+    - FaceAnalyzer.associate_tracker_ids with 1-200 faces
+    - One tracker update with KalmanTracker and sort_tracker.Sort (if installed) at 10, 50 and 200 faces
+    - FaceAnalyzer.process_frame on recorded frames (needs InsightFace and the models), e.g. a
+      `.frames` recording made with `src/record_frames.py` so every run sees the same session
+    - MainWindow.update_frame's work: VideoDisplayLabel.set_frame and paint
+
+Run from the repository root:
+    python -m benchmarks.suite --output benchmarks/results/$(git rev-parse --short HEAD).json
+    python -m benchmarks.suite --only association tracking rendering --quick
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+
+from src.database.database_manager import DatabaseManager
+from src.database.db_models import Student
+
+from .bench_database_reads import populate
+
+# The vision and view modules use the application's imports (`from utils...`)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+SUITES = ["database", "association", "tracking", "process_frame", "rendering"]
+
+
+def measure(fn, repeats: int, warmup: int = 1, setup=None) -> dict:
+    """
+    Times `fn` and returns its statistics in milliseconds. `setup` runs
+    untimed before every call.
+    """
+    for _ in range(warmup):
+        if setup:
+            setup()
+        fn()
+
+    timings = []
+    for _ in range(repeats):
+        if setup:
+            setup()
+        t0 = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - t0) * 1000)
+
+    timings = np.array(timings)
+    return {
+        "unit": "ms",
+        "repeats": repeats,
+        "median": float(np.median(timings)),
+        "p95": float(np.percentile(timings, 95)),
+        "min": float(timings.min()),
+        "mean": float(timings.mean()),
+    }
+
+
+def random_embeddings(rng: np.random.Generator, n: int) -> np.ndarray:
+    embeddings = rng.standard_normal((n, 512)).astype(np.float32)
+    return embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+
+
+def bench_database(sizes: list[int], repeats: int) -> list[dict]:
+    results = []
+    rng = np.random.default_rng(0)
+    for size in sizes:
+        manager = DatabaseManager(db_path=":memory:")
+        start = time.perf_counter()
+        populate(manager, size, 0)
+        build_seconds = time.perf_counter() - start
+
+        queries = random_embeddings(rng, repeats + 1)
+        query_iter = iter(queries)
+        result = measure(lambda: manager.find_similar_students(next(query_iter), k=5), repeats)
+        results.append({"name": "find_similar_students", "params": {"gallery": size, "k": 5}, **result})
+
+        # A hall's camera only searches the students enrolled there
+        scope_size = min(80, size)
+        manager.add_students_to_scope("Hall B", [f"S{i:06d}" for i in range(scope_size)])
+        query_iter = iter(random_embeddings(rng, repeats + 1))
+        result = measure(lambda: manager.find_similar_student_rows(next(query_iter), k=1, scope="Hall B"), repeats)
+        results.append({"name": "scoped_search",
+                        "params": {"gallery": size, "scope": scope_size, "k": 1}, **result})
+
+        new_students = iter([
+            Student(
+                student_id=f"N{i:06d}",
+                student_name=f"New Student {i}",
+                student_image_path=f"data/students/new_{i}.jpg",
+                student_face_embedding=embedding
+            )
+            for i, embedding in enumerate(random_embeddings(rng, repeats + 1))
+        ])
+        result = measure(lambda: manager.add_student(next(new_students)), repeats)
+        results.append({"name": "add_student", "params": {"gallery": size, "build_seconds": build_seconds}, **result})
+
+        manager.close()
+        print(f"  database: gallery {size} done")
+    return results
+
+
+def synthetic_tracking_scene(rng: np.random.Generator, n_faces: int):
+    """Returns face-like objects with non-overlapping boxes and SORT-style tracks jittered around them."""
+    from types import SimpleNamespace
+
+    columns = int(np.ceil(np.sqrt(n_faces)))
+    boxes = []
+    for i in range(n_faces):
+        x, y = (i % columns) * 60.0, (i // columns) * 60.0
+        boxes.append(np.array([x, y, x + 50, y + 50], dtype=np.float32))
+    faces = [SimpleNamespace(bbox=box, det_score=0.9, track_id=None) for box in boxes]
+
+    order = rng.permutation(n_faces)
+    tracks = np.array([
+        list(boxes[i] + rng.uniform(-3, 3, 4)) + [track_id + 1]
+        for track_id, i in enumerate(order)
+    ])
+    return faces, tracks
+
+
+def bench_association(face_counts: list[int], repeats: int) -> list[dict]:
+    from vision.face_analyzer import FaceAnalyzer
+
+    analyzer = FaceAnalyzer()
+    rng = np.random.default_rng(0)
+    results = []
+    for n_faces in face_counts:
+        faces, tracks = synthetic_tracking_scene(rng, n_faces)
+        result = measure(lambda: analyzer.associate_tracker_ids(faces, tracks), repeats)
+        results.append({"name": "associate_tracker_ids", "params": {"faces": n_faces}, **result})
+    return results
+
+
+def moving_detections(rng: np.random.Generator, n_faces: int, frames: int) -> list[np.ndarray]:
+    """Returns per-frame (n, 5) detections of faces drifting across a grid, with jitter and 10% missed detections."""
+    columns = int(np.ceil(np.sqrt(n_faces)))
+    positions = np.array([((i % columns) * 60.0, (i // columns) * 60.0) for i in range(n_faces)])
+    velocities = rng.uniform(-1, 1, (n_faces, 2))
+    detections = []
+    for _ in range(frames):
+        positions = positions + velocities
+        boxes = np.column_stack([positions, positions + 50]) + rng.normal(0, 1, (n_faces, 4))
+        scores = rng.uniform(0.5, 1.0, n_faces)
+        detections.append(np.column_stack([boxes, scores])[rng.random(n_faces) > 0.1])
+    return detections
+
+
+def bench_tracking(face_counts: list[int], repeats: int) -> list[dict]:
+    from vision.kalman_tracker import KalmanTracker
+
+    backends = {"kalman": KalmanTracker}
+    try:
+        from sort_tracker import Sort
+        backends["sort"] = Sort
+    except ImportError as e:
+        skipped = f"missing dependency: {e.name}"
+    else:
+        skipped = None
+
+    results = []
+    for n_faces in face_counts:
+        for backend, tracker_class in backends.items():
+            # Warm up to steady state, so every timed update predicts, matches and updates n tracks
+            warmup = 10
+            detections = moving_detections(np.random.default_rng(0), n_faces, warmup + repeats)
+            tracker = tracker_class(max_age=20, min_hits=3, iou_threshold=0.3)
+            frames = iter(detections)
+            result = measure(lambda: tracker.update(next(frames)), repeats, warmup=warmup)
+            results.append({"name": "tracker_update", "params": {"backend": backend, "faces": n_faces}, **result})
+        if skipped:
+            results.append({"name": "tracker_update", "params": {"backend": "sort", "faces": n_faces}, "skipped": skipped})
+    return results
+
+
+def load_frames(frames_path: str | None, count: int) -> tuple[list[np.ndarray], str]:
+    """Reads up to `count` frames from a recording, a video file or a directory of images, else makes noise frames."""
+    import cv2
+    from vision.frame_recording import FrameRecording, is_recording
+
+    if frames_path is None:
+        rng = np.random.default_rng(0)
+        return [rng.integers(0, 256, (720, 1280, 3), dtype=np.uint8) for _ in range(count)], "synthetic"
+
+    if is_recording(frames_path):
+        recording = FrameRecording(frames_path)
+        return [recording.frame(i) for i in range(min(count, len(recording)))], frames_path
+
+    frames = []
+    if os.path.isdir(frames_path):
+        for file_name in sorted(os.listdir(frames_path))[:count]:
+            frame = cv2.imread(os.path.join(frames_path, file_name))
+            if frame is not None:
+                frames.append(frame)
+    else:
+        cap = cv2.VideoCapture(frames_path)
+        while len(frames) < count:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            frames.append(frame)
+        cap.release()
+    return frames, frames_path
+
+
+def bench_process_frame(frames_path: str | None, repeats: int) -> list[dict]:
+    try:
+        import insightface  # noqa: F401
+        import sort_tracker  # noqa: F401
+    except ImportError as e:
+        return [{"name": "process_frame", "params": {}, "skipped": f"missing dependency: {e.name}"}]
+
+    from vision.face_analyzer import FaceAnalyzer
+
+    frames, source = load_frames(frames_path, repeats)
+    if not frames:
+        return [{"name": "process_frame", "params": {"source": source}, "skipped": "no frames could be read"}]
+
+    analyzer = FaceAnalyzer()
+    analyzer.prepare()
+
+    frame_iter = iter(frames * (repeats // len(frames) + 2))
+    result = measure(lambda: analyzer.process_frame(next(frame_iter)), repeats, warmup=3)
+    height, width = frames[0].shape[:2]
+    return [{"name": "process_frame", "params": {"source": source, "width": width, "height": height}, **result}]
+
+
+def bench_rendering(resolutions: list[tuple[int, int]], repeats: int) -> list[dict]:
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt6.QtWidgets import QApplication
+    from PyQt6.QtGui import QImage
+    from views.video_display_label import VideoDisplayLabel
+    from vision.frame_result import FACE_DTYPE, FrameResult
+
+    app = QApplication.instance() or QApplication([])
+    label = VideoDisplayLabel()
+    label.resize(1280, 720)
+    canvas = QImage(label.size(), QImage.Format.Format_RGB32)
+    faces = np.zeros(10, dtype=FACE_DTYPE)
+    faces["box"] = [(100.0 + 60 * i, 100.0, 150.0 + 60 * i, 160.0) for i in range(10)]
+    overlays = FrameResult(faces, [str(i) for i in range(10)], [f"99.00% id: {i}" for i in range(10)])
+
+    rng = np.random.default_rng(0)
+    results = []
+    for width, height in resolutions:
+        frame = rng.integers(0, 256, (height, width, 3), dtype=np.uint8)
+
+        def update_frame():
+            label.set_frame(frame)
+            label.set_overlays(overlays)
+
+        result = measure(update_frame, repeats)
+        results.append({"name": "update_frame", "params": {"width": width, "height": height}, **result})
+
+        update_frame()
+        result = measure(lambda: label.render(canvas), repeats)
+        results.append({"name": "paint", "params": {"width": width, "height": height, "overlays": len(overlays)}, **result})
+
+    app.processEvents()
+    return results
+
+
+def metadata() -> dict:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    from utils.config import load_config
+
+    return {
+        "commit": commit,
+        "time": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "onnxruntime": load_config().onnxruntime.model_dump(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--only", nargs="*", choices=SUITES, default=SUITES, help="Benchmarks to run.")
+    parser.add_argument("--gallery-sizes", type=int, nargs="*", default=[1000, 10000, 100000])
+    parser.add_argument("--face-counts", type=int, nargs="*", default=[1, 5, 10, 25, 50, 100, 200])
+    parser.add_argument("--tracked-faces", type=int, nargs="*", default=[10, 50, 200])
+    parser.add_argument("--frames", default=None, help="Recording, video file or image directory for process_frame.")
+    parser.add_argument("--repeats", type=int, default=50)
+    parser.add_argument("--quick", action="store_true", help="Small galleries and few repeats, for a smoke run.")
+    parser.add_argument("--output", default=None, help="Write the results as JSON to this file.")
+    args = parser.parse_args()
+
+    if args.quick:
+        args.gallery_sizes = [size for size in args.gallery_sizes if size <= 1000] or [1000]
+        args.repeats = min(args.repeats, 10)
+
+    results = []
+    if "database" in args.only:
+        results += bench_database(args.gallery_sizes, args.repeats)
+    if "association" in args.only:
+        results += bench_association(args.face_counts, args.repeats)
+    if "tracking" in args.only:
+        results += bench_tracking(args.tracked_faces, args.repeats)
+    if "process_frame" in args.only:
+        results += bench_process_frame(args.frames, args.repeats)
+    if "rendering" in args.only:
+        results += bench_rendering([(640, 480), (1280, 720), (1920, 1080)], args.repeats)
+
+    for result in results:
+        params = ", ".join(f"{key}={value}" for key, value in result["params"].items() if key != "build_seconds")
+        if "skipped" in result:
+            print(f"{result['name']:<24}{params:<36} skipped ({result['skipped']})")
+        else:
+            print(f"{result['name']:<24}{params:<36} median {result['median']:9.3f} ms   p95 {result['p95']:9.3f} ms")
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w") as f:
+            json.dump({"meta": metadata(), "results": results}, f, indent=2)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
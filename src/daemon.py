@@ -0,0 +1,116 @@
+"""
+Headless recognition daemon: runs the camera, FaceAnalyzer and database
+pipeline without Qt and serves a local API on a Unix socket (see
+`service.protocol`). The GUI can attach to it with `python src/main.py --connect`.
+
+Run from the repository root:
+    python src/daemon.py
+    python src/daemon.py --source recordings/hall_a.mp4 --realtime --exit-at-end
+    python src/daemon.py --source recordings/hall_a.frames --exit-at-end
+"""
+from utils import startup_timing
+
+import argparse
+import signal
+import threading
+
+from database.database_manager import DatabaseManager, GalleryModelError
+from service.ipc_server import IpcServer
+from service.recognition_service import RecognitionService
+from utils.config import load_config
+from utils.latency import LatencyMetrics, dump_metrics
+from utils.logs import setup_logging
+from vision.face_analyzer import FaceAnalyzer
+from vision.frame_sources import create_source
+
+from logging import getLogger
+
+logger = getLogger(__name__)
+
+
+def load_models(face_analyzer: FaceAnalyzer, service: RecognitionService, server: IpcServer, config,
+                autostart: bool, exit_at_end: bool):
+    """
+    Loads the models, then starts capturing if asked. Runs on its own thread
+    while the server already answers requests. The server is shut down when
+    there is nothing left to serve: the models failed to load, or the source
+    ended or could not be started with `exit_at_end`.
+    """
+    try:
+        face_analyzer.prepare(config.onnxruntime, config.models)
+    except Exception as e:
+        logger.exception("Could not load the face analysis models, shutting down.")
+        service.last_error = f"Could not load the face analysis models: {e}"
+        server.request_shutdown()
+        return
+    startup_timing.mark("face analyzer ready")
+
+    if autostart:
+        try:
+            service.start()
+        except GalleryModelError as e:
+            logger.error(f"Not capturing: {e}")
+            if exit_at_end:
+                server.request_shutdown()
+            return
+        if exit_at_end:
+            service.wait()
+            server.request_shutdown()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--config", default=None, help="Deployment config file, defaults to config.yaml")
+    parser.add_argument("--source", default=None, help="Camera index, stream URL, video file or .frames recording, overrides capture.source.")
+    parser.add_argument("--socket", default=None, help="Unix socket path, overrides daemon.socket_path.")
+    parser.add_argument("--db", default=None, help="Database path, overrides daemon.db_path.")
+    parser.add_argument("--realtime", action="store_true", help="Pace video files and recordings like the original capture.")
+    parser.add_argument("--loop", action="store_true", help="Restart video files and recordings when they end.")
+    parser.add_argument("--no-autostart", action="store_true", help="Wait for a 'start' request before capturing.")
+    parser.add_argument("--exit-at-end", action="store_true", help="Shut down when the video source ends.")
+    args = parser.parse_args(argv)
+
+    setup_logging()
+    config = load_config(args.config)
+    daemon_config = config.daemon
+
+    metrics = LatencyMetrics("daemon", enabled=config.metrics.enabled, window=config.metrics.window)
+    face_analyzer = FaceAnalyzer()
+    db_manager = DatabaseManager(args.db or daemon_config.db_path)
+    source = create_source(args.source or config.capture.source, realtime=args.realtime, loop=args.loop,
+                           capture_config=config.capture)
+    service = RecognitionService(face_analyzer, db_manager, source,
+                                 recognition_config=config.recognition, metrics=metrics)
+    server = IpcServer(service, args.socket or daemon_config.socket_path)
+
+    def dump_metrics_periodically():
+        while not stopping.wait(config.metrics.dump_interval):
+            if service.is_running:
+                try:
+                    dump_metrics(config.metrics.dump_path, [metrics])
+                except OSError as e:
+                    logger.warning(f"Could not write metrics to {config.metrics.dump_path}: {e}")
+
+    stopping = threading.Event()
+    for signal_number in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signal_number, lambda *_: server.request_shutdown())
+
+    autostart = daemon_config.autostart and not args.no_autostart
+    threading.Thread(target=load_models, name="model-loader", daemon=True,
+                     args=(face_analyzer, service, server, config, autostart, args.exit_at_end)).start()
+    if config.metrics.enabled and config.metrics.dump_path:
+        threading.Thread(target=dump_metrics_periodically, name="metrics-dump", daemon=True).start()
+
+    logger.info(f"Daemon listening on {server.socket_path}")
+    try:
+        server.serve_forever()
+    finally:
+        stopping.set()
+        service.stop()
+        server.server_close()
+        db_manager.close()
+        logger.info("Daemon stopped.")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,28 +3,66 @@ import sqlite_vec
 import numpy as np
 import logging
 import json
-from typing import List, Literal
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, List, Literal, Optional, Tuple
 
-from .db_models import Student, StudentResult, StudentRecord, AttendanceRecord
+from .db_models import (
+    Student, StudentResult, StudentRecord, AttendanceRecord,
+    StudentRow, StudentMatch, AttendanceRow
+)
+from .gallery_index import GalleryIndex
+from .partitions import Partition, PartitionScheme, partition_for
 
 
 logger = logging.getLogger(__name__)
 
+ATTENDANCE_EXPORT_COLUMNS = (
+    "a.attend_id", "a.student_id", "s.student_name", "a.hall", "a.attend_datetime", "a.recorded_frame"
+)
+
+ATTENDANCE_COLUMNS = "attend_id, student_id, recorded_frame, attend_datetime, hall"
+
+# Keyset paging sort keys. Each matches an attendance index, whose entries end in the rowid
+ATTENDANCE_PAGE_KEYS = {
+    "attend_datetime": ("a.attend_datetime", "a.rowid"),
+    "student_id": ("a.student_id", "a.attend_datetime", "a.rowid"),
+    "hall": ("IFNULL(a.hall, '')", "a.attend_datetime", "a.rowid"),
+}
+
+
+class GalleryModelError(Exception):
+    """The gallery's embeddings come from a different (or more than one) face recognition model"""
+
 
 class DatabaseManager:
     """
     Manages all interactions with the SQLite database, using the sqlite-vec extension.
     """
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, archive_dir: Optional[str] = None):
         self.db_path = db_path
+        self.is_memory = db_path == ":memory:"
+        if archive_dir is None and not self.is_memory:
+            archive_dir = os.path.join(os.path.dirname(os.path.abspath(db_path)), "archive")
+        self.archive_dir = archive_dir
         self.conn = None
+        self._scope_indexes = {}
+        self._scope_indexes_version = None
+        self._scope_indexes_lock = threading.Lock()
         try:
-            self.conn = sqlite3.connect(db_path, check_same_thread=False)
+            self.conn = sqlite3.connect(db_path, check_same_thread=False, uri=True)
             self.conn.row_factory = sqlite3.Row
             
             self.conn.enable_load_extension(True)
             sqlite_vec.load(self.conn)
             self.conn.enable_load_extension(False)
+
+            if not self.is_memory:
+                # WAL lets archive jobs on a second connection read while the live writer commits
+                self.conn.execute("PRAGMA journal_mode = WAL")
+                self.conn.execute("PRAGMA busy_timeout = 5000")
             
             logger.info("Successfully connected to database and loaded sqlite-vec extension.")
             self._create_tables()
@@ -43,6 +81,12 @@ class DatabaseManager:
                     student_image_path TEXT
                 )
             """)
+
+            student_columns = {row['name'] for row in self.conn.execute("PRAGMA table_info(students)")}
+            if 'embedding_model' not in student_columns:
+                self.conn.execute("ALTER TABLE students ADD COLUMN embedding_model TEXT")
+                logger.info("Added 'embedding_model' column to existing students table.")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_students_embedding_model ON students (embedding_model)")
             
             self.conn.execute("""
                 CREATE VIRTUAL TABLE IF NOT EXISTS vec_students USING vec0(
@@ -50,23 +94,71 @@ class DatabaseManager:
                 )
             """)
 
+            # Halls and courses a student is enrolled in, each searchable on its own
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS student_scopes (
+                    scope TEXT NOT NULL,
+                    student_id TEXT NOT NULL,
+                    PRIMARY KEY (scope, student_id),
+                    FOREIGN KEY (student_id) REFERENCES students (student_id)
+                )
+            """)
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_student_scopes_student ON student_scopes (student_id)")
+
+            # Bumped by every write that changes who is searched or their vectors, so processes
+            # sharing the database (daemon, GUI, the CLIs) know their cached scope indexes are stale
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS gallery_version (
+                    id INTEGER PRIMARY KEY CHECK (id = 0),
+                    version INTEGER NOT NULL
+                )
+            """)
+            self.conn.execute("INSERT OR IGNORE INTO gallery_version (id, version) VALUES (0, 0)")
+
             self.conn.execute("""
                 CREATE TABLE IF NOT EXISTS attendance (
                     attend_id TEXT PRIMARY KEY,
                     student_id TEXT NOT NULL,
                     recorded_frame TEXT NOT NULL,
                     attend_datetime TEXT,
+                    hall TEXT,
                     FOREIGN KEY (student_id) REFERENCES students (student_id)
                 )
             """)
+
+            attendance_columns = {row['name'] for row in self.conn.execute("PRAGMA table_info(attendance)")}
+            if 'hall' not in attendance_columns:
+                self.conn.execute("ALTER TABLE attendance ADD COLUMN hall TEXT")
+                logger.info("Added 'hall' column to existing attendance table.")
+
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_attendance_datetime ON attendance (attend_datetime)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_attendance_student_datetime ON attendance (student_id, attend_datetime)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_attendance_hall_datetime ON attendance (hall, attend_datetime)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_attendance_hall_sort ON attendance (IFNULL(hall, ''), attend_datetime)")
+
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS attendance_partitions (
+                    partition_key TEXT PRIMARY KEY,
+                    scheme TEXT NOT NULL,
+                    file_path TEXT NOT NULL,
+                    range_start TEXT NOT NULL,
+                    range_end TEXT NOT NULL,
+                    row_count INTEGER NOT NULL DEFAULT 0
+                )
+            """)
             logger.info("Tables created or already exist.")
 
     def add_student(self, student: Student) -> bool:
+        gallery_models = self.gallery_models()
+        if student.embedding_model and gallery_models and gallery_models != [student.embedding_model]:
+            logger.error(f"Failed to add student '{student.student_id}': embedded with '{student.embedding_model}', "
+                         f"but the gallery holds {gallery_models} embeddings. Re-embed the gallery first.")
+            return False
         try:
             with self.conn:
                 cursor = self.conn.execute(
-                    "INSERT INTO students (student_id, student_name, student_image_path) VALUES (?, ?, ?)",
-                    (student.student_id, student.student_name, student.student_image_path)
+                    "INSERT INTO students (student_id, student_name, student_image_path, embedding_model) VALUES (?, ?, ?, ?)",
+                    (student.student_id, student.student_name, student.student_image_path, student.embedding_model)
                 )
                 student_rowid = cursor.lastrowid
                 embedding_json = json.dumps(student.student_face_embedding.tolist())
@@ -74,6 +166,11 @@ class DatabaseManager:
                     "INSERT INTO vec_students (rowid, face_embedding) VALUES (?, ?)",
                     (student_rowid, embedding_json)
                 )
+                self.conn.executemany(
+                    "INSERT OR IGNORE INTO student_scopes (scope, student_id) VALUES (?, ?)",
+                    [(scope, student.student_id) for scope in student.scopes]
+                )
+                self._bump_gallery_version()
             logger.info(f"Successfully added student: {student.student_name} ({student.student_id})")
             return True
         except sqlite3.IntegrityError:
@@ -95,7 +192,13 @@ class DatabaseManager:
         cursor = self.conn.execute(query, (page_size, offset))
         return [StudentRecord(**dict(row)) for row in cursor.fetchall()]
 
-    def find_similar_students(self, query_embedding: np.ndarray, k: int = 5) -> List[StudentResult]:
+    def find_similar_students(self, query_embedding: np.ndarray, k: int = 5, scope: Optional[str] = None) -> List[StudentResult]:
+        if scope is not None:
+            return [
+                StudentResult(**match._asdict())
+                for match in self._scope_index(scope).search(query_embedding, k, include_embeddings=True)
+            ]
+
         query_json = json.dumps(query_embedding.tolist())
         
         cursor = self.conn.execute("""
@@ -124,20 +227,669 @@ class DatabaseManager:
             
         return results
     
-    def get_all_attendance(self, page: int = 1, page_size: int = 20) -> List[AttendanceRecord]:
+    def get_all_attendance(self, page: int = 1, page_size: int = 20, include_archive: bool = False) -> List[AttendanceRecord]:
+        return [AttendanceRecord(**row._asdict()) for row in self.get_attendance_rows(page, page_size, include_archive)]
+
+    def get_student_rows(self, order_by: Literal["student_name", "student_id"] = "student_name", page: int = 1, page_size: int = 20) -> List[StudentRow]:
+        """
+        Fast variant of `get_all_students` that skips pydantic validation and
+        returns plain `StudentRow` tuples.
+        """
         offset = (page - 1) * page_size
-        cursor = self.conn.execute(
-            "SELECT attend_id, student_id, recorded_frame, attend_datetime FROM attendance ORDER BY attend_datetime DESC LIMIT ? OFFSET ?",
+
+        allowed_order_columns = ["student_name", "student_id"]
+        if order_by not in allowed_order_columns:
+            raise ValueError(f"Invalid order_by column. Must be one of {allowed_order_columns}")
+
+        cursor = self._tuple_cursor()
+        cursor.execute(
+            f"SELECT student_id, student_name, student_image_path FROM students ORDER BY {order_by} LIMIT ? OFFSET ?",
             (page_size, offset)
         )
-        return [AttendanceRecord(**dict(row)) for row in cursor.fetchall()]
+        return list(map(StudentRow._make, cursor))
+
+    def get_student_row(self, student_id: str) -> Optional[StudentRow]:
+        cursor = self._tuple_cursor()
+        cursor.execute("SELECT student_id, student_name, student_image_path FROM students WHERE student_id = ?", (student_id,))
+        row = cursor.fetchone()
+        return StudentRow._make(row) if row else None
+
+    def find_similar_student_rows(self, query_embedding: np.ndarray, k: int = 5, include_embeddings: bool = False,
+                                  scope: Optional[str] = None) -> List[StudentMatch]:
+        """
+        Fast variant of `find_similar_students` returning `StudentMatch` tuples.
+
+        The stored embeddings are only read from `vec_students` when
+        `include_embeddings` is True. With a `scope`, only the students enrolled
+        in that hall or course are searched, using its in-memory `GalleryIndex`.
+        """
+        if scope is not None:
+            return self._scope_index(scope).search(query_embedding, k, include_embeddings)
+
+        query_blob = np.asarray(query_embedding, dtype=np.float32).tobytes()
+        embedding_column = ", v.face_embedding" if include_embeddings else ""
+
+        cursor = self._tuple_cursor()
+        cursor.execute(f"""
+            SELECT
+                s.student_id, s.student_name, s.student_image_path,
+                v.distance{embedding_column}
+            FROM vec_students v
+            JOIN students s ON s.rowid = v.rowid
+            WHERE v.face_embedding MATCH ?
+            AND k = ?
+        """, (query_blob, k))
+
+        results = []
+        for row in cursor:
+            similarity = 1 - (row[3] ** 2) / 2
+            embedding = np.frombuffer(row[4], dtype=np.float32) if include_embeddings else None
+            results.append(StudentMatch(row[0], row[1], row[2], similarity, embedding))
+
+        return results
+
+    def add_students_to_scope(self, scope: str, student_ids: List[str]) -> int:
+        """Enrolls students in a hall or course. Returns how many were newly added; unknown IDs are skipped."""
+        with self.conn:
+            cursor = self.conn.executemany(
+                "INSERT OR IGNORE INTO student_scopes (scope, student_id) SELECT ?, student_id FROM students WHERE student_id = ?",
+                [(scope, student_id) for student_id in student_ids]
+            )
+            self._bump_gallery_version()
+        logger.info(f"Added {cursor.rowcount} students to scope '{scope}'.")
+        return cursor.rowcount
+
+    def remove_students_from_scope(self, scope: str, student_ids: List[str]) -> int:
+        """Removes students from a hall or course. Returns how many were removed."""
+        with self.conn:
+            cursor = self.conn.executemany(
+                "DELETE FROM student_scopes WHERE scope = ? AND student_id = ?",
+                [(scope, student_id) for student_id in student_ids]
+            )
+            self._bump_gallery_version()
+        logger.info(f"Removed {cursor.rowcount} students from scope '{scope}'.")
+        return cursor.rowcount
+
+    def get_student_scopes(self, student_id: str) -> List[str]:
+        cursor = self._tuple_cursor()
+        cursor.execute("SELECT scope FROM student_scopes WHERE student_id = ? ORDER BY scope", (student_id,))
+        return [row[0] for row in cursor]
+
+    def list_scopes(self) -> List[Tuple[str, int]]:
+        """Returns (scope, enrolled students) for every hall and course."""
+        cursor = self._tuple_cursor()
+        cursor.execute("SELECT scope, COUNT(*) FROM student_scopes GROUP BY scope ORDER BY scope")
+        return cursor.fetchall()
+
+    def gallery_models(self) -> List[str]:
+        """Returns the models the stored embeddings were made with, ignoring untagged (legacy) students."""
+        cursor = self._tuple_cursor()
+        cursor.execute("SELECT DISTINCT embedding_model FROM students WHERE embedding_model IS NOT NULL ORDER BY 1")
+        return [row[0] for row in cursor]
+
+    def check_gallery_model(self, embedding_model: str):
+        """
+        Raises `GalleryModelError` unless every tagged embedding in the gallery
+        was made with `embedding_model`, the model the caller searches with.
+        Vectors of different models are not comparable, so a mixed gallery
+        would produce meaningless matches. Untagged students, enrolled before
+        embeddings were tagged, are assumed to match.
+        """
+        gallery_models = self.gallery_models()
+        if len(gallery_models) > 1:
+            raise GalleryModelError(f"The gallery mixes embeddings of {gallery_models}. Re-embed it with one model.")
+        if gallery_models and gallery_models[0] != embedding_model:
+            raise GalleryModelError(f"The gallery was embedded with '{gallery_models[0]}', but the loaded model is "
+                                    f"'{embedding_model}'. Re-embed it with `python src/reembed_gallery.py run`.")
+
+    def start_reembedding(self, embedding_model: str, retry_failed: bool = False) -> int:
+        """
+        Starts, or resumes, re-embedding the gallery with another model.
+
+        New vectors go to the `vec_students_next` shadow table and every stored
+        batch is a checkpoint in `reembedding_progress`, so an interrupted job
+        continues where it stopped. A job for a different model is discarded.
+        The live gallery is untouched until `swap_reembedded_gallery`.
+
+        Args:
+            embedding_model: The model the new vectors are made with.
+            retry_failed: Queue students whose photo failed before again.
+
+        Returns:
+            The number of students already re-embedded by an earlier run.
+        """
+        job = self.reembedding_job()
+        if job is not None and job[0] != embedding_model:
+            logger.info(f"Discarding the re-embedding job for '{job[0]}'.")
+            self.discard_reembedding()
+
+        with self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS reembedding_job (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    embedding_model TEXT NOT NULL,
+                    started TEXT NOT NULL
+                )
+            """)
+            self.conn.execute("CREATE VIRTUAL TABLE IF NOT EXISTS vec_students_next USING vec0(face_embedding float[512])")
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS reembedding_progress (
+                    student_rowid INTEGER PRIMARY KEY,
+                    error TEXT
+                )
+            """)
+            self.conn.execute("INSERT OR IGNORE INTO reembedding_job (id, embedding_model, started) VALUES (1, ?, ?)",
+                              (embedding_model, str(datetime.now())))
+            if retry_failed:
+                self.conn.execute("DELETE FROM reembedding_progress WHERE error IS NOT NULL")
+
+        return self.conn.execute("SELECT COUNT(*) FROM reembedding_progress WHERE error IS NULL").fetchone()[0]
+
+    def reembedding_job(self) -> Optional[Tuple[str, str]]:
+        """Returns (embedding_model, started) of the unfinished re-embedding job, or None."""
+        if not self.conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'reembedding_job'").fetchone():
+            return None
+        row = self._tuple_cursor().execute("SELECT embedding_model, started FROM reembedding_job").fetchone()
+        return tuple(row) if row else None
+
+    def reembedding_progress(self) -> Tuple[int, int, int]:
+        """Returns (students, re-embedded, failed) of the current re-embedding job."""
+        total = self.conn.execute("SELECT COUNT(*) FROM students").fetchone()[0]
+        if self.reembedding_job() is None:
+            return total, 0, 0
+        done, failed = self.conn.execute(
+            "SELECT COUNT(*) - COUNT(error), COUNT(error) FROM reembedding_progress"
+        ).fetchone()
+        return total, done, failed
+
+    def iter_reembedding_batches(self, batch_size: int = 32) -> Iterator[List[Tuple[int, str]]]:
+        """
+        Yields batches of (student rowid, image path) that the current job has
+        not processed yet, in rowid order. Pages are read by key, so batches
+        stored while iterating don't shift the following ones.
+        """
+        last_rowid = 0
+        while True:
+            cursor = self._tuple_cursor()
+            cursor.execute("""
+                SELECT s.rowid, s.student_image_path FROM students s
+                WHERE s.rowid > ? AND s.rowid NOT IN (SELECT student_rowid FROM reembedding_progress)
+                ORDER BY s.rowid
+                LIMIT ?
+            """, (last_rowid, batch_size))
+            batch = cursor.fetchall()
+            if not batch:
+                return
+            last_rowid = batch[-1][0]
+            yield batch
+
+    def save_reembedded(self, embeddings: List[Tuple[int, np.ndarray]], failures: List[Tuple[int, str]] = ()):
+        """Stores one batch of new vectors and failed students in a single transaction, the job's checkpoint."""
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO vec_students_next (rowid, face_embedding) VALUES (?, ?)",
+                [(rowid, np.asarray(embedding, dtype=np.float32).tobytes()) for rowid, embedding in embeddings]
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO reembedding_progress (student_rowid, error) VALUES (?, NULL)",
+                [(rowid,) for rowid, _ in embeddings]
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO reembedding_progress (student_rowid, error) VALUES (?, ?)",
+                list(failures)
+            )
+
+    def reembedding_failures(self) -> List[Tuple[str, str, str]]:
+        """Returns (student_id, image path, error) of the students the current job could not re-embed."""
+        cursor = self._tuple_cursor()
+        cursor.execute("""
+            SELECT s.student_id, s.student_image_path, p.error FROM reembedding_progress p
+            JOIN students s ON s.rowid = p.student_rowid
+            WHERE p.error IS NOT NULL
+            ORDER BY s.rowid
+        """)
+        return cursor.fetchall()
+
+    def swap_reembedded_gallery(self) -> int:
+        """
+        Replaces every gallery vector with its re-embedded one and retags the
+        students, in one transaction, then drops the job's tables. Searches see
+        either the old or the new gallery, never a mix.
+
+        Raises:
+            GalleryModelError: A student has no new vector yet (not processed or failed).
+
+        Returns:
+            The number of students swapped.
+        """
+        job = self.reembedding_job()
+        if job is None:
+            raise GalleryModelError("There is no re-embedding job to swap in.")
+        embedding_model = job[0]
+
+        with self.conn:
+            missing = self.conn.execute("""
+                SELECT COUNT(*) FROM students
+                WHERE rowid NOT IN (SELECT student_rowid FROM reembedding_progress WHERE error IS NULL)
+            """).fetchone()[0]
+            if missing:
+                raise GalleryModelError(f"{missing} students have no '{embedding_model}' embedding yet, "
+                                        f"resume the job or fix their photos first.")
+
+            self.conn.execute("DELETE FROM vec_students")
+            self.conn.execute("INSERT INTO vec_students (rowid, face_embedding) SELECT rowid, face_embedding FROM vec_students_next")
+            swapped = self.conn.execute("UPDATE students SET embedding_model = ?", (embedding_model,)).rowcount
+            self._drop_reembedding_tables()
+            self._bump_gallery_version()
+
+        logger.info(f"Swapped in '{embedding_model}' embeddings for {swapped} students.")
+        return swapped
+
+    def discard_reembedding(self):
+        """Drops an unfinished re-embedding job and its vectors."""
+        with self.conn:
+            self._drop_reembedding_tables()
+
+    def _drop_reembedding_tables(self):
+        self.conn.execute("DROP TABLE IF EXISTS vec_students_next")
+        self.conn.execute("DROP TABLE IF EXISTS reembedding_progress")
+        self.conn.execute("DROP TABLE IF EXISTS reembedding_job")
+
+    def _scope_index(self, scope: str) -> GalleryIndex:
+        """
+        Returns the cached index of a scope's students, loading it on first use.
+        Every cached index is dropped once `gallery_version` moved, whichever
+        connection or process changed the gallery.
+        """
+        with self._scope_indexes_lock:
+            version = self.conn.execute("SELECT version FROM gallery_version WHERE id = 0").fetchone()[0]
+            if version != self._scope_indexes_version:
+                self._scope_indexes.clear()
+                self._scope_indexes_version = version
+
+            index = self._scope_indexes.get(scope)
+            if index is not None:
+                return index
+
+            cursor = self._tuple_cursor()
+            cursor.execute("""
+                SELECT s.student_id, s.student_name, s.student_image_path, v.face_embedding
+                FROM student_scopes sc
+                JOIN students s ON s.student_id = sc.student_id
+                JOIN vec_students v ON v.rowid = s.rowid
+                WHERE sc.scope = ?
+                ORDER BY s.rowid
+            """, (scope,))
+            rows, embeddings = [], []
+            for row in cursor:
+                rows.append(StudentRow(*row[:3]))
+                embeddings.append(np.frombuffer(row[3], dtype=np.float32))
+
+            index = GalleryIndex(rows, np.stack(embeddings) if embeddings else np.empty((0, 512), dtype=np.float32))
+            if not rows:
+                logger.warning(f"No students are enrolled in scope '{scope}', its searches will find nobody.")
+            self._scope_indexes[scope] = index
+            return index
+
+    def _bump_gallery_version(self):
+        """Marks every process's cached scope indexes stale. Call inside the transaction that changed the gallery."""
+        self.conn.execute("UPDATE gallery_version SET version = version + 1 WHERE id = 0")
+
+    def get_attendance_rows(self, page: int = 1, page_size: int = 20, include_archive: bool = False) -> List[AttendanceRow]:
+        """
+        Fast variant of `get_all_attendance` that returns `AttendanceRow` tuples.
+        `attend_datetime` is left as the stored ISO string.
+
+        Only the hot database is read by default. With `include_archive`, every
+        archived partition is attached and returns its newest `page * page_size`
+        rows, and the page is cut from the merge of those, so deep pages get
+        expensive. Page through the archive with `get_attendance_page` instead.
+        """
+        offset = (page - 1) * page_size
+        rows = []
+        for _, table in self._attendance_tables(None, None, include_archive):
+            cursor = self._tuple_cursor()
+            cursor.execute(
+                f"SELECT attend_id, student_id, recorded_frame, attend_datetime, hall FROM {table} ORDER BY attend_datetime DESC LIMIT ?",
+                (offset + page_size,)
+            )
+            rows.extend(map(AttendanceRow._make, cursor))
+
+        # Like SQLite, sort NULL datetimes last in descending order
+        rows.sort(key=lambda row: row.attend_datetime or "", reverse=True)
+        return rows[offset:offset + page_size]
+
+    def iter_attendance_export(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        hall: Optional[str] = None,
+        student_id: Optional[str] = None,
+        chunk_size: int = 1000,
+        include_archive: bool = True
+    ) -> Iterator[List[tuple]]:
+        """
+        Streams attendance joined with student names in chunks of plain tuples.
+
+        Rows are fetched with `fetchmany`, so memory stays bounded by `chunk_size`
+        regardless of the table size. Filters are served by the attendance indexes.
+
+        Args:
+            start: Inclusive lower bound on `attend_datetime`.
+            end: Exclusive upper bound on `attend_datetime`.
+            hall: Only rows recorded in this hall.
+            student_id: Only rows of this student.
+            chunk_size: Number of rows fetched per chunk.
+            include_archive: Also stream archived partitions overlapping the date range,
+                             attaching each one read-only for the duration of its scan.
+
+        Yields:
+            Lists of tuples ordered as `ATTENDANCE_EXPORT_COLUMNS`.
+        """
+        conditions, params = self._attendance_filters(start, end, hall, student_id)
+        where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        # Partitions are disjoint in time, so streaming them oldest first keeps the output ordered
+        for _, table in self._attendance_tables(start, end, include_archive):
+            yield from self._stream_attendance(table, where_clause, params, chunk_size)
+
+    def get_attendance_page(
+        self,
+        order_by: Literal["attend_datetime", "student_id", "hall"] = "attend_datetime",
+        descending: bool = True,
+        after: Optional[tuple] = None,
+        page_size: int = 200,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        hall: Optional[str] = None,
+        student_id: Optional[str] = None,
+        include_archive: bool = True
+    ) -> Tuple[List[tuple], Optional[tuple]]:
+        """
+        Reads one page of attendance (joined with student names) using keyset paging.
+
+        Instead of OFFSET, each page continues strictly after the sort key of the
+        previous page's last row, so every page costs the same index seek no
+        matter how deep the user has scrolled.
+
+        Archived partitions overlapping the date range are read too, one at a
+        time: each returns its next `page_size` rows after the key, and the page
+        is cut from their merge. Rowids repeat across partitions, so the key
+        also holds the partition the row came from ('main' for the hot database).
+
+        Args:
+            order_by: The sort column, each one backed by an attendance index.
+            descending: Sort direction.
+            after: The `next_key` returned with the previous page, None for the first page.
+            page_size: Maximum number of rows returned.
+            start, end, hall, student_id: Same filters as `iter_attendance_export`.
+            include_archive: Also page through the archived partitions.
+
+        Returns:
+            A tuple of the rows, ordered as `ATTENDANCE_EXPORT_COLUMNS`, and the key
+            to pass as `after` for the next page (None once the end is reached).
+        """
+        if order_by not in ATTENDANCE_PAGE_KEYS:
+            raise ValueError(f"Invalid order_by column. Must be one of {list(ATTENDANCE_PAGE_KEYS)}")
+
+        # The sort columns, then the partition, then the rowid within it
+        key_columns = ATTENDANCE_PAGE_KEYS[order_by]
+        sort_columns = key_columns[:-1]
+        comparison = "<" if descending else ">"
+        direction = "DESC" if descending else "ASC"
+        filters, filter_params = self._attendance_filters(start, end, hall, student_id)
+
+        rows = []
+        for source, table in self._attendance_tables(start, end, include_archive):
+            conditions, params = list(filters), list(filter_params)
+            if after is not None:
+                *after_sort, after_source, after_rowid = after
+                if source == after_source:
+                    # Continue within the partition the previous page ended in
+                    columns, values, operator = key_columns, [*after_sort, after_rowid], comparison
+                elif (source > after_source) != descending:
+                    # Comes after that partition, so rows tying on the sort columns are next
+                    columns, values, operator = sort_columns, after_sort, comparison + "="
+                else:
+                    columns, values, operator = sort_columns, after_sort, comparison
+                conditions.append(f"({', '.join(columns)}) {operator} ({', '.join('?' * len(columns))})")
+                params.extend(values)
+
+            where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+            cursor = self._tuple_cursor()
+            cursor.execute(f"""
+                SELECT {', '.join(ATTENDANCE_EXPORT_COLUMNS)}, {', '.join(sort_columns)}, ?, a.rowid
+                FROM {table} a
+                JOIN main.students s ON s.student_id = a.student_id
+                {where_clause}
+                ORDER BY {', '.join(f"{column} {direction}" for column in key_columns)}
+                LIMIT ?
+            """, [source] + params + [page_size])
+            rows.extend(cursor)
+
+        key_length = len(key_columns) + 1
+        # NULL datetimes sort first, as in SQLite
+        rows.sort(key=lambda row: tuple("" if value is None else value for value in row[-key_length:]), reverse=descending)
+        rows = rows[:page_size]
+        next_key = rows[-1][-key_length:] if len(rows) == page_size else None
+        return [row[:-key_length] for row in rows], next_key
+
+    def _attendance_tables(self, start: Optional[datetime], end: Optional[datetime], include_archive: bool) -> Iterator[Tuple[str, str]]:
+        """
+        Yields (partition key, table) for the archived partitions overlapping the
+        date range, oldest first, then ('main', 'main.attendance'). Each partition
+        is attached read-only only until the caller moves on, so any number of
+        them can be read without reaching SQLite's limit on attached databases.
+        """
+        if include_archive:
+            for partition_key, file_path in self._partitions_overlapping(start, end):
+                alias = f"archive_{partition_key}"
+                self.conn.execute("ATTACH DATABASE ? AS " + alias, (Path(file_path).resolve().as_uri() + "?mode=ro",))
+                try:
+                    yield partition_key, f"{alias}.attendance"
+                finally:
+                    self.conn.execute(f"DETACH DATABASE {alias}")
+
+        yield "main", "main.attendance"
+
+    @staticmethod
+    def _attendance_filters(start: Optional[datetime], end: Optional[datetime], hall: Optional[str], student_id: Optional[str]) -> Tuple[List[str], list]:
+        conditions, params = [], []
+        if start is not None:
+            conditions.append("a.attend_datetime >= ?")
+            params.append(str(start))
+        if end is not None:
+            conditions.append("a.attend_datetime < ?")
+            params.append(str(end))
+        if hall is not None:
+            conditions.append("a.hall = ?")
+            params.append(hall)
+        if student_id is not None:
+            conditions.append("a.student_id = ?")
+            params.append(student_id)
+        return conditions, params
+
+    def _stream_attendance(self, table: str, where_clause: str, params: list, chunk_size: int) -> Iterator[List[tuple]]:
+        cursor = self._tuple_cursor()
+        cursor.execute(f"""
+            SELECT {', '.join(ATTENDANCE_EXPORT_COLUMNS)}
+            FROM {table} a
+            JOIN main.students s ON s.student_id = a.student_id
+            {where_clause}
+            ORDER BY a.attend_datetime
+        """, params)
+
+        try:
+            while True:
+                chunk = cursor.fetchmany(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            cursor.close()
+
+    def _partitions_overlapping(self, start: Optional[datetime], end: Optional[datetime]) -> List[tuple]:
+        cursor = self._tuple_cursor()
+        cursor.execute("""
+            SELECT partition_key, file_path FROM attendance_partitions
+            WHERE (? IS NULL OR range_end > ?) AND (? IS NULL OR range_start < ?)
+            ORDER BY range_start
+        """, (str(start) if start else None, str(start) if start else None,
+              str(end) if end else None, str(end) if end else None))
+        return cursor.fetchall()
+
+    def list_partitions(self) -> List[sqlite3.Row]:
+        """Returns the catalog of archived attendance partitions, oldest first."""
+        return self.conn.execute(
+            "SELECT partition_key, scheme, file_path, range_start, range_end, row_count FROM attendance_partitions ORDER BY range_start"
+        ).fetchall()
+
+    def archive_attendance(self, before: datetime, scheme: PartitionScheme = "month", batch_size: int = 1000) -> int:
+        """
+        Moves attendance records older than `before` out of the hot database into
+        one database file per month or term under `archive_dir`.
+
+        Rows are moved in small batches, each in its own short transaction, on a
+        separate connection for file databases. The live writer therefore only ever
+        waits for a single batch. Archived partitions remain visible to
+        `iter_attendance_export` and `get_attendance_page`.
+
+        Args:
+            before: Records with `attend_datetime` strictly before this are archived.
+            scheme: Partition granularity, 'month' or 'term'.
+            batch_size: Number of rows moved per transaction.
+
+        Returns:
+            The number of records archived.
+        """
+        if self.archive_dir is None:
+            raise ValueError("An archive_dir is required to archive an in-memory database.")
+
+        existing_schemes = {row['scheme'] for row in self.list_partitions()}
+        if existing_schemes - {scheme}:
+            raise ValueError(f"Archive already uses the '{existing_schemes.pop()}' scheme, cannot mix with '{scheme}'.")
+
+        os.makedirs(self.archive_dir, exist_ok=True)
+
+        job_conn = self._open_job_connection()
+        archived = 0
+        try:
+            months = [row[0] for row in job_conn.execute(
+                "SELECT DISTINCT substr(attend_datetime, 1, 7) FROM attendance WHERE attend_datetime < ? ORDER BY 1",
+                (str(before),)
+            )]
+            partitions = {}
+            for month in months:
+                partition = partition_for(datetime.strptime(month, "%Y-%m"), scheme)
+                partitions[partition.key] = partition
+
+            for partition in partitions.values():
+                archived += self._archive_partition(job_conn, partition, scheme, min(before, partition.end), batch_size)
+        finally:
+            if job_conn is not self.conn:
+                job_conn.close()
+
+        logger.info(f"Archived {archived} attendance records older than {before} into {len(partitions)} partition(s).")
+        return archived
+
+    def _archive_partition(self, job_conn: sqlite3.Connection, partition: Partition, scheme: str, cutoff: datetime, batch_size: int) -> int:
+        file_path = os.path.join(self.archive_dir, f"attendance_{partition.key}.db")
+        job_conn.execute("ATTACH DATABASE ? AS archive", (file_path,))
+        moved = 0
+        try:
+            with job_conn:
+                job_conn.execute("""
+                    CREATE TABLE IF NOT EXISTS archive.attendance (
+                        attend_id TEXT PRIMARY KEY,
+                        student_id TEXT NOT NULL,
+                        recorded_frame TEXT NOT NULL,
+                        attend_datetime TEXT,
+                        hall TEXT
+                    )
+                """)
+                job_conn.execute("CREATE INDEX IF NOT EXISTS archive.idx_attendance_datetime ON attendance (attend_datetime)")
+                job_conn.execute("CREATE INDEX IF NOT EXISTS archive.idx_attendance_student_datetime ON attendance (student_id, attend_datetime)")
+                job_conn.execute("CREATE INDEX IF NOT EXISTS archive.idx_attendance_hall_datetime ON attendance (hall, attend_datetime)")
+                # Catalogued before the first batch moves, so moved rows stay readable even if the job dies midway
+                job_conn.execute("""
+                    INSERT INTO attendance_partitions (partition_key, scheme, file_path, range_start, range_end)
+                    VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT (partition_key) DO NOTHING
+                """, (partition.key, scheme, file_path, str(partition.start), str(partition.end)))
+
+            while True:
+                with job_conn:
+                    rowids = [row[0] for row in job_conn.execute(
+                        "SELECT rowid FROM main.attendance WHERE attend_datetime >= ? AND attend_datetime < ? LIMIT ?",
+                        (str(partition.start), str(cutoff), batch_size)
+                    )]
+                    if not rowids:
+                        break
+                    batch = json.dumps(rowids)
+                    job_conn.execute(f"""
+                        INSERT OR IGNORE INTO archive.attendance ({ATTENDANCE_COLUMNS})
+                        SELECT {ATTENDANCE_COLUMNS} FROM main.attendance
+                        WHERE rowid IN (SELECT value FROM json_each(?))
+                    """, (batch,))
+                    job_conn.execute("DELETE FROM main.attendance WHERE rowid IN (SELECT value FROM json_each(?))", (batch,))
+                moved += len(rowids)
+
+            with job_conn:
+                row_count = job_conn.execute("SELECT COUNT(*) FROM archive.attendance").fetchone()[0]
+                job_conn.execute(
+                    "UPDATE attendance_partitions SET row_count = ? WHERE partition_key = ?", (row_count, partition.key)
+                )
+        finally:
+            job_conn.execute("DETACH DATABASE archive")
+
+        return moved
+
+    def prune_archives(self, before: datetime) -> int:
+        """
+        Deletes archived partitions whose whole time range ends on or before `before`.
+
+        Returns:
+            The number of partitions removed.
+        """
+        cursor = self._tuple_cursor()
+        cursor.execute(
+            "SELECT partition_key, file_path FROM attendance_partitions WHERE range_end <= ?", (str(before),)
+        )
+        expired = cursor.fetchall()
+
+        for partition_key, file_path in expired:
+            with self.conn:
+                self.conn.execute("DELETE FROM attendance_partitions WHERE partition_key = ?", (partition_key,))
+            if os.path.exists(file_path):
+                os.remove(file_path)
+            logger.info(f"Pruned attendance partition '{partition_key}' ({file_path}).")
+
+        return len(expired)
+
+    def _open_job_connection(self) -> sqlite3.Connection:
+        """
+        Opens a dedicated connection for maintenance jobs so they never share a
+        transaction with the live writer. In-memory databases cannot be shared
+        between connections and reuse the main one.
+        """
+        if self.is_memory:
+            return self.conn
+        job_conn = sqlite3.connect(self.db_path, check_same_thread=False, uri=True)
+        job_conn.execute("PRAGMA busy_timeout = 5000")
+        return job_conn
+
+    def _tuple_cursor(self) -> sqlite3.Cursor:
+        """Returns a cursor yielding plain tuples instead of `sqlite3.Row` objects."""
+        cursor = self.conn.cursor()
+        cursor.row_factory = None
+        return cursor
 
     def add_attendance_record(self, attendance: AttendanceRecord) -> bool:
         try:
             with self.conn:
                 self.conn.execute(
-                    "INSERT INTO attendance (attend_id, student_id, recorded_frame, attend_datetime) VALUES (?, ?, ?, ?)",
-                    (attendance.attend_id, attendance.student_id, attendance.recorded_frame, str(attendance.attend_datetime))
+                    "INSERT INTO attendance (attend_id, student_id, recorded_frame, attend_datetime, hall) VALUES (?, ?, ?, ?, ?)",
+                    (attendance.attend_id, attendance.student_id, attendance.recorded_frame, str(attendance.attend_datetime), attendance.hall)
                 )
             logger.info(f"Successfully recorded attendance for student: {attendance.student_id}")
             return True
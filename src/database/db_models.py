@@ -1,6 +1,7 @@
 from pydantic import BaseModel, ConfigDict, Field
 import numpy as np
 from datetime import datetime
+from typing import Dict, List, NamedTuple, Optional, Sequence, Type
 
 
 class Student(BaseModel):
@@ -11,6 +12,8 @@ class Student(BaseModel):
     student_name: str = Field(..., description="The name of the student")
     student_image_path: str = Field(..., description="The profile image path of the student")
     student_face_embedding: np.ndarray = Field(..., description="The 512-dim embedding vector")
+    scopes: List[str] = Field([], description="The halls and courses the student is enrolled in")
+    embedding_model: Optional[str] = Field(None, description="The face recognition model the embedding was made with")
 
 
 class StudentRecord(BaseModel):
@@ -39,3 +42,55 @@ class AttendanceRecord(BaseModel):
     student_id: str = Field(..., description="The ID of the student attending")
     recorded_frame: str = Field(..., description="The path to the frame recording of the student attending")
     attend_datetime: datetime = Field(..., description="The date & time of the attendence")
+    hall: Optional[str] = Field(None, description="The hall the attendance was recorded in")
+
+
+class StudentRow(NamedTuple):
+    """Lightweight, unvalidated row of the students table"""
+
+    student_id: str
+    student_name: str
+    student_image_path: str
+
+
+class StudentMatch(NamedTuple):
+    """Lightweight, unvalidated search result of a student"""
+
+    student_id: str
+    student_name: str
+    student_image_path: str
+    similarity_score: float
+    student_face_embedding: Optional[np.ndarray] = None
+
+
+class AttendanceRow(NamedTuple):
+    """Lightweight, unvalidated row of the attendance table"""
+
+    attend_id: str
+    student_id: str
+    recorded_frame: str
+    attend_datetime: str
+    hall: Optional[str]
+
+
+def rows_to_columns(rows: Sequence[NamedTuple], row_type: Type[NamedTuple]) -> Dict[str, np.ndarray]:
+    """
+    Transposes a list of lightweight rows into column-oriented NumPy arrays.
+
+    Text columns become object arrays, `similarity_score` becomes float32 and
+    `student_face_embedding` is stacked into an (N, 512) matrix when every row
+    has one. Otherwise it stays an object array of the per-row embeddings, with
+    None where missing, so every column has one entry per row.
+    """
+    columns = {}
+    for index, field in enumerate(row_type._fields):
+        values = [row[index] for row in rows]
+        if field == "similarity_score":
+            columns[field] = np.fromiter(values, dtype=np.float32, count=len(values))
+        elif field == "student_face_embedding" and all(value is not None for value in values):
+            columns[field] = np.stack(values) if values else np.empty((0, 512), dtype=np.float32)
+        else:
+            array = np.empty(len(values), dtype=object)
+            array[:] = values
+            columns[field] = array
+    return columns
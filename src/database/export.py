@@ -0,0 +1,115 @@
+"""
+Streaming export of the attendance table to CSV or Parquet.
+
+Usage:
+    python -m src.database.export data/attendance.db attendance_export.csv --start 2025-09-01 --hall "Hall B"
+"""
+import argparse
+import csv
+import logging
+from datetime import datetime
+from typing import Literal, Optional
+
+from .database_manager import DatabaseManager, ATTENDANCE_EXPORT_COLUMNS
+
+
+logger = logging.getLogger(__name__)
+
+EXPORT_FIELDS = [column.split(".", 1)[1] for column in ATTENDANCE_EXPORT_COLUMNS]
+
+
+def export_attendance(
+    db_manager: DatabaseManager,
+    output_path: str,
+    file_format: Literal["csv", "parquet"] = "csv",
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    hall: Optional[str] = None,
+    student_id: Optional[str] = None,
+    chunk_size: int = 5000
+) -> int:
+    """
+    Streams the (optionally filtered) attendance table into a CSV or Parquet file.
+
+    Only one chunk of rows is held in memory at a time.
+
+    Returns:
+        The number of rows written.
+    """
+    chunks = db_manager.iter_attendance_export(
+        start=start, end=end, hall=hall, student_id=student_id, chunk_size=chunk_size
+    )
+
+    if file_format == "csv":
+        row_count = _write_csv(chunks, output_path)
+    elif file_format == "parquet":
+        row_count = _write_parquet(chunks, output_path)
+    else:
+        raise ValueError(f"Invalid export format '{file_format}'. Must be one of ['csv', 'parquet']")
+
+    logger.info(f"Exported {row_count} attendance records to {output_path}")
+    return row_count
+
+
+def _write_csv(chunks, output_path: str) -> int:
+    row_count = 0
+    with open(output_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(EXPORT_FIELDS)
+        for chunk in chunks:
+            writer.writerows(chunk)
+            row_count += len(chunk)
+    return row_count
+
+
+def _write_parquet(chunks, output_path: str) -> int:
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Parquet export requires 'pyarrow'. Install it with 'pip install pyarrow'.") from e
+
+    schema = pa.schema([(field, pa.string()) for field in EXPORT_FIELDS])
+    row_count = 0
+    with pq.ParquetWriter(output_path, schema) as writer:
+        for chunk in chunks:
+            columns = list(zip(*chunk))
+            batch = pa.record_batch([pa.array(column, type=pa.string()) for column in columns], schema=schema)
+            writer.write_batch(batch)
+            row_count += len(chunk)
+    return row_count
+
+
+def _parse_datetime(value: str) -> datetime:
+    return datetime.fromisoformat(value)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export attendance records to CSV or Parquet.")
+    parser.add_argument("db_path", help="Path to the attendance database.")
+    parser.add_argument("output_path", help="Destination file.")
+    parser.add_argument("--format", choices=["csv", "parquet"], default=None,
+                        help="Output format. Inferred from the output file extension by default.")
+    parser.add_argument("--start", type=_parse_datetime, help="Inclusive start date/time (ISO format).")
+    parser.add_argument("--end", type=_parse_datetime, help="Exclusive end date/time (ISO format).")
+    parser.add_argument("--hall", help="Only export records from this hall.")
+    parser.add_argument("--student-id", help="Only export records of this student.")
+    parser.add_argument("--chunk-size", type=int, default=5000, help="Rows fetched per chunk.")
+    args = parser.parse_args(argv)
+
+    file_format = args.format or ("parquet" if args.output_path.endswith(".parquet") else "csv")
+
+    db_manager = DatabaseManager(args.db_path)
+    try:
+        export_attendance(
+            db_manager, args.output_path, file_format,
+            start=args.start, end=args.end, hall=args.hall,
+            student_id=args.student_id, chunk_size=args.chunk_size
+        )
+    finally:
+        db_manager.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -0,0 +1,41 @@
+from typing import List, Sequence
+
+import numpy as np
+
+from .db_models import StudentMatch, StudentRow
+
+
+class GalleryIndex:
+    """
+    An in-memory, brute-force index over part of the student gallery, e.g. the
+    students enrolled in one hall or course.
+
+    A scope of a few hundred students is searched with one matrix-vector
+    product, which is far cheaper than a KNN query over the whole
+    `vec_students` table. Similarities match `vec_students`' L2 distance
+    conversion, `1 - distance ** 2 / 2`.
+    """
+    def __init__(self, rows: Sequence[StudentRow], embeddings: np.ndarray):
+        self.rows = list(rows)
+        self.embeddings = np.asarray(embeddings, dtype=np.float32)
+        self._squared_norms = np.einsum("ij,ij->i", self.embeddings, self.embeddings)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def search(self, query_embedding: np.ndarray, k: int = 5, include_embeddings: bool = False) -> List[StudentMatch]:
+        """Returns the `k` students closest to the query, most similar first."""
+        if not self.rows or k <= 0:
+            return []
+
+        query = np.asarray(query_embedding, dtype=np.float32).reshape(-1)
+        squared_distances = self._squared_norms + np.dot(query, query) - 2 * (self.embeddings @ query)
+        similarities = 1 - np.maximum(squared_distances, 0) / 2
+
+        k = min(k, len(self.rows))
+        nearest = np.argpartition(-similarities, k - 1)[:k]
+        nearest = nearest[np.argsort(-similarities[nearest], kind="stable")]
+        return [
+            StudentMatch(*self.rows[i], float(similarities[i]), self.embeddings[i] if include_embeddings else None)
+            for i in nearest
+        ]
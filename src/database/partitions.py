@@ -0,0 +1,39 @@
+from datetime import datetime
+from typing import Literal, NamedTuple
+
+
+PartitionScheme = Literal["month", "term"]
+
+
+class Partition(NamedTuple):
+    """A time range of attendance records stored in its own database file"""
+
+    key: str
+    start: datetime
+    end: datetime
+
+
+def partition_for(moment: datetime, scheme: PartitionScheme = "month") -> Partition:
+    """
+    Returns the partition a timestamp falls into.
+
+    Month partitions are calendar months keyed `YYYY_MM`. Term partitions follow
+    the academic calendar: fall (Sep-Jan), spring (Feb-Jun) and summer (Jul-Aug),
+    keyed by the year the term starts in, e.g. `2025_fall`.
+    """
+    if scheme == "month":
+        start = datetime(moment.year, moment.month, 1)
+        end = datetime(moment.year + moment.month // 12, moment.month % 12 + 1, 1)
+        return Partition(f"{start.year:04d}_{start.month:02d}", start, end)
+
+    if scheme == "term":
+        year, month = moment.year, moment.month
+        if month >= 9:
+            return Partition(f"{year:04d}_fall", datetime(year, 9, 1), datetime(year + 1, 2, 1))
+        if month == 1:
+            return Partition(f"{year - 1:04d}_fall", datetime(year - 1, 9, 1), datetime(year, 2, 1))
+        if month <= 6:
+            return Partition(f"{year:04d}_spring", datetime(year, 2, 1), datetime(year, 7, 1))
+        return Partition(f"{year:04d}_summer", datetime(year, 7, 1), datetime(year, 9, 1))
+
+    raise ValueError(f"Invalid partition scheme '{scheme}'. Must be one of ['month', 'term']")
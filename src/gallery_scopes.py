@@ -0,0 +1,56 @@
+"""
+Manages which students are enrolled in which hall or course. A camera with
+`recognition.scope` set only searches the students of its scope.
+
+Run from the repository root:
+    python src/gallery_scopes.py list
+    python src/gallery_scopes.py add "Hall B" S001 S002
+    python src/gallery_scopes.py add CS101 --file cs101_students.txt
+    python src/gallery_scopes.py remove "Hall B" S002
+"""
+import argparse
+import logging
+
+from database.database_manager import DatabaseManager
+
+
+def read_student_ids(path: str) -> list[str]:
+    """Reads one student ID per line, ignoring blank lines and a trailing CSV column."""
+    with open(path, "r", encoding="utf-8") as f:
+        return [line.split(",")[0].strip() for line in f if line.strip()]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db", default="data/attendance.db", help="Database with the enrolled gallery.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("list", help="List the scopes and how many students each has.")
+    for command, help_text in (("add", "Enroll students in a scope."), ("remove", "Remove students from a scope.")):
+        command_parser = subparsers.add_parser(command, help=help_text)
+        command_parser.add_argument("scope", help="Hall or course name.")
+        command_parser.add_argument("student_ids", nargs="*", help="Student IDs.")
+        command_parser.add_argument("--file", default=None, help="File with one student ID per line.")
+    args = parser.parse_args(argv)
+
+    db_manager = DatabaseManager(args.db)
+    try:
+        if args.command == "list":
+            for scope, students in db_manager.list_scopes():
+                print(f"{scope}\t{students}")
+            return
+
+        student_ids = list(args.student_ids) + (read_student_ids(args.file) if args.file else [])
+        if not student_ids:
+            parser.error("No student IDs given.")
+        if args.command == "add":
+            print(f"Added {db_manager.add_students_to_scope(args.scope, student_ids)} students to '{args.scope}'.")
+        else:
+            print(f"Removed {db_manager.remove_students_from_scope(args.scope, student_ids)} students from '{args.scope}'.")
+    finally:
+        db_manager.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -1,17 +1,29 @@
+from utils import startup_timing
+
 from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QTimer
 from views.main_window import MainWindow
 
+from utils.config import load_config
 from utils.logs import setup_logging
 
 
+import argparse
 import sys
 from logging import getLogger
 
 setup_logging()
 logger = getLogger(__name__)
+startup_timing.mark("modules imported")
 
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
+    parser = argparse.ArgumentParser(description="Face recognition attendance.")
+    parser.add_argument("--connect", nargs="?", const=load_config().daemon.socket_path, default=None, metavar="SOCKET",
+                        help="Show the feed of a running recognition daemon instead of capturing locally.")
+    args, qt_args = parser.parse_known_args()
+
+    app = QApplication(sys.argv[:1] + qt_args)
+    startup_timing.mark("QApplication created")
 
     try:
         with open("src/ui/resources/style.qss", "r") as f:
@@ -21,8 +33,10 @@ if __name__ == "__main__":
         logger.warning("Stylesheet not found. Please create a 'style.qss' file.")
 
     try:
-        window = MainWindow()
+        window = MainWindow(daemon_socket=args.connect)
         window.show()
+        startup_timing.mark("main window constructed")
+        QTimer.singleShot(0, lambda: startup_timing.mark("first window shown"))
         sys.exit(app.exec())
     except Exception as e:
         logger.error(f"Caught Error: {e}")
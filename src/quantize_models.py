@@ -0,0 +1,79 @@
+"""
+Builds and checks the int8 variants of the InsightFace model pack.
+
+Run from the repository root:
+    python src/quantize_models.py quantize
+    python src/quantize_models.py check --db data/attendance.db --output quantization.json
+
+Set `models.quantized: true` in the deployment config to load the variants.
+"""
+import argparse
+import json
+import logging
+
+from database.database_manager import DatabaseManager
+from utils.config import load_config
+from vision.quantization import check_quantized_pack, quantize_model_pack
+
+
+def enrolled_image_paths(db_path: str, page_size: int = 500) -> list[str]:
+    db_manager = DatabaseManager(db_path)
+    try:
+        image_paths, page = [], 1
+        while rows := db_manager.get_student_rows(order_by="student_id", page=page, page_size=page_size):
+            image_paths.extend(row.student_image_path for row in rows)
+            page += 1
+        return image_paths
+    finally:
+        db_manager.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--config", default=None, help="Deployment config file, defaults to config.yaml")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    quantize_parser = subparsers.add_parser("quantize", help="Write int8 variants next to the model pack.")
+    quantize_parser.add_argument("--models", nargs="*", help="ONNX file names to quantize, all by default.")
+    quantize_parser.add_argument("--per-channel", action="store_true", help="Quantize weights per channel.")
+
+    check_parser = subparsers.add_parser("check", help="Compare the int8 variants with the float models.")
+    check_parser.add_argument("--db", default="data/attendance.db", help="Database with the enrolled gallery.")
+    check_parser.add_argument("--output", default=None, help="Write the report as JSON to this file.")
+    args = parser.parse_args(argv)
+
+    config = load_config(args.config)
+    models = config.models
+
+    if args.command == "quantize":
+        output_dir = quantize_model_pack(models.name, models.root, models=args.models, per_channel=args.per_channel)
+        print(f"Quantized models written to {output_dir}")
+        return
+
+    image_paths = enrolled_image_paths(args.db)
+    if not image_paths:
+        parser.error(f"No enrolled students in {args.db}")
+
+    report = check_quantized_pack(image_paths, models.name, models.root, config.onnxruntime, models.det_size)
+    print(f"Faces compared:        {report.faces}")
+    print(f"Cosine agreement:      mean {report.cosine_mean:.4f}, min {report.cosine_min:.4f}")
+    print(f"Top-1 on the gallery:  {report.top1_quantized * 100:.1f}%")
+    print(f"Detection agreement:   {report.detection_agreement * 100:.1f}%")
+    print(f"Detection:             {report.detection_ms_float:.1f} ms -> {report.detection_ms_quantized:.1f} ms "
+          f"({report.detection_speedup:.2f}x)")
+    print(f"Recognition per face:  {report.recognition_ms_float:.1f} ms -> {report.recognition_ms_quantized:.1f} ms "
+          f"({report.recognition_speedup:.2f}x)")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({
+                **report._asdict(),
+                "detection_speedup": report.detection_speedup,
+                "recognition_speedup": report.recognition_speedup,
+                "session_config": config.onnxruntime.model_dump(),
+            }, f, indent=2)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -0,0 +1,87 @@
+"""
+Records a camera, stream or video file to a `.frames` recording, so the same
+session can be replayed into the pipeline for benchmarks and local testing
+(`--source` of the daemon or `capture.source`, and `benchmarks.suite --frames`).
+
+Frames are stored raw by default, which replays without any decoding, or as
+lossless PNG with `--compression png` at a fraction of the size.
+
+Run from the repository root:
+    python src/record_frames.py record recordings/hall_a.frames --seconds 120
+    python src/record_frames.py record recordings/hall_a.frames --source rtsp://10.0.0.5/hall --compression png
+    python src/record_frames.py info recordings/hall_a.frames
+"""
+import argparse
+import logging
+import os
+import signal
+import time
+
+from utils.config import load_config
+from vision.frame_recording import FrameRecorder, FrameRecording, is_recording
+from vision.frame_sources import VideoSource
+
+
+def record(args, capture_config) -> int:
+    source = VideoSource(args.source or capture_config.source, capture_config=capture_config)
+    if not source.open():
+        print(f"Could not open {source.describe()}.")
+        return 1
+
+    previous_handler = signal.signal(signal.SIGINT, lambda *_: source.stop())
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    start = time.perf_counter()
+    try:
+        with FrameRecorder(args.output, compression=args.compression, source=str(source.source)) as recorder:
+            while (not args.frames or recorder.frames_written < args.frames) and \
+                    (not args.seconds or time.perf_counter() - start < args.seconds):
+                ret, frame = source.read()
+                if not ret:
+                    break
+                recorder.write(frame, time.perf_counter() - start)
+                print(f"\r{recorder.frames_written} frames", end="", flush=True)
+    finally:
+        source.release()
+        signal.signal(signal.SIGINT, previous_handler)
+    print()
+    print(f"Recorded {recorder.frames_written} frames from {source.describe()} to {args.output}.")
+    return 0
+
+
+def info(args) -> int:
+    recording = FrameRecording(args.recording)
+    height, width, channels = recording.shape
+    size = os.path.getsize(args.recording)
+    print(f"Source:       {recording.metadata['source']}")
+    print(f"Created:      {recording.metadata['created']}")
+    print(f"Frames:       {len(recording)} of {width}x{height}x{channels}, {recording.compression}")
+    print(f"Duration:     {recording.duration:.1f} s ({recording.fps:.1f} FPS)")
+    print(f"Size:         {size / 2 ** 20:.1f} MiB ({size / max(len(recording), 1) / 2 ** 10:.0f} KiB per frame)")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--config", default=None, help="Deployment config file, defaults to config.yaml")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = subparsers.add_parser("record", help="Record a source until it ends, a limit, or Ctrl+C.")
+    record_parser.add_argument("output", help="Recording to write, ending in .frames.")
+    record_parser.add_argument("--source", default=None, help="Camera index, stream URL or video file, overrides capture.source.")
+    record_parser.add_argument("--compression", choices=["none", "png"], default="none", help="How frames are stored.")
+    record_parser.add_argument("--seconds", type=float, default=None, help="Stop after this many seconds.")
+    record_parser.add_argument("--frames", type=int, default=None, help="Stop after this many frames.")
+    info_parser = subparsers.add_parser("info", help="Describe a recording.")
+    info_parser.add_argument("recording")
+    args = parser.parse_args(argv)
+
+    if args.command == "info":
+        return info(args)
+    if not is_recording(args.output):
+        parser.error("The recording's name must end in .frames to be recognized as a source.")
+    return record(args, load_config(args.config).capture)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    raise SystemExit(main())
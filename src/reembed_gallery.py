@@ -0,0 +1,76 @@
+"""
+Re-embeds the student gallery after switching the model pack or its int8
+variants, which makes the stored vectors incomparable with the new model's.
+
+The job runs in worker processes, checkpoints every batch and resumes when run
+again. The live gallery is only replaced, atomically, once every student has a
+new vector. Stop the daemon or GUI first, or restart them afterwards, so they
+load the new model.
+
+Run from the repository root, after updating the `models` section:
+    python src/reembed_gallery.py run --workers 4
+    python src/reembed_gallery.py status
+    python src/reembed_gallery.py discard
+"""
+import argparse
+import logging
+
+from database.database_manager import DatabaseManager
+from utils.config import load_config
+from vision.reembedding import GalleryEmbedder, reembed_gallery
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--config", default=None, help="Deployment config file, defaults to config.yaml")
+    parser.add_argument("--db", default="data/attendance.db", help="Database with the enrolled gallery.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Start or resume re-embedding with the configured models.")
+    run_parser.add_argument("--workers", type=int, default=None, help="Worker processes, defaults to the CPU count.")
+    run_parser.add_argument("--batch-size", type=int, default=16, help="Photos per worker task.")
+    run_parser.add_argument("--retry-failed", action="store_true", help="Retry photos that failed before.")
+    run_parser.add_argument("--no-swap", action="store_true", help="Only build the new vectors, don't swap them in.")
+    subparsers.add_parser("status", help="Show the gallery's model and the job's progress.")
+    subparsers.add_parser("discard", help="Drop an unfinished job.")
+    args = parser.parse_args(argv)
+
+    config = load_config(args.config)
+    db_manager = DatabaseManager(args.db)
+    try:
+        if args.command == "discard":
+            db_manager.discard_reembedding()
+            print("Re-embedding job discarded.")
+            return
+
+        if args.command == "status":
+            job = db_manager.reembedding_job()
+            students, done, failed = db_manager.reembedding_progress()
+            print(f"Gallery models:  {db_manager.gallery_models() or ['untagged']}")
+            print(f"Configured:      {config.models.embedding_model}")
+            if job:
+                print(f"Job:             '{job[0]}' since {job[1]}, {done}/{students} done, {failed} failed")
+            return
+
+        # Each worker process runs its own sessions, so one intra-op thread each avoids oversubscription
+        session_config = config.onnxruntime.model_copy(update={"intra_op_num_threads": 1, "inter_op_num_threads": 1})
+        embedder = GalleryEmbedder(config.models, session_config)
+        report = reembed_gallery(
+            db_manager, embedder, embedder.embedding_model, workers=args.workers, batch_size=args.batch_size,
+            swap=not args.no_swap, retry_failed=args.retry_failed,
+            on_progress=lambda processed, total: print(f"\r{processed}/{total} students", end="", flush=True)
+        )
+        print()
+        print(f"Re-embedded {report.embedded} students in {report.seconds:.1f} s "
+              f"({report.resumed} from an earlier run, {report.failed} failed).")
+        for student_id, image_path, error in db_manager.reembedding_failures():
+            print(f"  {student_id}  {image_path}: {error}")
+        if report.swapped:
+            print(f"The gallery now uses '{report.embedding_model}'.")
+    finally:
+        db_manager.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -0,0 +1,97 @@
+import socket
+from typing import Iterator, Optional
+
+import numpy as np
+
+from vision.frame_result import FrameResult
+from .protocol import MAX_LINE_BYTES, decode_frame, decode_message, encode_message
+
+
+class DaemonError(Exception):
+    """The daemon could not be reached or rejected a request"""
+
+
+class DaemonClient:
+    """
+    A client of the recognition daemon's local API (see `service.protocol`).
+
+    Each client holds one connection, opened on first use. It is not safe to
+    share between threads; `subscribe` opens a connection of its own.
+    """
+    def __init__(self, socket_path: str, timeout: float = 10.0):
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._sock = None
+        self._reader = None
+
+    def request(self, command: str, **params) -> dict:
+        """Sends one command and returns the daemon's reply, raising `DaemonError` if it failed."""
+        if self._sock is None:
+            self._sock, self._reader = self._connect(self.timeout)
+        try:
+            self._sock.sendall(encode_message({"cmd": command, **params}))
+            reply = decode_message(self._reader.readline(MAX_LINE_BYTES))
+        except OSError as e:
+            self.close()
+            raise DaemonError(f"Lost connection to the daemon: {e}") from e
+        if reply is None:
+            self.close()
+            raise DaemonError("The daemon closed the connection.")
+        if not reply.get("ok"):
+            raise DaemonError(reply.get("error", "Request failed."))
+        return reply
+
+    def status(self) -> dict:
+        return self.request("status")
+
+    def start(self) -> bool:
+        return self.request("start")["started"]
+
+    def stop(self):
+        self.request("stop")
+
+    def shutdown(self):
+        self.request("shutdown")
+        self.close()
+
+    def latest_frame(self, after: int = 0, timeout: float = 1.0) -> Optional[tuple[int, np.ndarray, FrameResult]]:
+        """
+        Waits up to `timeout` seconds for a frame newer than sequence `after`.
+
+        Returns:
+            (sequence, BGR frame, its `FrameResult`), or None.
+        """
+        reply = self.request("frame", after=after, timeout=timeout)
+        if reply["sequence"] is None:
+            return None
+        return reply["sequence"], decode_frame(reply["jpeg"]), FrameResult.from_message(reply["faces"])
+
+    def subscribe(self) -> Iterator[dict]:
+        """Yields recognition events (and idle heartbeats) until the daemon stops or the iterator is closed."""
+        sock, reader = self._connect(timeout=None)
+        try:
+            sock.sendall(encode_message({"cmd": "subscribe"}))
+            reply = decode_message(reader.readline(MAX_LINE_BYTES))
+            if not reply or not reply.get("ok"):
+                raise DaemonError("Subscription was refused.")
+            while (event := decode_message(reader.readline(MAX_LINE_BYTES))) is not None:
+                yield event
+        finally:
+            reader.close()
+            sock.close()
+
+    def close(self):
+        if self._sock is not None:
+            self._reader.close()
+            self._sock.close()
+            self._sock, self._reader = None, None
+
+    def _connect(self, timeout: Optional[float]):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(timeout)
+        try:
+            sock.connect(self.socket_path)
+        except OSError as e:
+            sock.close()
+            raise DaemonError(f"Could not connect to the daemon at {self.socket_path}: {e}") from e
+        return sock, sock.makefile("rb")
@@ -0,0 +1,126 @@
+import os
+import queue
+import socketserver
+import threading
+
+from .protocol import MAX_LINE_BYTES, decode_message, encode_frame, encode_message
+from .recognition_service import RecognitionService
+
+from logging import getLogger
+
+
+logger = getLogger(__name__)
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Serves one client connection, one request per line (see `service.protocol`)."""
+
+    def handle(self):
+        while True:
+            try:
+                line = self.rfile.readline(MAX_LINE_BYTES)
+                message = decode_message(line)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Dropping client after a bad request: {e}")
+                return
+            if message is None:
+                return
+
+            command = message.get("cmd")
+            handler = getattr(self, f"_cmd_{command}", None)
+            if handler is None:
+                self._send({"ok": False, "error": f"Unknown command: {command}"})
+                continue
+            try:
+                keep_open = handler(message)
+            except (BrokenPipeError, ConnectionResetError):
+                return
+            except Exception as e:
+                logger.error(f"Command '{command}' failed: {e}")
+                self._send({"ok": False, "error": str(e)})
+                continue
+            if keep_open is False:
+                return
+
+    def _send(self, message: dict):
+        self.wfile.write(encode_message(message))
+        self.wfile.flush()
+
+    def _cmd_status(self, message: dict):
+        self._send({"ok": True, **self.server.service.status()})
+
+    def _cmd_start(self, message: dict):
+        if not self.server.service.face_analyzer.app:
+            self._send({"ok": False, "error": "Models are not loaded yet."})
+            return
+        self._send({"ok": True, "started": self.server.service.start()})
+
+    def _cmd_stop(self, message: dict):
+        self.server.service.stop()
+        self._send({"ok": True})
+
+    def _cmd_frame(self, message: dict):
+        latest = self.server.service.latest_frame(int(message.get("after", 0)), float(message.get("timeout", 1.0)))
+        if latest is None:
+            self._send({"ok": True, "sequence": None})
+            return
+        sequence, frame, result = latest
+        self._send({
+            "ok": True,
+            "sequence": sequence,
+            "jpeg": encode_frame(frame, int(message.get("quality", 80))),
+            "faces": result.to_message(),
+        })
+
+    def _cmd_subscribe(self, message: dict):
+        service = self.server.service
+        events = service.subscribe()
+        try:
+            self._send({"ok": True})
+            while not self.server.is_shutting_down:
+                try:
+                    event = events.get(timeout=self.server.heartbeat_interval)
+                except queue.Empty:
+                    # Also detects clients that went away while nothing happened
+                    event = {"type": "heartbeat"}
+                self._send(event)
+        finally:
+            service.unsubscribe(events)
+        return False
+
+    def _cmd_shutdown(self, message: dict):
+        self._send({"ok": True})
+        self.server.request_shutdown()
+        return False
+
+
+class IpcServer(socketserver.ThreadingUnixStreamServer):
+    """
+    The daemon's local API on a Unix socket, one thread per client.
+
+    The socket file is replaced if it exists and only accessible to the
+    owner and group. `serve_forever` returns after a "shutdown" request or `request_shutdown`.
+    """
+    daemon_threads = True
+
+    def __init__(self, service: RecognitionService, socket_path: str, heartbeat_interval: float = 5.0):
+        self.service = service
+        self.socket_path = socket_path
+        self.heartbeat_interval = heartbeat_interval
+        self.is_shutting_down = False
+
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        os.makedirs(os.path.dirname(os.path.abspath(socket_path)), exist_ok=True)
+        super().__init__(socket_path, _RequestHandler)
+        os.chmod(socket_path, 0o660)
+
+    def request_shutdown(self):
+        """Makes `serve_forever` return. Can be called from any thread, including a handler."""
+        self.is_shutting_down = True
+        threading.Thread(target=self.shutdown, daemon=True).start()
+
+    def server_close(self):
+        super().server_close()
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
@@ -0,0 +1,51 @@
+"""
+The daemon's local API: newline-delimited JSON over a Unix stream socket.
+
+Every request is one JSON object with a "cmd" key, answered by one JSON
+object with "ok" (and "error" when false):
+
+    {"cmd": "status"}                              -> pipeline status and stage latencies
+    {"cmd": "start"} / {"cmd": "stop"}             -> start or stop capturing
+    {"cmd": "frame", "after": 0, "timeout": 1.0}   -> the newest frame after sequence `after`,
+                                                      as base64 JPEG with its faces as
+                                                      `FrameResult.to_message` columns
+    {"cmd": "subscribe"}                           -> {"ok": true}, then one "recognitions" or
+                                                      "identity" event per line until the
+                                                      client disconnects
+    {"cmd": "shutdown"}                            -> stops the daemon
+"""
+import base64
+import json
+from typing import Optional
+
+import numpy as np
+
+
+MAX_LINE_BYTES = 64 * 1024 * 1024
+
+
+def encode_message(message: dict) -> bytes:
+    return json.dumps(message, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def decode_message(line: bytes) -> Optional[dict]:
+    """Returns the message in a received line, or None if the connection was closed."""
+    if not line:
+        return None
+    return json.loads(line)
+
+
+def encode_frame(frame: np.ndarray, quality: int = 80) -> str:
+    import cv2
+
+    ok, buffer = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, quality])
+    if not ok:
+        raise ValueError("Frame could not be encoded.")
+    return base64.b64encode(buffer.tobytes()).decode("ascii")
+
+
+def decode_frame(data: str) -> np.ndarray:
+    import cv2
+
+    buffer = np.frombuffer(base64.b64decode(data), dtype=np.uint8)
+    return cv2.imdecode(buffer, cv2.IMREAD_COLOR)
@@ -0,0 +1,180 @@
+import queue
+import threading
+import time
+from typing import Optional
+
+import numpy as np
+
+from database.database_manager import DatabaseManager, GalleryModelError
+from vision.face_analyzer import FaceAnalyzer
+from vision.frame_sources import VideoSource
+from vision.pipeline import RecognitionPipeline
+from vision.track_fusion import TrackFusion, TrackIdentity
+from utils.config import RecognitionConfig
+from utils.latency import LatencyMetrics
+
+from logging import getLogger
+
+
+logger = getLogger(__name__)
+
+
+class RecognitionService:
+    """
+    Runs the recognition pipeline on a background thread and identifies the
+    tracked faces against the student gallery, for the headless daemon.
+
+    Tracks are identified by `TrackFusion`: the embeddings of faces that
+    passed the quality gate are fused per track and the gallery is searched
+    only when the fused embedding is stable or the track ends. Each committed
+    identity produces an "identity" event, and every frame with faces (and the
+    first one after they leave) a "recognitions" event, both delivered to
+    each subscriber's bounded queue. A subscriber that falls behind loses its
+    oldest events rather than stalling the pipeline.
+    """
+    def __init__(self, face_analyzer: FaceAnalyzer, db_manager: DatabaseManager, source: VideoSource,
+                 recognition_config: RecognitionConfig = None, metrics: LatencyMetrics = None,
+                 max_queued_events: int = 256):
+        self.face_analyzer = face_analyzer
+        self.db_manager = db_manager
+        self.fusion = TrackFusion(self._search, recognition_config)
+        self.max_queued_events = max_queued_events
+        self.metrics = metrics or LatencyMetrics("daemon", enabled=False)
+        self.pipeline = RecognitionPipeline(face_analyzer, source, metrics=self.metrics, on_faces=self._identify)
+
+        self.started_at = time.time()
+        self.last_error = None
+
+        self._thread = None
+        self._subscribers = []
+        self._subscribers_lock = threading.Lock()
+        self._had_faces = False
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> bool:
+        """
+        Starts capturing on a background thread. Returns False if it was already running.
+
+        Raises:
+            GalleryModelError: The gallery was embedded with another model than the loaded one.
+        """
+        if self.is_running:
+            return False
+        if self.face_analyzer.embedding_model:
+            try:
+                self.db_manager.check_gallery_model(self.face_analyzer.embedding_model)
+            except GalleryModelError as e:
+                self.last_error = str(e)
+                raise
+        self.last_error = None
+        self._thread = threading.Thread(target=self._run, name="recognition-pipeline", daemon=True)
+        self._thread.start()
+        return True
+
+    def stop(self, timeout: float = 5.0):
+        """Stops capturing and waits for the pipeline thread to finish."""
+        self.pipeline.stop()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Waits for the pipeline to end, e.g. at the end of a video file. Returns True if it has."""
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return not self.is_running
+
+    def status(self) -> dict:
+        pipeline = self.pipeline
+        with self._subscribers_lock:
+            subscribers = len(self._subscribers)
+        return {
+            "running": self.is_running,
+            "source": pipeline.source.describe(),
+            "models_loaded": self.face_analyzer.app is not None,
+            "frames_processed": pipeline.frames_processed,
+            "faces_in_view": pipeline.faces_in_view,
+            "identified_tracks": self.fusion.committed_tracks,
+            "gallery_searches": self.fusion.searches,
+            "subscribers": subscribers,
+            "uptime": time.time() - self.started_at,
+            "last_error": self.last_error,
+            "latency": [summary._asdict() for summary in self.metrics.summaries()],
+        }
+
+    def subscribe(self) -> queue.Queue:
+        """Returns a queue receiving every following recognition event. Call `unsubscribe` when done."""
+        events = queue.Queue(maxsize=self.max_queued_events)
+        with self._subscribers_lock:
+            self._subscribers.append(events)
+        return events
+
+    def unsubscribe(self, events: queue.Queue):
+        with self._subscribers_lock:
+            if events in self._subscribers:
+                self._subscribers.remove(events)
+
+    def latest_frame(self, after: int = 0, timeout: float = 1.0):
+        """Returns (sequence, frame, result) of a frame newer than `after`, or None on timeout."""
+        return self.pipeline.wait_for_frame(after, timeout)
+
+    def _run(self):
+        logger.info(f"Recognition pipeline started on {self.pipeline.source.describe()}.")
+        self.last_error = self.pipeline.run()
+        self._broadcast_identities(self.fusion.finish(self.pipeline.frames_processed), self.pipeline.frames_processed)
+        if self.last_error:
+            logger.error(self.last_error)
+        logger.info("Recognition pipeline stopped.")
+
+    def _identify(self, frame: np.ndarray, faces: list):
+        frame_number = self.pipeline.frames_processed
+        with self.metrics.time("fusion"):
+            committed = self.fusion.update(frame_number, faces)
+        self._broadcast_identities(committed, frame_number)
+
+        if faces or self._had_faces:
+            self._broadcast({
+                "type": "recognitions",
+                "frame": frame_number,
+                "time": time.time(),
+                "faces": [
+                    {
+                        "track_id": face.track_id,
+                        "bbox": [float(v) for v in face.bbox],
+                        "det_score": float(face.det_score),
+                        "quality": getattr(face, "quality", None),
+                        "student_id": getattr(face, "student_id", None),
+                        "student_name": getattr(face, "student_name", None),
+                        "similarity": getattr(face, "similarity", None),
+                    }
+                    for face in faces
+                ],
+            })
+        self._had_faces = bool(faces)
+
+    def _search(self, embedding: np.ndarray):
+        with self.metrics.time("search"):
+            matches = self.db_manager.find_similar_student_rows(embedding, k=1, scope=self.fusion.config.scope)
+        return matches[0] if matches else None
+
+    def _broadcast_identities(self, identities: list[TrackIdentity], frame_number: int):
+        for identity in identities:
+            logger.info(f"Track {identity.track_id} identified as {identity.student_id or 'unknown'} "
+                        f"({identity.votes}/{identity.searches} votes over {identity.samples} faces)")
+            self._broadcast({"type": "identity", "frame": frame_number, "time": time.time(), **identity._asdict()})
+
+    def _broadcast(self, event: dict):
+        with self._subscribers_lock:
+            subscribers = list(self._subscribers)
+        for events in subscribers:
+            while True:
+                try:
+                    events.put_nowait(event)
+                    break
+                except queue.Full:
+                    try:
+                        events.get_nowait()
+                    except queue.Empty:
+                        pass
@@ -0,0 +1,78 @@
+# Form implementation generated from reading ui file 'src/ui/attendance_dialog.ui'
+#
+# Created by: PyQt6 UI code generator 6.9.1
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_attendance_dialog(object):
+    def setupUi(self, attendance_dialog):
+        attendance_dialog.setObjectName("attendance_dialog")
+        attendance_dialog.resize(1000, 640)
+        self.verticalLayout = QtWidgets.QVBoxLayout(attendance_dialog)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.filter_layout = QtWidgets.QHBoxLayout()
+        self.filter_layout.setObjectName("filter_layout")
+        self.student_filter_label = QtWidgets.QLabel(parent=attendance_dialog)
+        self.student_filter_label.setObjectName("student_filter_label")
+        self.filter_layout.addWidget(self.student_filter_label)
+        self.student_filter_input = QtWidgets.QLineEdit(parent=attendance_dialog)
+        self.student_filter_input.setObjectName("student_filter_input")
+        self.filter_layout.addWidget(self.student_filter_input)
+        self.hall_filter_label = QtWidgets.QLabel(parent=attendance_dialog)
+        self.hall_filter_label.setObjectName("hall_filter_label")
+        self.filter_layout.addWidget(self.hall_filter_label)
+        self.hall_filter_input = QtWidgets.QLineEdit(parent=attendance_dialog)
+        self.hall_filter_input.setObjectName("hall_filter_input")
+        self.filter_layout.addWidget(self.hall_filter_input)
+        self.date_filter_check = QtWidgets.QCheckBox(parent=attendance_dialog)
+        self.date_filter_check.setObjectName("date_filter_check")
+        self.filter_layout.addWidget(self.date_filter_check)
+        self.start_date_input = QtWidgets.QDateEdit(parent=attendance_dialog)
+        self.start_date_input.setCalendarPopup(True)
+        self.start_date_input.setObjectName("start_date_input")
+        self.filter_layout.addWidget(self.start_date_input)
+        self.end_date_label = QtWidgets.QLabel(parent=attendance_dialog)
+        self.end_date_label.setObjectName("end_date_label")
+        self.filter_layout.addWidget(self.end_date_label)
+        self.end_date_input = QtWidgets.QDateEdit(parent=attendance_dialog)
+        self.end_date_input.setCalendarPopup(True)
+        self.end_date_input.setObjectName("end_date_input")
+        self.filter_layout.addWidget(self.end_date_input)
+        self.apply_filter_button = QtWidgets.QPushButton(parent=attendance_dialog)
+        self.apply_filter_button.setObjectName("apply_filter_button")
+        self.filter_layout.addWidget(self.apply_filter_button)
+        self.verticalLayout.addLayout(self.filter_layout)
+        self.attendance_table = QtWidgets.QTableView(parent=attendance_dialog)
+        self.attendance_table.setSortingEnabled(True)
+        self.attendance_table.setAlternatingRowColors(True)
+        self.attendance_table.setObjectName("attendance_table")
+        self.verticalLayout.addWidget(self.attendance_table)
+        self.footer_layout = QtWidgets.QHBoxLayout()
+        self.footer_layout.setObjectName("footer_layout")
+        self.row_count_label = QtWidgets.QLabel(parent=attendance_dialog)
+        self.row_count_label.setText("")
+        self.row_count_label.setObjectName("row_count_label")
+        self.footer_layout.addWidget(self.row_count_label)
+        self.buttonBox = QtWidgets.QDialogButtonBox(parent=attendance_dialog)
+        self.buttonBox.setOrientation(QtCore.Qt.Orientation.Horizontal)
+        self.buttonBox.setStandardButtons(QtWidgets.QDialogButtonBox.StandardButton.Close)
+        self.buttonBox.setObjectName("buttonBox")
+        self.footer_layout.addWidget(self.buttonBox)
+        self.verticalLayout.addLayout(self.footer_layout)
+
+        self.retranslateUi(attendance_dialog)
+        QtCore.QMetaObject.connectSlotsByName(attendance_dialog)
+
+    def retranslateUi(self, attendance_dialog):
+        _translate = QtCore.QCoreApplication.translate
+        attendance_dialog.setWindowTitle(_translate("attendance_dialog", "Attendance Records"))
+        self.student_filter_label.setText(_translate("attendance_dialog", "Student ID: "))
+        self.hall_filter_label.setText(_translate("attendance_dialog", "Hall: "))
+        self.date_filter_check.setText(_translate("attendance_dialog", "From"))
+        self.end_date_label.setText(_translate("attendance_dialog", "To"))
+        self.apply_filter_button.setText(_translate("attendance_dialog", "Apply"))
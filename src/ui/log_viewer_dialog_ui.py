@@ -0,0 +1,57 @@
+# Form implementation generated from reading ui file 'src/ui/log_viewer_dialog.ui'
+#
+# Created by: PyQt6 UI code generator 6.9.1
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_log_viewer_dialog(object):
+    def setupUi(self, log_viewer_dialog):
+        log_viewer_dialog.setObjectName("log_viewer_dialog")
+        log_viewer_dialog.resize(1000, 600)
+        self.verticalLayout = QtWidgets.QVBoxLayout(log_viewer_dialog)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.filter_layout = QtWidgets.QHBoxLayout()
+        self.filter_layout.setObjectName("filter_layout")
+        self.level_filter_label = QtWidgets.QLabel(parent=log_viewer_dialog)
+        self.level_filter_label.setObjectName("level_filter_label")
+        self.filter_layout.addWidget(self.level_filter_label)
+        self.level_filter_input = QtWidgets.QComboBox(parent=log_viewer_dialog)
+        self.level_filter_input.setObjectName("level_filter_input")
+        self.filter_layout.addWidget(self.level_filter_input)
+        self.logger_filter_label = QtWidgets.QLabel(parent=log_viewer_dialog)
+        self.logger_filter_label.setObjectName("logger_filter_label")
+        self.filter_layout.addWidget(self.logger_filter_label)
+        self.logger_filter_input = QtWidgets.QLineEdit(parent=log_viewer_dialog)
+        self.logger_filter_input.setObjectName("logger_filter_input")
+        self.filter_layout.addWidget(self.logger_filter_input)
+        self.follow_check = QtWidgets.QCheckBox(parent=log_viewer_dialog)
+        self.follow_check.setChecked(True)
+        self.follow_check.setObjectName("follow_check")
+        self.filter_layout.addWidget(self.follow_check)
+        self.verticalLayout.addLayout(self.filter_layout)
+        self.log_output = QtWidgets.QPlainTextEdit(parent=log_viewer_dialog)
+        self.log_output.setLineWrapMode(QtWidgets.QPlainTextEdit.LineWrapMode.NoWrap)
+        self.log_output.setReadOnly(True)
+        self.log_output.setObjectName("log_output")
+        self.verticalLayout.addWidget(self.log_output)
+        self.buttonBox = QtWidgets.QDialogButtonBox(parent=log_viewer_dialog)
+        self.buttonBox.setOrientation(QtCore.Qt.Orientation.Horizontal)
+        self.buttonBox.setStandardButtons(QtWidgets.QDialogButtonBox.StandardButton.Close)
+        self.buttonBox.setObjectName("buttonBox")
+        self.verticalLayout.addWidget(self.buttonBox)
+
+        self.retranslateUi(log_viewer_dialog)
+        QtCore.QMetaObject.connectSlotsByName(log_viewer_dialog)
+
+    def retranslateUi(self, log_viewer_dialog):
+        _translate = QtCore.QCoreApplication.translate
+        log_viewer_dialog.setWindowTitle(_translate("log_viewer_dialog", "Application Logs"))
+        self.level_filter_label.setText(_translate("log_viewer_dialog", "Level: "))
+        self.logger_filter_label.setText(_translate("log_viewer_dialog", "Logger: "))
+        self.logger_filter_input.setPlaceholderText(_translate("log_viewer_dialog", "e.g. vision"))
+        self.follow_check.setText(_translate("log_viewer_dialog", "Follow"))
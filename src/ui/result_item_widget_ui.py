@@ -1,57 +0,0 @@
-# Form implementation generated from reading ui file 'src/ui/result_item_widget.ui'
-#
-# Created by: PyQt6 UI code generator 6.9.1
-#
-# WARNING: Any manual changes made to this file will be lost when pyuic6 is
-# run again.  Do not edit this file unless you know what you are doing.
-
-
-from PyQt6 import QtCore, QtGui, QtWidgets
-
-
-class Ui_ResultItemWidget(object):
-    def setupUi(self, ResultItemWidget):
-        ResultItemWidget.setObjectName("ResultItemWidget")
-        ResultItemWidget.resize(342, 121)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(ResultItemWidget.sizePolicy().hasHeightForWidth())
-        ResultItemWidget.setSizePolicy(sizePolicy)
-        self.horizontalLayout = QtWidgets.QHBoxLayout(ResultItemWidget)
-        self.horizontalLayout.setObjectName("horizontalLayout")
-        self.profile_image = QtWidgets.QLabel(parent=ResultItemWidget)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.profile_image.sizePolicy().hasHeightForWidth())
-        self.profile_image.setSizePolicy(sizePolicy)
-        self.profile_image.setMinimumSize(QtCore.QSize(96, 96))
-        self.profile_image.setObjectName("profile_image")
-        self.horizontalLayout.addWidget(self.profile_image)
-        self.info_layout = QtWidgets.QVBoxLayout()
-        self.info_layout.setObjectName("info_layout")
-        self.profile_name = QtWidgets.QLabel(parent=ResultItemWidget)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Preferred)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.profile_name.sizePolicy().hasHeightForWidth())
-        self.profile_name.setSizePolicy(sizePolicy)
-        self.profile_name.setObjectName("profile_name")
-        self.info_layout.addWidget(self.profile_name)
-        self.confidance_bar = QtWidgets.QProgressBar(parent=ResultItemWidget)
-        self.confidance_bar.setProperty("value", 75)
-        self.confidance_bar.setObjectName("confidance_bar")
-        self.info_layout.addWidget(self.confidance_bar)
-        self.info_layout.setStretch(0, 3)
-        self.info_layout.setStretch(1, 1)
-        self.horizontalLayout.addLayout(self.info_layout)
-
-        self.retranslateUi(ResultItemWidget)
-        QtCore.QMetaObject.connectSlotsByName(ResultItemWidget)
-
-    def retranslateUi(self, ResultItemWidget):
-        _translate = QtCore.QCoreApplication.translate
-        ResultItemWidget.setWindowTitle(_translate("ResultItemWidget", "Form"))
-        self.profile_image.setText(_translate("ResultItemWidget", "Example Image"))
-        self.profile_name.setText(_translate("ResultItemWidget", "Example Name"))
@@ -0,0 +1,188 @@
+from pydantic import BaseModel, Field
+from typing import Dict, List, Literal, Optional
+import os
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+CONFIG_PATH_ENV = "ATTENDANCE_CONFIG"
+DEFAULT_CONFIG_PATH = "config.yaml"
+
+
+class OnnxRuntimeConfig(BaseModel):
+    """ONNX Runtime session settings used for every InsightFace model"""
+
+    providers: List[str] = Field(["CPUExecutionProvider"], description="Execution providers in priority order, e.g. ['CUDAExecutionProvider', 'CPUExecutionProvider'] on GPU machines")
+    provider_options: Dict[str, Dict[str, str]] = Field({}, description="Options per provider name, e.g. {'CUDAExecutionProvider': {'device_id': '0'}}")
+    intra_op_num_threads: int = Field(0, ge=0, description="Threads used inside an operator, 0 lets ONNX Runtime decide")
+    inter_op_num_threads: int = Field(0, ge=0, description="Threads used across operators in parallel mode, 0 lets ONNX Runtime decide")
+    intra_op_thread_affinities: Optional[str] = Field(None, description="Logical processor ids for intra-op threads, e.g. '1,2;3,4'")
+    allow_spinning: bool = Field(True, description="Let idle ONNX Runtime threads spin; disable to free cores for the GUI and capture threads")
+    graph_optimization_level: Literal["disable_all", "basic", "extended", "all"] = Field("extended", description="Graph optimizations applied when a model is first optimized")
+    execution_mode: Literal["sequential", "parallel"] = Field("sequential", description="Run independent graph branches sequentially or in parallel")
+    enable_cpu_mem_arena: bool = Field(True, description="Use the CPU memory arena")
+    enable_mem_pattern: bool = Field(True, description="Pre-plan memory allocations from the first run")
+
+    def build_session_options(self, cached: bool = False):
+        """
+        Creates `onnxruntime.SessionOptions` for these settings.
+
+        Args:
+            cached: The model was already optimized on disk, so graph optimizations are disabled.
+        """
+        import onnxruntime
+
+        levels = {
+            "disable_all": onnxruntime.GraphOptimizationLevel.ORT_DISABLE_ALL,
+            "basic": onnxruntime.GraphOptimizationLevel.ORT_ENABLE_BASIC,
+            "extended": onnxruntime.GraphOptimizationLevel.ORT_ENABLE_EXTENDED,
+            "all": onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL,
+        }
+
+        sess_options = onnxruntime.SessionOptions()
+        sess_options.intra_op_num_threads = self.intra_op_num_threads
+        sess_options.inter_op_num_threads = self.inter_op_num_threads
+        sess_options.execution_mode = (onnxruntime.ExecutionMode.ORT_PARALLEL if self.execution_mode == "parallel"
+                                       else onnxruntime.ExecutionMode.ORT_SEQUENTIAL)
+        sess_options.enable_cpu_mem_arena = self.enable_cpu_mem_arena
+        sess_options.enable_mem_pattern = self.enable_mem_pattern
+        sess_options.graph_optimization_level = levels["disable_all" if cached else self.graph_optimization_level]
+        sess_options.add_session_config_entry("session.intra_op.allow_spinning", "1" if self.allow_spinning else "0")
+        if self.intra_op_thread_affinities:
+            sess_options.add_session_config_entry("session.intra_op_thread_affinities", self.intra_op_thread_affinities)
+        return sess_options
+
+    def build_provider_options(self) -> List[dict]:
+        """Returns the provider options list matching `providers`."""
+        return [dict(self.provider_options.get(provider, {})) for provider in self.providers]
+
+
+class ModelConfig(BaseModel):
+    """The InsightFace model pack to load"""
+
+    name: str = Field("buffalo_l", description="Model pack name under `<root>/models`")
+    root: str = Field("./model_cache", description="InsightFace model root, downloaded into if missing")
+    det_size: int = Field(640, gt=0, description="Detector input size in pixels")
+    quantized: bool = Field(False, description="Load the int8 variants made by `quantize_models.py` where available")
+
+    @property
+    def embedding_model(self) -> str:
+        """
+        Tags the gallery embeddings this pack produces. The int8 variants are
+        tagged on their own, since their vectors drift from the float model's.
+        """
+        return f"{self.name}_int8" if self.quantized else self.name
+
+
+class CaptureConfig(BaseModel):
+    """Where frames come from and how live sources are opened"""
+
+    source: str = Field("0", description="Camera index, RTSP/HTTP stream URL, video file path or .frames recording")
+    width: int = Field(0, ge=0, description="Requested camera frame width, 0 keeps the device default")
+    height: int = Field(0, ge=0, description="Requested camera frame height, 0 keeps the device default")
+    fps: float = Field(0, ge=0, description="Requested camera frame rate, 0 keeps the device default")
+    fourcc: Optional[str] = Field("MJPG", min_length=4, max_length=4, description="Requested camera pixel format, None keeps the device default")
+    buffer_size: int = Field(1, ge=0, description="Frames the driver may buffer, 0 keeps the backend default")
+    grab_thread: bool = Field(True, description="Drain live sources on a dedicated thread so reads get the newest frame")
+    frame_buffers: int = Field(4, ge=0, description="Frame arrays reused for capture once no one holds them, 0 allocates every frame")
+    open_timeout: float = Field(5.0, gt=0, description="Seconds to wait when opening or reading a network stream")
+    reconnect: bool = Field(True, description="Reopen live sources that fail instead of stopping")
+    reconnect_delay: float = Field(0.5, gt=0, description="Seconds before the first reconnect attempt, doubled after each failure")
+    max_reconnect_delay: float = Field(10.0, gt=0, description="Longest wait between reconnect attempts")
+    max_reconnect_attempts: int = Field(0, ge=0, description="Attempts before giving up, 0 retries forever")
+
+
+class QualityConfig(BaseModel):
+    """Which detected faces are worth embedding and searching"""
+
+    enabled: bool = Field(True, description="Skip recognition for faces failing the thresholds")
+    min_face_size: float = Field(40, ge=0, description="Minimum of box width and height, in pixels")
+    min_det_score: float = Field(0.6, ge=0, le=1, description="Minimum detector score")
+    max_yaw: float = Field(0.3, gt=0, description="Maximum landmark yaw, 0 is frontal and about 0.5 a profile")
+    max_pitch: float = Field(0.3, gt=0, description="Maximum landmark pitch, 0 is frontal")
+    min_sharpness: float = Field(30, ge=0, description="Minimum variance of the Laplacian of the face crop")
+    sharpness_size: int = Field(64, ge=8, description="Side of the grayscale crop sharpness is measured on")
+
+
+class TrackingConfig(BaseModel):
+    """Following detected faces across frames"""
+
+    backend: Literal["kalman", "sort"] = Field("kalman", description="`vision.kalman_tracker` (vectorized) or the `sort_tracker` package")
+    max_age: int = Field(20, ge=0, description="Frames a track survives without a matching detection")
+    min_hits: int = Field(3, ge=0, description="Consecutive matched frames before a track is reported")
+    iou_threshold: float = Field(0.3, ge=0, le=1, description="Minimum overlap between a detection and a track's predicted box")
+
+
+class MetricsConfig(BaseModel):
+    """Per-stage latency instrumentation"""
+
+    enabled: bool = Field(True, description="Time each pipeline stage; disabled timers cost a single attribute check")
+    window: int = Field(1000, gt=0, description="Samples per stage kept for the rolling percentiles")
+    dump_path: Optional[str] = Field("data/metrics.jsonl", description="File the percentiles are appended to, None to disable")
+    dump_interval: float = Field(30.0, gt=0, description="Seconds between dumps")
+
+
+class RecognitionConfig(BaseModel):
+    """Identifying tracks from their fused embeddings (`vision.track_fusion`)"""
+
+    match_threshold: float = Field(0.45, ge=-1, le=1, description="Minimum cosine similarity to identify a student")
+    scope: Optional[str] = Field(None, description="Only search the students enrolled in this hall or course, None searches everyone")
+    min_samples: int = Field(3, ge=1, description="Embedded faces a track needs before its first gallery search")
+    max_drift: float = Field(0.02, ge=0, le=2, description="Largest cosine change of the fused embedding from the last face to count as stable")
+    research_frames: int = Field(10, ge=1, description="Frames between two gallery searches of one track")
+    max_searches: int = Field(5, ge=1, description="Gallery searches per track while it is in view, not counting the one when it ends")
+    min_votes: int = Field(2, ge=1, description="Matching searches needed to commit an identity while the track is in view")
+    track_timeout: int = Field(30, ge=1, description="Frames a track must be unseen to count as ended")
+
+
+class DaemonConfig(BaseModel):
+    """The headless recognition daemon (`src/daemon.py`)"""
+
+    socket_path: str = Field("data/attendanced.sock", description="Unix socket the local API listens on")
+    db_path: str = Field("data/attendance.db", description="Attendance database")
+    autostart: bool = Field(True, description="Start capturing as soon as the models are loaded")
+
+
+class AppConfig(BaseModel):
+    """Per-deployment settings, read from a YAML file"""
+
+    onnxruntime: OnnxRuntimeConfig = Field(default_factory=OnnxRuntimeConfig)
+    models: ModelConfig = Field(default_factory=ModelConfig)
+    capture: CaptureConfig = Field(default_factory=CaptureConfig)
+    quality: QualityConfig = Field(default_factory=QualityConfig)
+    tracking: TrackingConfig = Field(default_factory=TrackingConfig)
+    metrics: MetricsConfig = Field(default_factory=MetricsConfig)
+    recognition: RecognitionConfig = Field(default_factory=RecognitionConfig)
+    daemon: DaemonConfig = Field(default_factory=DaemonConfig)
+
+
+_config = None
+
+
+def load_config(path: Optional[str] = None) -> AppConfig:
+    """
+    Loads the deployment configuration.
+
+    The file is `path`, else the `ATTENDANCE_CONFIG` environment variable, else
+    `config.yaml` in the working directory. Missing files and sections fall back
+    to defaults. The result is cached for subsequent calls without a path.
+    """
+    global _config
+    if path is None and _config is not None:
+        return _config
+
+    config_path = path or os.environ.get(CONFIG_PATH_ENV, DEFAULT_CONFIG_PATH)
+    if os.path.exists(config_path):
+        import yaml
+        with open(config_path, "r") as f:
+            data = yaml.safe_load(f) or {}
+        config = AppConfig(**data)
+        logger.info(f"Loaded configuration from {config_path}")
+    else:
+        config = AppConfig()
+        logger.info(f"No configuration file at {config_path}, using defaults.")
+
+    if path is None:
+        _config = config
+    return config
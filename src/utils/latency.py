@@ -0,0 +1,135 @@
+import json
+import threading
+import time
+from contextlib import nullcontext
+from typing import Dict, List, NamedTuple, Optional
+
+import numpy as np
+
+
+_NULL_TIMER = nullcontext()
+
+
+class LatencySummary(NamedTuple):
+    """Percentiles of one stage over the rolling window, in milliseconds"""
+
+    stage: str
+    count: int
+    p50: float
+    p95: float
+    p99: float
+    max: float
+
+
+class RollingHistogram:
+    """
+    Keeps the last `window` samples of a stage in a fixed ring buffer, so
+    recording is O(1) and memory stays constant. Percentiles are computed
+    on demand from the window.
+    """
+    def __init__(self, window: int = 1000):
+        self._samples = np.zeros(window, dtype=np.float64)
+        self._next = 0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def record(self, milliseconds: float):
+        with self._lock:
+            self._samples[self._next] = milliseconds
+            self._next = (self._next + 1) % len(self._samples)
+            self._count += 1
+
+    def snapshot(self) -> tuple[np.ndarray, int]:
+        """Returns a copy of the samples in the window and the total number ever recorded."""
+        with self._lock:
+            filled = min(self._count, len(self._samples))
+            return self._samples[:filled].copy(), self._count
+
+
+class _StageTimer:
+    __slots__ = ("_histogram", "_start")
+
+    def __init__(self, histogram: RollingHistogram):
+        self._histogram = histogram
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._histogram.record((time.perf_counter() - self._start) * 1000)
+        return False
+
+
+class LatencyMetrics:
+    """
+    Per-stage latency of one stream (e.g. a camera), measured with the
+    monotonic `perf_counter` clock.
+
+    Wrap a stage in `with metrics.time("detection"):`, or pass an already
+    measured duration to `record`. When `enabled` is False both return
+    immediately (a shared no-op context manager), so instrumentation can stay
+    in the hot path. Stages may be recorded from any thread.
+    """
+    def __init__(self, stream: str, enabled: bool = True, window: int = 1000):
+        self.stream = stream
+        self.enabled = enabled
+        self.window = window
+        self._histograms: Dict[str, RollingHistogram] = {}
+        self._lock = threading.Lock()
+
+    def time(self, stage: str):
+        """Returns a context manager that records the time spent in its block under `stage`."""
+        if not self.enabled:
+            return _NULL_TIMER
+        return _StageTimer(self._histogram(stage))
+
+    def record(self, stage: str, seconds: float):
+        """Records a duration measured by the caller."""
+        if self.enabled:
+            self._histogram(stage).record(seconds * 1000)
+
+    def summaries(self) -> List[LatencySummary]:
+        """Returns the p50/p95/p99 of every stage recorded so far, in first-seen order."""
+        with self._lock:
+            histograms = list(self._histograms.items())
+
+        summaries = []
+        for stage, histogram in histograms:
+            samples, count = histogram.snapshot()
+            if not len(samples):
+                continue
+            p50, p95, p99 = np.percentile(samples, (50, 95, 99))
+            summaries.append(LatencySummary(stage, count, float(p50), float(p95), float(p99), float(samples.max())))
+        return summaries
+
+    def _histogram(self, stage: str) -> RollingHistogram:
+        histogram = self._histograms.get(stage)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(stage, RollingHistogram(self.window))
+        return histogram
+
+
+def format_summaries(summaries: List[LatencySummary], stages: Optional[List[str]] = None) -> str:
+    """Formats summaries compactly for a status bar, e.g. 'detection 21.3/30.1 ms' (p50/p95)."""
+    return " | ".join(
+        f"{summary.stage} {summary.p50:.1f}/{summary.p95:.1f} ms"
+        for summary in summaries if stages is None or summary.stage in stages
+    )
+
+
+def dump_metrics(path: str, metrics: List[LatencyMetrics]):
+    """
+    Appends a snapshot of every stream's stage percentiles to `path` as one
+    JSON line, so the file keeps a history that can be plotted later.
+    """
+    snapshot = {
+        "time": time.time(),
+        "streams": {
+            stream_metrics.stream: {summary.stage: summary._asdict() for summary in stream_metrics.summaries()}
+            for stream_metrics in metrics
+        },
+    }
+    with open(path, "a") as f:
+        f.write(json.dumps(snapshot) + "\n")
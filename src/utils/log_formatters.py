@@ -5,37 +5,39 @@ from io import StringIO
 class CsvFormatter(logging.Formatter):
     """
     A custom logging formatter that outputs records in a CSV format.
+
+    The data for the CSV is expected to be in the `record.csv_data` attribute.
+    The header is not part of the formatted records; sinks that write files
+    (see `BufferedCsvHandler`) write it once, when the file is created.
     """
-    def __init__(self, fields, header=True):
+    def __init__(self, fields):
         """
         Initializes the formatter.
 
         Args:
             fields (list): A list of field names for the CSV columns.
-            header (bool): Whether to write the header row.
         """
         super().__init__()
         self.fields = fields
-        self.header = header
-        self.header_written = not header
+        # One buffer and writer reused for every record
+        self._buffer = StringIO()
+        self._writer = csv.writer(self._buffer, quoting=csv.QUOTE_ALL, lineterminator="")
+
+    def row(self, record) -> list:
+        """Returns the CSV values of a record, empty strings for missing fields."""
+        csv_data = getattr(record, 'csv_data', None)
+        if not isinstance(csv_data, dict):
+            return [''] * len(self.fields)
+        return [csv_data.get(field, '') for field in self.fields]
 
     def format(self, record):
         """
         Formats the log record into a CSV string.
-        The data for the CSV is expected to be in the `record.csv_data` attribute.
         """
-        # Use an in-memory string buffer to handle CSV writing
-        string_io = StringIO()
-        writer = csv.writer(string_io, quoting=csv.QUOTE_ALL)
-        
-        # Write header if it hasn't been written yet
-        if not self.header_written:
-            writer.writerow(self.fields)
-            self.header_written = True
+        return self._format_values(self.row(record))
 
-        # Ensure record.csv_data exists and is a dictionary
-        if hasattr(record, 'csv_data') and isinstance(record.csv_data, dict):
-            row = [record.csv_data.get(field, '') for field in self.fields]
-            writer.writerow(row)
-        
-        return string_io.getvalue().strip()
\ No newline at end of file
+    def _format_values(self, values) -> str:
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        self._writer.writerow(values)
+        return self._buffer.getvalue()
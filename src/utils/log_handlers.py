@@ -0,0 +1,87 @@
+import csv
+import logging
+import os
+import threading
+import time
+
+
+class BufferedCsvHandler(logging.Handler):
+    """
+    Appends records to a CSV file in batches.
+
+    Rows are buffered in memory and written with a single `writerows` call
+    when `capacity` rows are pending, when the oldest pending row is older
+    than `flush_interval` seconds (checked on every record and by a
+    background flusher), and on `flush`/`close`. The file is opened once and
+    kept open. The header row is written only when the file is new or empty,
+    so restarts keep appending to a single table.
+
+    Requires a `CsvFormatter` (`utils.log_formatters`), which provides the columns.
+    """
+    def __init__(self, filename: str, capacity: int = 1000, flush_interval: float = 1.0, encoding: str = "utf-8"):
+        super().__init__()
+        self.filename = os.path.abspath(filename)
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        self.encoding = encoding
+
+        self._rows = []
+        self._first_pending = 0.0
+        self._file = None
+        self._writer = None
+        self._closed = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_periodically, name="csv-log-flusher", daemon=True)
+        self._flusher.start()
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            if not self._rows:
+                self._first_pending = time.monotonic()
+            self._rows.append(self.formatter.row(record))
+            if len(self._rows) >= self.capacity or time.monotonic() - self._first_pending >= self.flush_interval:
+                self._write_pending()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        self.acquire()
+        try:
+            self._write_pending()
+        finally:
+            self.release()
+
+    def close(self):
+        self._closed.set()
+        self.acquire()
+        try:
+            self._write_pending()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+        finally:
+            self.release()
+        super().close()
+
+    def _write_pending(self):
+        if not self._rows:
+            return
+        if self._file is None:
+            self._open()
+        self._writer.writerows(self._rows)
+        self._file.flush()
+        self._rows = []
+
+    def _open(self):
+        is_new = not os.path.exists(self.filename) or os.path.getsize(self.filename) == 0
+        self._file = open(self.filename, "a", newline="", encoding=self.encoding)
+        self._writer = csv.writer(self._file, quoting=csv.QUOTE_ALL)
+        if is_new:
+            self._writer.writerow(self.formatter.fields)
+
+    def _flush_periodically(self):
+        while not self._closed.wait(self.flush_interval):
+            try:
+                self.flush()
+            except OSError:
+                # The rows stay buffered and are retried on the next flush
+                pass
@@ -0,0 +1,133 @@
+import logging
+import os
+import re
+from collections import deque
+from typing import List, NamedTuple, Optional
+
+
+LOG_LINE_PATTERN = re.compile(r"^\[(?P<time>[^\]]*)\] - \[(?P<name>[^\]]*)\] - (?P<level>[A-Z]+) - (?P<message>.*)$")
+
+
+class LogEntry(NamedTuple):
+    """A parsed line of the application log"""
+
+    time: str
+    name: str
+    level: str
+    levelno: int
+    message: str
+
+
+class LogTailer:
+    """
+    Incrementally follows a log file written by a `RotatingFileHandler`.
+
+    Each `poll` reads only the bytes appended since the previous call, tracked
+    by byte offset. Rotation is detected by a changed inode or a shrunken file,
+    in which case the rest of the rotated file (`<path>.1`) is read before
+    starting over on the new file. Parsed entries are kept in a bounded ring
+    buffer, so memory stays constant however large the logs grow.
+    """
+    def __init__(self, path: str, max_entries: int = 5000, initial_tail_bytes: int = 256 * 1024):
+        self.path = path
+        self.entries = deque(maxlen=max_entries)
+        self.initial_tail_bytes = initial_tail_bytes
+
+        self._offset = None
+        self._inode = None
+        self._partial = b""
+
+    def poll(self) -> List[LogEntry]:
+        """
+        Reads newly appended lines.
+
+        Returns:
+            The entries parsed during this call, also appended to `entries`.
+        """
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return []
+
+        new_lines = []
+
+        if self._offset is None:
+            # First poll: only load the end of the file, skipping the first (likely partial) line
+            self._offset = max(0, stat.st_size - self.initial_tail_bytes)
+            self._inode = stat.st_ino
+            skip_first_line = self._offset > 0
+        else:
+            skip_first_line = False
+            if stat.st_ino != self._inode or stat.st_size < self._offset:
+                new_lines.extend(self._drain_rotated())
+                self._offset = 0
+                self._inode = stat.st_ino
+                self._partial = b""
+
+        if stat.st_size > self._offset:
+            with open(self.path, "rb") as f:
+                f.seek(self._offset)
+                data = f.read(stat.st_size - self._offset)
+            self._offset += len(data)
+            lines = self._split(data)
+            if skip_first_line and lines:
+                lines = lines[1:]
+            new_lines.extend(lines)
+
+        entries = self._parse(new_lines)
+        self.entries.extend(entries)
+        return entries
+
+    def filtered(self, min_level: int = logging.NOTSET, name_prefix: str = "") -> List[LogEntry]:
+        """Returns the buffered entries at or above `min_level` from loggers starting with `name_prefix`."""
+        return [entry for entry in self.entries if self.matches(entry, min_level, name_prefix)]
+
+    @staticmethod
+    def matches(entry: LogEntry, min_level: int = logging.NOTSET, name_prefix: str = "") -> bool:
+        return entry.levelno >= min_level and entry.name.startswith(name_prefix)
+
+    def _drain_rotated(self) -> List[str]:
+        """Reads what was appended to the previous file between the last poll and its rotation."""
+        rotated_path = f"{self.path}.1"
+        try:
+            stat = os.stat(rotated_path)
+        except FileNotFoundError:
+            return []
+        if stat.st_ino != self._inode or stat.st_size <= self._offset:
+            return []
+
+        with open(rotated_path, "rb") as f:
+            f.seek(self._offset)
+            data = f.read(stat.st_size - self._offset)
+        lines = self._split(data)
+        if self._partial:
+            lines.append(self._partial.decode("utf-8", errors="replace"))
+        return lines
+
+    def _split(self, data: bytes) -> List[str]:
+        data = self._partial + data
+        *complete, self._partial = data.split(b"\n")
+        return [line.decode("utf-8", errors="replace").rstrip("\r") for line in complete]
+
+    def _parse(self, lines: List[str]) -> List[LogEntry]:
+        level_numbers = logging.getLevelNamesMapping()
+        entries = []
+        previous: Optional[LogEntry] = self.entries[-1] if self.entries else None
+        for line in lines:
+            match = LOG_LINE_PATTERN.match(line)
+            if match:
+                level = match.group("level")
+                entry = LogEntry(
+                    match.group("time"), match.group("name"), level,
+                    level_numbers.get(level, logging.NOTSET), match.group("message")
+                )
+            elif not line:
+                continue
+            elif previous is not None:
+                # Continuation lines (e.g. tracebacks) inherit the record they belong to
+                entry = previous._replace(message=line)
+            else:
+                entry = LogEntry("", "", "", logging.NOTSET, line)
+            entries.append(entry)
+            previous = entry
+        return entries
@@ -1,12 +1,25 @@
+import atexit
 import logging.config
+import logging.handlers
+import queue
 import sys
 from utils.log_formatters import CsvFormatter
+from utils.log_handlers import BufferedCsvHandler
 from datetime import datetime
 
+APP_LOG_FILE = 'app.log'
+
+_listeners = []
+
 def setup_logging():
     """
     Configures logging for the entire application, including a dedicated
     CSV logger for attendance.
+
+    The configured handlers do not run on the logging threads: each logger
+    gets a `QueueHandler` that only enqueues the record, and a `QueueListener`
+    thread does the formatting and I/O. Pending records are written out by
+    `stop_logging`, which also runs at exit.
     """
     
     CSV_FIELDS = ['date', 'name', 'id', 'hall']
@@ -27,21 +40,23 @@ def setup_logging():
             'console': {
                 'class': 'logging.StreamHandler',
                 'formatter': 'standard',
-                'level': 'DEBUG',
+                'level': 'INFO',
                 'stream': sys.stdout,
             },
             'file': {
                 'class': 'logging.handlers.RotatingFileHandler',
                 'formatter': 'standard',
-                'filename': 'app.log',
+                'filename': APP_LOG_FILE,
                 'maxBytes': 10485760,  
                 'backupCount': 5,
                 'level': 'INFO',
             },
             'csv_file': {
-                'class': 'logging.FileHandler',
+                '()': BufferedCsvHandler,
                 'formatter': 'csv',
                 'filename': 'attendance.csv',
+                'capacity': 1000,
+                'flush_interval': 1.0,
                 'level': 'INFO',
             },
         },
@@ -58,8 +73,34 @@ def setup_logging():
             }
         }
     }
+    stop_logging()
     logging.config.dictConfig(LOGGING_CONFIG)
 
+    for name in ('', 'attendance'):
+        logger = logging.getLogger(name)
+        handlers = list(logger.handlers)
+        for handler in handlers:
+            logger.removeHandler(handler)
+
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        _listeners.append((listener, handlers))
+
+def stop_logging():
+    """
+    Stops the logging threads after they have handled every queued record,
+    then flushes and closes the handlers.
+    """
+    while _listeners:
+        listener, handlers = _listeners.pop()
+        listener.stop()
+        for handler in handlers:
+            handler.close()
+
+atexit.register(stop_logging)
+
 def record_attendance(name, user_id, location):
     """
     Example function to record an attendance event.
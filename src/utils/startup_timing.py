@@ -0,0 +1,34 @@
+import logging
+import threading
+import time
+
+
+logger = logging.getLogger(__name__)
+
+_start = time.perf_counter()
+_last = _start
+_lock = threading.Lock()
+_seen = set()
+
+
+def mark(stage: str, once: bool = False):
+    """
+    Logs the time elapsed since process start and since the previous mark.
+
+    The clock starts when this module is first imported, so `main.py` imports it
+    before anything else.
+
+    Args:
+        stage: A short description of the milestone reached.
+        once: Only log the first time this stage is reached.
+    """
+    global _last
+    with _lock:
+        if once:
+            if stage in _seen:
+                return
+            _seen.add(stage)
+        now = time.perf_counter()
+        total_ms, step_ms = (now - _start) * 1000, (now - _last) * 1000
+        _last = now
+    logger.info(f"Startup: {stage} at {total_ms:.0f} ms (+{step_ms:.0f} ms)")
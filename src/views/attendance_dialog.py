@@ -0,0 +1,208 @@
+from PyQt6.QtWidgets import QDialog, QHeaderView
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QObject, QThread, QDate, pyqtSignal, pyqtSlot
+
+from datetime import datetime, time
+import logging
+
+from database.database_manager import DatabaseManager
+from ui.attendance_dialog_ui import Ui_attendance_dialog
+
+
+logger = logging.getLogger(__name__)
+
+
+class AttendancePageLoader(QObject):
+    """
+    Fetches attendance pages from the database. Lives in a background QThread
+    so the GUI never waits on a query.
+    """
+    page_loaded = pyqtSignal(int, list, object)
+    error = pyqtSignal(int, str)
+
+    def __init__(self, db_manager: DatabaseManager):
+        super().__init__()
+        self.db_manager = db_manager
+
+    @pyqtSlot(int, dict)
+    def load(self, generation: int, query: dict):
+        try:
+            rows, next_key = self.db_manager.get_attendance_page(**query)
+        except Exception as e:
+            logger.error(f"Failed to load attendance page: {e}")
+            self.error.emit(generation, str(e))
+            return
+        self.page_loaded.emit(generation, rows, next_key)
+
+
+class AttendanceTableModel(QAbstractTableModel):
+    """
+    A table model over the attendance table that loads keyset pages lazily as
+    the view scrolls (`canFetchMore`/`fetchMore`).
+
+    Sorting and filtering are delegated to the database: changing either resets
+    the model and starts again from the first page. Pages requested before a
+    reset are recognized by their generation number and discarded.
+    """
+    page_requested = pyqtSignal(int, dict)
+    loading_changed = pyqtSignal(bool)
+
+    HEADERS = ["Attendance ID", "Student ID", "Name", "Hall", "Date & Time", "Recorded Frame"]
+    SORT_COLUMNS = {1: "student_id", 3: "hall", 4: "attend_datetime"}
+
+    def __init__(self, parent=None, page_size: int = 200):
+        super().__init__(parent)
+        self.page_size = page_size
+
+        self._rows = []
+        self._next_key = None
+        self._exhausted = False
+        self._loading = False
+        self._generation = 0
+
+        self._order_by = "attend_datetime"
+        self._descending = True
+        self._filters = {}
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        return self._rows[index.row()][index.column()]
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and not self._exhausted
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self._exhausted or self._loading:
+            return
+
+        self._loading = True
+        self.loading_changed.emit(True)
+        query = {
+            "order_by": self._order_by,
+            "descending": self._descending,
+            "after": self._next_key,
+            "page_size": self.page_size,
+            **self._filters
+        }
+        self.page_requested.emit(self._generation, query)
+
+    @pyqtSlot(int, list, object)
+    def on_page_loaded(self, generation: int, rows: list, next_key):
+        if generation != self._generation:
+            return
+
+        self._loading = False
+        self._next_key = next_key
+        self._exhausted = next_key is None
+
+        if rows:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+            self._rows.extend(rows)
+            self.endInsertRows()
+
+        self.loading_changed.emit(False)
+
+    @pyqtSlot(int, str)
+    def on_page_error(self, generation: int, message: str):
+        if generation != self._generation:
+            return
+        self._loading = False
+        self._exhausted = True
+        self.loading_changed.emit(False)
+
+    def sort(self, column: int, order=Qt.SortOrder.AscendingOrder):
+        order_by = self.SORT_COLUMNS.get(column)
+        if order_by is None:
+            return
+        self._order_by = order_by
+        self._descending = order == Qt.SortOrder.DescendingOrder
+        self.reload()
+
+    def set_filters(self, **filters):
+        """Sets the `get_attendance_page` filters (start, end, hall, student_id) and reloads."""
+        self._filters = {key: value for key, value in filters.items() if value is not None}
+        self.reload()
+
+    def reload(self):
+        self.beginResetModel()
+        self._generation += 1
+        self._rows = []
+        self._next_key = None
+        self._exhausted = False
+        self._loading = False
+        self.endResetModel()
+        self.fetchMore()
+
+    def has_more(self) -> bool:
+        return not self._exhausted
+
+
+class AttendanceDialog(QDialog):
+    """
+    A dialog browsing the full attendance table. Records are loaded page by
+    page on a background thread as the user scrolls.
+    """
+    def __init__(self, db_manager: DatabaseManager, parent=None):
+        super().__init__(parent)
+
+        self.ui = Ui_attendance_dialog()
+        self.ui.setupUi(self)
+
+        self.model = AttendanceTableModel(self)
+
+        self.loader_thread = QThread(self)
+        self.loader = AttendancePageLoader(db_manager)
+        self.loader.moveToThread(self.loader_thread)
+        self.model.page_requested.connect(self.loader.load)
+        self.loader.page_loaded.connect(self.model.on_page_loaded)
+        self.loader.error.connect(self.model.on_page_error)
+        self.model.loading_changed.connect(self.update_row_count)
+        self.loader_thread.finished.connect(self.loader.deleteLater)
+        self.loader_thread.start()
+
+        self.ui.attendance_table.setModel(self.model)
+        self.ui.attendance_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.ui.attendance_table.horizontalHeader().setSortIndicator(4, Qt.SortOrder.DescendingOrder)
+
+        today = QDate.currentDate()
+        self.ui.start_date_input.setDate(today.addMonths(-1))
+        self.ui.end_date_input.setDate(today)
+        self.ui.apply_filter_button.clicked.connect(self.apply_filters)
+        self.ui.buttonBox.rejected.connect(self.reject)
+
+        self.model.reload()
+
+    def apply_filters(self):
+        """Reloads the table with the filters entered in the dialog."""
+        start = end = None
+        if self.ui.date_filter_check.isChecked():
+            start = datetime.combine(self.ui.start_date_input.date().toPyDate(), time.min)
+            end = datetime.combine(self.ui.end_date_input.date().addDays(1).toPyDate(), time.min)
+
+        self.model.set_filters(
+            student_id=self.ui.student_filter_input.text().strip() or None,
+            hall=self.ui.hall_filter_input.text().strip() or None,
+            start=start,
+            end=end
+        )
+
+    def update_row_count(self, is_loading: bool):
+        suffix = " (loading...)" if is_loading else (" (scroll for more)" if self.model.has_more() else "")
+        self.ui.row_count_label.setText(f"{self.model.rowCount()} records{suffix}")
+
+    def done(self, result: int):
+        self.loader_thread.quit()
+        self.loader_thread.wait()
+        super().done(result)
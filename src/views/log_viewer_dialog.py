@@ -0,0 +1,73 @@
+from PyQt6.QtWidgets import QDialog
+from PyQt6.QtCore import QTimer
+
+import logging
+
+from ui.log_viewer_dialog_ui import Ui_log_viewer_dialog
+from utils.log_tail import LogTailer, LogEntry
+from utils.logs import APP_LOG_FILE
+
+
+LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+
+
+class LogViewerDialog(QDialog):
+    """
+    A dialog that tails the application log.
+
+    New lines are read incrementally by a `LogTailer` on a timer and appended to
+    the view; the view itself keeps at most as many lines as the tailer's ring
+    buffer. Changing a filter re-renders from the ring buffer, never from disk.
+    """
+    def __init__(self, log_path: str = APP_LOG_FILE, parent=None, poll_interval_ms: int = 500, max_entries: int = 5000):
+        super().__init__(parent)
+
+        self.ui = Ui_log_viewer_dialog()
+        self.ui.setupUi(self)
+
+        self.tailer = LogTailer(log_path, max_entries=max_entries)
+
+        self.ui.log_output.setMaximumBlockCount(max_entries)
+        self.ui.level_filter_input.addItems(LEVELS)
+        self.ui.level_filter_input.setCurrentText("INFO")
+        self.ui.level_filter_input.currentTextChanged.connect(self.refresh)
+        self.ui.logger_filter_input.textChanged.connect(self.refresh)
+        self.ui.buttonBox.rejected.connect(self.reject)
+
+        self.poll_timer = QTimer(self)
+        self.poll_timer.timeout.connect(self.poll)
+        self.poll_timer.start(poll_interval_ms)
+
+        self.tailer.poll()
+        self.refresh()
+
+    def poll(self):
+        """Appends log lines written since the last poll that pass the filters."""
+        entries = self.tailer.poll()
+        lines = [self.format_entry(entry) for entry in entries if self._matches(entry)]
+        if not lines:
+            return
+
+        scrollbar = self.ui.log_output.verticalScrollBar()
+        position = scrollbar.value()
+        self.ui.log_output.appendPlainText("\n".join(lines))
+        if not self.ui.follow_check.isChecked():
+            scrollbar.setValue(position)
+
+    def refresh(self):
+        """Re-renders the view from the ring buffer with the current filters."""
+        lines = [self.format_entry(entry) for entry in self.tailer.entries if self._matches(entry)]
+        self.ui.log_output.setPlainText("\n".join(lines))
+        self.ui.log_output.verticalScrollBar().setValue(self.ui.log_output.verticalScrollBar().maximum())
+
+    def _matches(self, entry: LogEntry) -> bool:
+        min_level = logging.getLevelNamesMapping()[self.ui.level_filter_input.currentText()]
+        return LogTailer.matches(entry, min_level, self.ui.logger_filter_input.text().strip())
+
+    @staticmethod
+    def format_entry(entry: LogEntry) -> str:
+        return f"[{entry.time}] - [{entry.name}] - {entry.level} - {entry.message}"
+
+    def done(self, result: int):
+        self.poll_timer.stop()
+        super().done(result)
@@ -1,18 +1,23 @@
 from ui.main_window_ui import Ui_MainWindow
-from views.result_item_widget import ResultItemWidget
 from vision.face_analyzer import FaceAnalyzer
+from vision.frame_result import FrameResult
+from database.database_manager import DatabaseManager, GalleryModelError
 
-from PyQt6.QtWidgets import QMainWindow, QSizePolicy, QDialog
-from PyQt6.QtCore import QThread, Qt, pyqtSignal, QObject
-from PyQt6.QtGui import QImage, QPixmap
+from PyQt6.QtWidgets import QMainWindow, QSizePolicy, QDialog, QLabel
+from PyQt6.QtCore import QThread, QTimer, pyqtSignal, QObject
 
-import cv2
 import numpy as np
-from PIL import Image
+import uuid
 
 from logging import getLogger
-from vision.camera_manager import CameraWorker
+from vision.camera_manager import CameraWorker, RemoteCameraWorker
+from vision.enrollment_worker import EnrollmentWorker
+from utils import startup_timing
+from utils.config import load_config
+from utils.latency import LatencyMetrics, dump_metrics, format_summaries
 from .add_student_widget import AddStudentDialog
+from .attendance_dialog import AttendanceDialog
+from .log_viewer_dialog import LogViewerDialog
 
 logger = getLogger(__name__)
 
@@ -30,11 +35,18 @@ class Worker(QObject):
 class MainWindow(QMainWindow):
     """
     Main Window UI Displaying the Camera Feed and a Results list.
+
+    With `daemon_socket`, the window is a thin client of a running recognition
+    daemon (`src/daemon.py`): it shows the daemon's feed instead of loading the
+    models and capturing itself, and enrollment is unavailable.
     """
 
     start_worker_signal = pyqtSignal()
+    enroll_signal = pyqtSignal(str, str, str)
+
+    STATUS_BAR_STAGES = ["capture", "detection", "recognition", "tracking", "update frame"]
 
-    def __init__(self):
+    def __init__(self, daemon_socket: str = None):
         super().__init__()
 
         self.ui = Ui_MainWindow()
@@ -43,6 +55,13 @@ class MainWindow(QMainWindow):
 
         self.face_analyzer = FaceAnalyzer()
         self.is_analyzer_ready = False
+        self.daemon_socket = daemon_socket
+
+        self.db_manager = DatabaseManager("data/attendance.db")
+        # Names and photos of the students shown in the results list
+        self._result_students = {}
+        self.attendance_dialog = None
+        self.log_viewer_dialog = None
 
         self.ui.actionEnroll.setEnabled(False)
         self.ui.statusbar.showMessage("Loading AI model, please wait...")
@@ -52,9 +71,22 @@ class MainWindow(QMainWindow):
 
         self.is_camera_running = False
 
+        self.render_stats_label = QLabel()
+        self.ui.statusbar.addPermanentWidget(self.render_stats_label)
+        self.render_stats_timer = QTimer(self)
+        self.render_stats_timer.timeout.connect(self.update_render_stats)
+        self.render_stats_timer.start(1000)
+
+        self.setup_metrics()
+
         self.setup_camera()
 
-        self.initialize_analyzer()
+        self.setup_enrollment()
+
+        if daemon_socket is None:
+            self.initialize_analyzer()
+        else:
+            self.ui.statusbar.showMessage(f"Using the recognition daemon at {daemon_socket}.", 5000)
 
         self.ui.actionAttendance.triggered.connect(self.display_attendance)
         self.ui.actionEnroll.triggered.connect(self.enroll_student)
@@ -87,9 +119,17 @@ class MainWindow(QMainWindow):
     def on_analyzer_ready(self):
         """Slot called when the FaceAnalyzer has finished loading."""
         self.is_analyzer_ready = True
+        try:
+            self.db_manager.check_gallery_model(self.face_analyzer.embedding_model)
+        except GalleryModelError as e:
+            # Enrolling now would add vectors that can't be compared with the rest of the gallery
+            logger.error(str(e))
+            self.ui.statusbar.showMessage(str(e))
+            return
         self.ui.actionEnroll.setEnabled(True)
         self.ui.statusbar.showMessage("AI Model Loaded. Ready.", 5000)
         logger.info("FaceAnalyzer is ready.")
+        startup_timing.mark("face analyzer ready")
 
     def setup_camera(self):
         """
@@ -97,13 +137,20 @@ class MainWindow(QMainWindow):
         """
         
         self.camera_thread = QThread()
-        self.camera_worker = CameraWorker(face_analyzer=self.face_analyzer, camera_index=0)
+        if self.daemon_socket is None:
+            config = load_config()
+            self.camera_worker = CameraWorker(face_analyzer=self.face_analyzer, source=config.capture.source,
+                                              metrics=self.metrics, capture_config=config.capture,
+                                              db_manager=self.db_manager, recognition_config=config.recognition)
+        else:
+            self.camera_worker = RemoteCameraWorker(self.daemon_socket, metrics=self.metrics)
         
         self.camera_worker.moveToThread(self.camera_thread)
         
         self.start_worker_signal.connect(self.camera_worker.start_capture)
         
-        self.camera_worker.frame_ready.connect(self.update_frame)
+        self.camera_worker.frame_ready.connect(self.on_frame_ready)
+        self.camera_worker.identity_committed.connect(self.on_identity_committed)
         self.camera_worker.error.connect(self.handle_camera_error)
         self.camera_worker.finished.connect(self.on_worker_finished)
         
@@ -139,30 +186,93 @@ class MainWindow(QMainWindow):
         self.ui.statusbar.showMessage("Camera feed stopped.", 3000)
         logger.info("Stopped Camera Feed")
         self.ui.actionStart.setEnabled(True)
+        self.ui.video_display_label.clear_frame()
         self.ui.video_display_label.setText("Press Start to begin the Camera Feed")
         self.ui.actionStop.setEnabled(False)
 
-    def update_frame(self, frame: np.ndarray, faces: list):
+    def on_frame_ready(self):
+        """
+        Slot called when the worker has a new frame waiting. Only the newest
+        frame is taken, any frames produced in between were already dropped.
         """
-        Receives a frame from the worker and displays it in the QLabel.
+        latest = self.camera_worker.take_latest_frame()
+        if latest is not None:
+            self.update_frame(*latest)
+
+    def update_frame(self, frame: np.ndarray, result: FrameResult):
+        """
+        Receives a frame from the worker and displays it in the video label.
         
         Args:
-            frame: The captured video frame as a NumPy array.
+            frame: The captured BGR video frame as a NumPy array.
+            result: The faces found in the frame, painted over it.
         """
-        
-        rgb_image = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        h, w, ch = rgb_image.shape
-        bytes_per_line = ch * w
-        qt_image = QImage(rgb_image.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
-        
-        pixmap = QPixmap.fromImage(qt_image)
-        container_size = self.ui.video_display_label.parentWidget().size()
-        scaled_pixmap = pixmap.scaled(container_size, 
-                                      Qt.AspectRatioMode.KeepAspectRatio, 
-                                      Qt.TransformationMode.SmoothTransformation)
-        
+        with self.metrics.time("update frame"):
+            self.ui.video_display_label.set_frame(frame)
+            self.ui.video_display_label.set_overlays(result)
+
+    def on_identity_committed(self, student_id: str, similarity: float):
+        """
+        Adds a track identified by the worker to the results list, so a
+        student's count goes up once per sighting rather than once per frame.
+        """
+        student = self._result_students.get(student_id)
+        if student is None:
+            student = self.db_manager.get_student_row(student_id)
+            if student is None:
+                return
+            self._result_students[student_id] = student
+        self.ui.results_list.results_model.queue_result(
+            student_id, student.student_name, 0.0 if np.isnan(similarity) else similarity, student.student_image_path
+        )
+
+    def update_render_stats(self):
+        """Shows render FPS, GUI-thread time per frame, dropped frames and stage latencies in the status bar."""
+        if not self.is_camera_running:
+            self.render_stats_label.clear()
+            self.latency_label.clear()
+            return
+
+        stats = self.ui.video_display_label.stats
+        self.render_stats_label.setText(
+            f"Render: {stats.fps:.1f} FPS | GUI: {stats.gui_ms_per_frame:.2f} ms/frame | "
+            f"Dropped: {self.camera_worker.dropped_frames}"
+        )
+
+        if self.metrics.enabled:
+            summaries = self.metrics.summaries()
+            self.latency_label.setText(format_summaries(summaries, self.STATUS_BAR_STAGES))
+            self.latency_label.setToolTip("\n".join(
+                f"{s.stage}: p50 {s.p50:.2f} | p95 {s.p95:.2f} | p99 {s.p99:.2f} | max {s.max:.2f} ms ({s.count} samples)"
+                for s in summaries
+            ))
+
+    def setup_metrics(self):
+        """
+        Creates the latency metrics of the camera stream from the deployment
+        config, shown in the status bar and appended to the metrics file.
+        """
+        config = load_config().metrics
+        self.metrics = LatencyMetrics("camera0", enabled=config.enabled, window=config.window)
+        self.ui.video_display_label.metrics = self.metrics
 
-        self.ui.video_display_label.setPixmap(scaled_pixmap)
+        self.latency_label = QLabel()
+        self.ui.statusbar.addPermanentWidget(self.latency_label)
+
+        self.metrics_dump_path = config.dump_path
+        self.metrics_dump_timer = QTimer(self)
+        self.metrics_dump_timer.timeout.connect(self.dump_metrics)
+        if config.enabled and config.dump_path:
+            self.metrics_dump_timer.start(int(config.dump_interval * 1000))
+
+    def dump_metrics(self):
+        """Appends the current stage percentiles to the metrics file while the feed runs."""
+        if not self.is_camera_running:
+            return
+        try:
+            dump_metrics(self.metrics_dump_path, [self.metrics])
+        except OSError as e:
+            logger.warning(f"Could not write metrics to {self.metrics_dump_path}: {e}")
 
 
     def handle_camera_error(self, error_msg: str):
@@ -174,11 +284,39 @@ class MainWindow(QMainWindow):
         self.on_worker_finished()
 
     def display_logs(self):
+        """
+        Shows the log viewer dialog, reusing it if it is already open.
+        """
         logger.info("Displaying Attendance Logs")
 
+        if self.log_viewer_dialog is None:
+            self.log_viewer_dialog = LogViewerDialog(parent=self)
+            self.log_viewer_dialog.finished.connect(self.on_log_viewer_closed)
+
+        self.log_viewer_dialog.show()
+        self.log_viewer_dialog.raise_()
+
+    def on_log_viewer_closed(self):
+        self.log_viewer_dialog.deleteLater()
+        self.log_viewer_dialog = None
+
     def display_attendance(self):
+        """
+        Shows the attendance table dialog, reusing it if it is already open.
+        """
         logger.info("Displaying Full Attendance Table")
 
+        if self.attendance_dialog is None:
+            self.attendance_dialog = AttendanceDialog(self.db_manager, self)
+            self.attendance_dialog.finished.connect(self.on_attendance_dialog_closed)
+
+        self.attendance_dialog.show()
+        self.attendance_dialog.raise_()
+
+    def on_attendance_dialog_closed(self):
+        self.attendance_dialog.deleteLater()
+        self.attendance_dialog = None
+
     def enroll_student(self):
         """
         Creates and shows the Add Student dialog. If the user clicks OK,
@@ -198,19 +336,44 @@ class MainWindow(QMainWindow):
                 logger.info("New student to be added:")
                 logger.info(f"Name: {student_data['name']}")
                 logger.info(f"Image: {student_data['image_path']}")
-                
-                profile_image = Image.open(student_data['image_path'])
-                
-                face_embeddings = self.face_analyzer.get_face_embeddings(profile_image)
-                
-                if len(face_embeddings):
-                    embedding = face_embeddings[0]
-                else:
-                    print(face_embeddings)
-                    logger.warning("No Faces Found in profile image, Skipping student.")
-                    self.ui.statusbar.showMessage("No Faces Found in profile image, Skipping student.")
-                
-                self.ui.statusbar.showMessage(f"Student '{student_data['name']}' ready to be processed.", 5000)
+
+                job_id = uuid.uuid4().hex
+                self.pending_enrollments[job_id] = student_data['name']
+                self.enroll_signal.emit(job_id, student_data['name'], student_data['image_path'])
+                self.ui.statusbar.showMessage(f"Student '{student_data['name']}' queued for enrollment.", 5000)
+
+    def setup_enrollment(self):
+        """
+        Initializes the enrollment worker and its thread. Enrollment requests
+        are queued to it and processed off the GUI thread.
+        """
+        self.pending_enrollments = {}
+
+        self.enrollment_thread = QThread()
+        self.enrollment_worker = EnrollmentWorker(face_analyzer=self.face_analyzer, db_manager=self.db_manager)
+        self.enrollment_worker.moveToThread(self.enrollment_thread)
+
+        self.enroll_signal.connect(self.enrollment_worker.enroll)
+        self.enrollment_worker.progress.connect(self.on_enrollment_progress)
+        self.enrollment_worker.job_finished.connect(self.on_enrollment_finished)
+
+        self.enrollment_thread.start()
+
+    def on_enrollment_progress(self, job_id: str, stage: str, percent: int):
+        """Slot showing the progress of an enrollment job in the status bar."""
+        name = self.pending_enrollments.get(job_id, "")
+        queued = len(self.pending_enrollments) - 1
+        queued_text = f" ({queued} more queued)" if queued > 0 else ""
+        self.ui.statusbar.showMessage(f"Enrolling '{name}': {stage} ({percent}%){queued_text}")
+
+    def on_enrollment_finished(self, job_id: str, success: bool, message: str):
+        """Slot called when an enrollment job has completed or failed."""
+        self.pending_enrollments.pop(job_id, None)
+        if success:
+            logger.info(message)
+        else:
+            logger.warning(message)
+        self.ui.statusbar.showMessage(message, 5000)
         
     def closeEvent(self, event):
         """
@@ -226,5 +389,12 @@ class MainWindow(QMainWindow):
                 self.camera_thread.terminate()
                 self.camera_thread.wait()
 
+        if self.enrollment_thread.isRunning():
+            logger.info("Waiting for the current enrollment job to finish...")
+            self.enrollment_thread.quit()
+            self.enrollment_thread.wait()
+
+        self.db_manager.close()
+
         logger.info("Shutdown complete.")
         event.accept()
\ No newline at end of file
@@ -0,0 +1,236 @@
+from PyQt6.QtWidgets import QListView, QStyledItemDelegate, QStyle, QStyleOptionProgressBar, QApplication
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, QRect, QSize, QTimer
+from PyQt6.QtGui import QPixmap, QImageReader
+
+import os
+import time
+import logging
+from collections import OrderedDict
+from typing import NamedTuple, Optional
+
+from vision.image_decoding import thumbnail_path_for
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROFILE_IMAGE = "./data/students/default.png"
+
+
+class ResultEntry(NamedTuple):
+    """A recognized student shown in the results list"""
+
+    student_id: str
+    student_name: str
+    student_image_path: Optional[str]
+    similarity_score: float
+    seen_count: int
+    last_seen: float
+
+
+class PixmapCache:
+    """
+    A bounded LRU cache of profile pixmaps keyed by student ID.
+
+    The thumbnail written at enrollment is used when present; otherwise the
+    photo is decoded straight to the display size with QImageReader. Either
+    way a cache entry never holds the full resolution photo.
+    """
+    def __init__(self, capacity: int = 256, icon_size: int = 96):
+        self.capacity = capacity
+        self.icon_size = icon_size
+        self._pixmaps = OrderedDict()
+        self._default_pixmap = None
+
+    def get(self, student_id: str, image_path: Optional[str]) -> QPixmap:
+        pixmap = self._pixmaps.get(student_id)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(student_id)
+            return pixmap
+
+        if image_path and os.path.exists(thumbnail_path_for(image_path)):
+            pixmap = self._load(thumbnail_path_for(image_path))
+        elif image_path and os.path.exists(image_path):
+            pixmap = self._load(image_path)
+        else:
+            pixmap = self._default()
+        self._pixmaps[student_id] = pixmap
+        if len(self._pixmaps) > self.capacity:
+            self._pixmaps.popitem(last=False)
+        return pixmap
+
+    def _default(self) -> QPixmap:
+        # The default image is shared by every student without a photo and never evicted
+        if self._default_pixmap is None:
+            if not os.path.exists(DEFAULT_PROFILE_IMAGE):
+                logger.warning(f"Default Profile Image Not Found, Program started at: {os.getcwd()}")
+            self._default_pixmap = self._load(DEFAULT_PROFILE_IMAGE)
+        return self._default_pixmap
+
+    def _load(self, image_path: str) -> QPixmap:
+        reader = QImageReader(image_path)
+        reader.setAutoTransform(True)
+        size = reader.size()
+        if size.isValid():
+            reader.setScaledSize(size.scaled(self.icon_size, self.icon_size, Qt.AspectRatioMode.KeepAspectRatio))
+        return QPixmap.fromImage(reader.read())
+
+    def __len__(self):
+        return len(self._pixmaps)
+
+
+class ResultsListModel(QAbstractListModel):
+    """
+    A list model of recognized students, one row per student.
+
+    Incoming results are queued and applied by a timer in a single batch, so
+    the view is touched at most once per `flush_interval_ms` however many
+    recognitions arrive. Results for a student already in the list update that
+    row in place instead of adding a new one.
+    """
+    EntryRole = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, parent=None, flush_interval_ms: int = 200):
+        super().__init__(parent)
+
+        self._entries = []
+        self._row_by_student = {}
+        self._pending = {}
+
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(flush_interval_ms)
+        self._flush_timer.timeout.connect(self.flush)
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._entries)
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        entry = self._entries[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return entry.student_name
+        if role == self.EntryRole:
+            return entry
+        return None
+
+    def queue_result(self, student_id: str, student_name: str, similarity_score: float, student_image_path: Optional[str] = None):
+        """
+        Queues a recognition. Only the latest result per student is kept until the next flush.
+        """
+        pending = self._pending.get(student_id)
+        seen_count = pending.seen_count + 1 if pending else 1
+        self._pending[student_id] = ResultEntry(
+            student_id, student_name, student_image_path, similarity_score, seen_count, time.time()
+        )
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def flush(self):
+        """Applies all queued results with one insert and one change notification."""
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, {}
+        new_entries = []
+        changed_rows = []
+
+        for student_id, entry in pending.items():
+            row = self._row_by_student.get(student_id)
+            if row is None:
+                new_entries.append(entry)
+                continue
+            previous = self._entries[row]
+            self._entries[row] = entry._replace(seen_count=previous.seen_count + entry.seen_count)
+            changed_rows.append(row)
+
+        if changed_rows:
+            self.dataChanged.emit(self.index(min(changed_rows)), self.index(max(changed_rows)))
+
+        if new_entries:
+            first = len(self._entries)
+            self.beginInsertRows(QModelIndex(), first, first + len(new_entries) - 1)
+            for offset, entry in enumerate(new_entries):
+                self._row_by_student[entry.student_id] = first + offset
+                self._entries.append(entry)
+            self.endInsertRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self._entries.clear()
+        self._row_by_student.clear()
+        self._pending.clear()
+        self.endResetModel()
+
+
+class ResultItemDelegate(QStyledItemDelegate):
+    """
+    Paints a result row (profile image, name and a confidence bar) directly,
+    without instantiating a widget per row.
+    """
+    ROW_HEIGHT = 112
+    MARGIN = 8
+
+    def __init__(self, pixmap_cache: PixmapCache, parent=None):
+        super().__init__(parent)
+        self.pixmap_cache = pixmap_cache
+
+    def sizeHint(self, option, index) -> QSize:
+        return QSize(option.rect.width(), self.ROW_HEIGHT)
+
+    def paint(self, painter, option, index):
+        entry = index.data(ResultsListModel.EntryRole)
+        if entry is None:
+            return
+
+        widget = option.widget
+        style = widget.style() if widget else QApplication.style()
+        style.drawPrimitive(QStyle.PrimitiveElement.PE_PanelItemViewItem, option, painter, widget)
+
+        rect = option.rect.adjusted(self.MARGIN, self.MARGIN, -self.MARGIN, -self.MARGIN)
+        icon_size = self.pixmap_cache.icon_size
+
+        pixmap = self.pixmap_cache.get(entry.student_id, entry.student_image_path)
+        if not pixmap.isNull():
+            painter.drawPixmap(rect.left(), rect.top(), pixmap)
+
+        text_left = rect.left() + icon_size + self.MARGIN
+        text_width = rect.right() - text_left
+        bar_height = 20
+
+        name_rect = QRect(text_left, rect.top(), text_width, rect.height() - bar_height - self.MARGIN)
+        painter.save()
+        painter.setPen(option.palette.color(option.palette.ColorRole.Text))
+        painter.drawText(name_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                         f"{entry.student_name}  (x{entry.seen_count})")
+        painter.restore()
+
+        bar_option = QStyleOptionProgressBar()
+        bar_option.rect = QRect(text_left, rect.bottom() - bar_height, text_width, bar_height)
+        bar_option.minimum = 0
+        bar_option.maximum = 100
+        bar_option.progress = max(0, min(100, int(entry.similarity_score * 100)))
+        bar_option.text = f"{bar_option.progress}%"
+        bar_option.textVisible = True
+        bar_option.state = QStyle.StateFlag.State_Enabled | QStyle.StateFlag.State_Horizontal
+        style.drawControl(QStyle.ControlElement.CE_ProgressBar, bar_option, painter, widget)
+
+
+class ResultsListView(QListView):
+    """
+    A virtualized list of recognition results backed by `ResultsListModel`.
+
+    Rows share a fixed height and are painted by `ResultItemDelegate`, so
+    resizing and scrolling only cost the visible rows.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self.pixmap_cache = PixmapCache()
+        self.results_model = ResultsListModel(self)
+
+        self.setModel(self.results_model)
+        self.setItemDelegate(ResultItemDelegate(self.pixmap_cache, self))
+        self.setUniformItemSizes(True)
+        self.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        self.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
@@ -0,0 +1,162 @@
+from PyQt6.QtWidgets import QLabel
+from PyQt6.QtGui import QImage, QPainter, QPen, QColor
+from PyQt6.QtCore import QRect, QRectF, QPointF, QSize, Qt
+
+import numpy as np
+import time
+from collections import deque
+
+from vision.frame_result import FrameResult
+
+
+class RenderStats:
+    """
+    Tracks the display rate and the GUI-thread time spent per rendered frame
+    over a sliding window.
+    """
+    def __init__(self, window_seconds: float = 2.0):
+        self.window_seconds = window_seconds
+        self._frame_times = deque()
+        self._gui_times = deque()
+
+    def record(self, timestamp: float, gui_seconds: float):
+        self._frame_times.append(timestamp)
+        self._gui_times.append(gui_seconds)
+        while self._frame_times and timestamp - self._frame_times[0] > self.window_seconds:
+            self._frame_times.popleft()
+            self._gui_times.popleft()
+
+    @property
+    def fps(self) -> float:
+        if len(self._frame_times) < 2:
+            return 0.0
+        elapsed = self._frame_times[-1] - self._frame_times[0]
+        return (len(self._frame_times) - 1) / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def gui_ms_per_frame(self) -> float:
+        if not self._gui_times:
+            return 0.0
+        return 1000 * sum(self._gui_times) / len(self._gui_times)
+
+
+class VideoDisplayLabel(QLabel):
+    """
+    A QLabel that paints BGR video frames directly, without colour conversion
+    or intermediate QPixmaps.
+
+    Frames are wrapped as `Format_BGR888` QImages over the NumPy buffer and drawn
+    into an aspect-fit rectangle that is only recomputed when the widget or the
+    frame size changes. When no frame is set it behaves like a regular QLabel,
+    so placeholder text keeps working.
+
+    Face boxes and labels are kept as a separate overlay layer in frame
+    coordinates and painted with QPainter at display resolution on every paint,
+    independently of how often inference delivers new overlays. Overlays older
+    than `overlay_ttl` seconds are no longer drawn.
+
+    If `metrics` is set to a `LatencyMetrics`, paint times are recorded there
+    under "paint".
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self.smooth_scaling = False
+        self.stats = RenderStats()
+        self.metrics = None
+
+        self._frame = None
+        self._image = None
+        self._target_rect = QRect()
+        self._target_key = None
+        self._set_frame_seconds = 0.0
+
+        self.overlay_ttl = 1.0
+        self.overlay_pen = QPen(QColor(0, 255, 0), 2)
+        self._overlays = FrameResult.EMPTY
+        self._overlays_time = 0.0
+
+    def set_frame(self, frame: np.ndarray):
+        """
+        Displays a BGR frame. The frame must not be modified until the next call.
+
+        Args:
+            frame: A contiguous (H, W, 3) uint8 BGR image.
+        """
+        start = time.perf_counter()
+
+        if not frame.flags["C_CONTIGUOUS"]:
+            frame = np.ascontiguousarray(frame)
+
+        h, w, ch = frame.shape
+        # Keep a reference to the array, the QImage does not own its buffer
+        self._frame = frame
+        self._image = QImage(frame.data, w, h, ch * w, QImage.Format.Format_BGR888)
+        self.update()
+
+        self._set_frame_seconds = time.perf_counter() - start
+
+    def set_overlays(self, result: FrameResult):
+        """
+        Replaces the overlay layer.
+
+        Args:
+            result: The faces to draw, with boxes in frame pixel coordinates.
+        """
+        self._overlays = result
+        self._overlays_time = time.monotonic()
+        self.update()
+
+    def clear_frame(self):
+        """Drops the current frame and overlays so the label's text is shown again."""
+        self._frame = None
+        self._image = None
+        self._overlays = FrameResult.EMPTY
+        self.update()
+
+    def sizeHint(self) -> QSize:
+        return QSize(640, 480)
+
+    def paintEvent(self, event):
+        if self._image is None:
+            super().paintEvent(event)
+            return
+
+        start = time.perf_counter()
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, self.smooth_scaling)
+        target_rect = self._fit_rect()
+        painter.drawImage(target_rect, self._image)
+        if len(self._overlays) and time.monotonic() - self._overlays_time <= self.overlay_ttl:
+            self._paint_overlays(painter, target_rect)
+        painter.end()
+
+        end = time.perf_counter()
+        self.stats.record(end, end - start + self._set_frame_seconds)
+        if self.metrics is not None:
+            self.metrics.record("paint", end - start)
+
+    def _fit_rect(self) -> QRect:
+        """Returns the aspect-fit target rectangle, cached per widget and frame size."""
+        key = (self.width(), self.height(), self._image.width(), self._image.height())
+        if key != self._target_key:
+            scaled = self._image.size().scaled(self.size(), Qt.AspectRatioMode.KeepAspectRatio)
+            x = (self.width() - scaled.width()) // 2
+            y = (self.height() - scaled.height()) // 2
+            self._target_rect = QRect(x, y, scaled.width(), scaled.height())
+            self._target_key = key
+        return self._target_rect
+
+    def _paint_overlays(self, painter: QPainter, target_rect: QRect):
+        scale = target_rect.width() / self._image.width()
+        # All boxes are mapped to display coordinates at once: (left, top, width, height)
+        boxes = self._overlays.boxes * scale
+        boxes[:, 2:] -= boxes[:, :2]
+        boxes[:, :2] += (target_rect.x(), target_rect.y())
+
+        painter.setPen(self.overlay_pen)
+        for (left, top, width, height), label in zip(boxes.tolist(), self._overlays.labels):
+            box = QRectF(left, top, width, height)
+            painter.drawRect(box)
+            painter.drawText(QPointF(box.left(), box.top() - 6), label)
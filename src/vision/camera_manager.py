@@ -1,8 +1,16 @@
-import cv2
 from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
 import numpy as np
+import threading
+from typing import Union
 
 from .face_analyzer import FaceAnalyzer
+from .frame_result import NO_TRACK, FrameResult
+from .frame_sources import create_source
+from .pipeline import RecognitionPipeline
+from .track_fusion import TrackFusion, TrackIdentity
+from database.database_manager import DatabaseManager, GalleryModelError
+from utils.config import CaptureConfig, RecognitionConfig
+from utils.latency import LatencyMetrics
 
 from logging import getLogger
 
@@ -10,20 +18,72 @@ from logging import getLogger
 logger = getLogger(__name__)
 
 
+def new_identities(result: FrameResult, identified_tracks: set) -> list[tuple[str, float]]:
+    """
+    Returns (student ID, similarity) for the tracks of a frame labelled with a
+    student for the first time, and adds them to `identified_tracks`.
+    """
+    identities = []
+    for student_id, track_id, similarity in zip(result.student_ids, result.faces["track_id"].tolist(),
+                                                 result.faces["similarity"].tolist()):
+        if student_id is None or track_id == NO_TRACK or track_id in identified_tracks:
+            continue
+        identified_tracks.add(track_id)
+        identities.append((student_id, similarity))
+    return identities
+
+
 class CameraWorker(QObject):
     """
-    A worker that captures video frames. It's designed to live in a
-    long-running QThread.
+    A worker that captures video frames from a camera, stream, file or
+    recording (see `create_source`). It's designed to live in a long-running QThread.
+
+    Frames are delivered latest-wins: each processed frame replaces the one
+    waiting in a single slot, and `frame_ready` is only emitted when the slot
+    was empty. A slow consumer therefore drops stale frames instead of
+    building up a queue of signals. Consumers call `take_latest_frame` when
+    `frame_ready` fires.
+
+    The capture loop itself is a `RecognitionPipeline`, shared with the
+    headless daemon. Stage latencies (capture, the analyzer's stages, overlays
+    and the time a frame waits for the GUI) are recorded in `metrics`.
+
+    With a `db_manager`, tracks are identified against the student gallery
+    by `TrackFusion`, like in the daemon's `RecognitionService`: committed
+    faces are labelled in the frame results and `identity_committed`
+    (student ID, similarity) is emitted once per identified track.
     """
-    frame_ready = pyqtSignal(np.ndarray, list)
+    frame_ready = pyqtSignal()
+    identity_committed = pyqtSignal(str, float)
     error = pyqtSignal(str)
     finished = pyqtSignal()
 
-    def __init__(self, face_analyzer: FaceAnalyzer, camera_index=0):
+    def __init__(self, face_analyzer: FaceAnalyzer, source: Union[int, str] = 0, metrics: LatencyMetrics = None,
+                 capture_config: CaptureConfig = None, db_manager: DatabaseManager = None,
+                 recognition_config: RecognitionConfig = None):
         super().__init__()
-        self.camera_index = camera_index
-        self._is_running = False
+        self.source = source
         self.face_analyzer = face_analyzer
+        self.db_manager = db_manager
+        self.metrics = metrics or LatencyMetrics(f"camera{source}", enabled=False)
+        self.fusion = TrackFusion(self._search, recognition_config) if db_manager is not None else None
+        self.pipeline = RecognitionPipeline(
+            face_analyzer, create_source(source, capture_config=capture_config), metrics=self.metrics,
+            on_frame=self.frame_ready.emit, on_faces=self._identify
+        )
+
+        self._identifying = False
+
+    @property
+    def dropped_frames(self) -> int:
+        return self.pipeline.dropped_frames
+
+    def take_latest_frame(self) -> tuple[np.ndarray, FrameResult] | None:
+        """
+        Returns the newest (frame, result) pair and empties the slot, or None
+        if no new frame arrived since the last call. Safe to call from any thread.
+        """
+        return self.pipeline.take_latest_frame()
 
     @pyqtSlot()
     def start_capture(self):
@@ -31,32 +91,23 @@ class CameraWorker(QObject):
         Starts the camera capture loop. This is a slot that can be
         triggered from the main thread.
         """
-        if self._is_running:
+        if self.pipeline.is_running:
             return
 
-        self._is_running = True
-        cap = cv2.VideoCapture(self.camera_index)
-        
-        if not cap.isOpened():
-            self.error.emit(f"Error: Could not open camera with index {self.camera_index}.")
-            self._is_running = False
-            self.finished.emit()
-            return
-        
-        while self._is_running:
-            ret, frame = cap.read()
-            if not ret:
-                self.error.emit("Error: Could not read frame from camera.")
-                self._is_running = False
-                break
-
-            processed_frame, faces = self.face_analyzer.process_frame(frame)
-            
-            self.frame_ready.emit(processed_frame, faces)
-
-        if cap.isOpened():
-            cap.release()
-            
+        self._identifying = self.fusion is not None
+        if self._identifying and self.face_analyzer.embedding_model:
+            try:
+                self.db_manager.check_gallery_model(self.face_analyzer.embedding_model)
+            except GalleryModelError as e:
+                logger.error(f"Not identifying students: {e}")
+                self._identifying = False
+
+        error = self.pipeline.run()
+        if self._identifying:
+            self._emit_identities(self.fusion.finish(self.pipeline.frames_processed))
+        if error:
+            self.error.emit(error)
+
         self.finished.emit()
         logger.info("Camera worker loop has finished.")
 
@@ -65,4 +116,106 @@ class CameraWorker(QObject):
         Stops the camera capture loop. This can be called from any thread.
         """
         logger.info("Stopping camera worker...")
-        self._is_running = False
\ No newline at end of file
+        self.pipeline.stop()
+
+    def _identify(self, frame: np.ndarray, faces: list):
+        if not self._identifying:
+            return
+        with self.metrics.time("fusion"):
+            committed = self.fusion.update(self.pipeline.frames_processed, faces)
+        self._emit_identities(committed)
+
+    def _search(self, embedding: np.ndarray):
+        with self.metrics.time("search"):
+            matches = self.db_manager.find_similar_student_rows(embedding, k=1, scope=self.fusion.config.scope)
+        return matches[0] if matches else None
+
+    def _emit_identities(self, identities: list[TrackIdentity]):
+        for identity in identities:
+            logger.info(f"Track {identity.track_id} identified as {identity.student_id or 'unknown'} "
+                        f"({identity.votes}/{identity.searches} votes over {identity.samples} faces)")
+            if identity.student_id is not None:
+                similarity = identity.similarity if identity.similarity is not None else float("nan")
+                self.identity_committed.emit(identity.student_id, similarity)
+
+
+class RemoteCameraWorker(QObject):
+    """
+    A drop-in replacement for `CameraWorker` that shows the feed of a running
+    recognition daemon instead of capturing locally, making the GUI a thin
+    client. Like `CameraWorker` it lives in a QThread; its loop long-polls the
+    daemon for frames newer than the last one received.
+
+    `identity_committed` (student ID, similarity) is emitted once per track,
+    for the first received frame in which the daemon labels it with a student.
+    """
+    frame_ready = pyqtSignal()
+    identity_committed = pyqtSignal(str, float)
+    error = pyqtSignal(str)
+    finished = pyqtSignal()
+
+    def __init__(self, socket_path: str, metrics: LatencyMetrics = None):
+        super().__init__()
+        self.socket_path = socket_path
+        self.metrics = metrics or LatencyMetrics("remote", enabled=False)
+        self.dropped_frames = 0
+
+        self._is_running = False
+        self._identified_tracks = set()
+        self._latest_lock = threading.Lock()
+        self._latest = None
+
+    def take_latest_frame(self) -> tuple[np.ndarray, FrameResult] | None:
+        with self._latest_lock:
+            latest, self._latest = self._latest, None
+        return latest
+
+    @pyqtSlot()
+    def start_capture(self):
+        """Asks the daemon to capture and follows its frames until `stop` is called."""
+        if self._is_running:
+            return
+
+        from service.ipc_client import DaemonClient, DaemonError
+
+        self._is_running = True
+        client = DaemonClient(self.socket_path)
+        try:
+            client.start()
+            sequence = 0
+            while self._is_running:
+                with self.metrics.time("remote frame"):
+                    latest = client.latest_frame(after=sequence, timeout=1.0)
+                if latest is None:
+                    if not client.status()["running"]:
+                        self.error.emit("The daemon stopped capturing.")
+                        break
+                    continue
+                sequence, frame, result = latest
+                self._publish(frame, result)
+        except DaemonError as e:
+            self.error.emit(f"Error: {e}")
+        finally:
+            self._is_running = False
+            client.close()
+
+        self.finished.emit()
+        logger.info("Remote camera worker loop has finished.")
+
+    def stop(self):
+        """Stops following the daemon's feed. The daemon itself keeps running."""
+        logger.info("Stopping remote camera worker...")
+        self._is_running = False
+
+    def _publish(self, frame: np.ndarray, result: FrameResult):
+        for student_id, similarity in new_identities(result, self._identified_tracks):
+            self.identity_committed.emit(student_id, similarity)
+
+        with self._latest_lock:
+            is_pending = self._latest is not None
+            if is_pending:
+                self.dropped_frames += 1
+            self._latest = (frame, result)
+
+        if not is_pending:
+            self.frame_ready.emit()
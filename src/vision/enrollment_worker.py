@@ -0,0 +1,117 @@
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
+import numpy as np
+import os
+import shutil
+import uuid
+
+from .face_analyzer import FaceAnalyzer
+from .image_decoding import decode_image, thumbnail_path_for
+from database.database_manager import DatabaseManager
+from database.db_models import Student
+
+from logging import getLogger
+
+
+logger = getLogger(__name__)
+
+
+class EnrollmentWorker(QObject):
+    """
+    A worker that enrolls students from profile photos. It's designed to live
+    in its own QThread: requests queued through `enroll` run one after another
+    on that thread, so the GUI and the camera feed keep running meanwhile.
+
+    Each job decodes the photo at reduced resolution (with its UI thumbnail),
+    detects faces, checks the chosen face's quality, embeds it, copies the photo
+    and thumbnail into `students_dir` and stores the student through
+    `DatabaseManager.add_student`.
+    """
+    progress = pyqtSignal(str, str, int)
+    job_finished = pyqtSignal(str, bool, str)
+
+    def __init__(self, face_analyzer: FaceAnalyzer, db_manager: DatabaseManager,
+                 students_dir: str = "data/students", min_face_size: int = 64, min_det_score: float = 0.6,
+                 decode_size: int = 1024, thumbnail_size: int = 96):
+        super().__init__()
+        self.face_analyzer = face_analyzer
+        self.db_manager = db_manager
+        self.students_dir = students_dir
+        self.min_face_size = min_face_size
+        self.min_det_score = min_det_score
+        self.decode_size = decode_size
+        self.thumbnail_size = thumbnail_size
+
+    @pyqtSlot(str, str, str)
+    def enroll(self, job_id: str, student_name: str, image_path: str):
+        """
+        Runs one enrollment job, reporting through `progress` and `job_finished`.
+
+        Args:
+            job_id: An identifier echoed back in every signal of this job.
+            student_name: The name of the student.
+            image_path: Path to the student's profile photo.
+        """
+        try:
+            success, message = self._run(job_id, student_name, image_path)
+        except Exception as e:
+            logger.error(f"Enrollment of '{student_name}' failed: {e}")
+            success, message = False, f"Enrollment of '{student_name}' failed: {e}"
+
+        self.job_finished.emit(job_id, success, message)
+
+    def _run(self, job_id: str, student_name: str, image_path: str) -> tuple[bool, str]:
+        self.progress.emit(job_id, "Decoding image", 10)
+        decoded = decode_image(image_path, target_size=self.decode_size, thumbnail_size=self.thumbnail_size)
+        image = decoded.image
+
+        self.progress.emit(job_id, "Detecting and embedding faces", 30)
+        faces = self.face_analyzer.detect_faces(image)
+        if not faces:
+            logger.warning(f"No Faces Found in profile image of '{student_name}', Skipping student.")
+            return False, "No Faces Found in profile image, Skipping student."
+        if len(faces) > 1:
+            logger.warning(f"{len(faces)} faces found in profile image of '{student_name}', using the largest one.")
+
+        self.progress.emit(job_id, "Checking face quality", 60)
+        face = max(faces, key=lambda f: (f.bbox[2] - f.bbox[0]) * (f.bbox[3] - f.bbox[1]))
+        face_size = min(face.bbox[2] - face.bbox[0], face.bbox[3] - face.bbox[1])
+        if face.det_score < self.min_det_score or face_size < self.min_face_size:
+            return False, (f"Face in profile image is too small or unclear "
+                           f"({face_size:.0f}px, score {face.det_score:.2f}), Skipping student.")
+
+        self.progress.emit(job_id, "Saving student", 80)
+        student_id = str(uuid.uuid4())
+        stored_image_path = self._store_image(student_id, image_path, decoded.thumbnail)
+        student = Student(
+            student_id=student_id,
+            student_name=student_name,
+            student_image_path=stored_image_path,
+            student_face_embedding=face.normed_embedding.astype(np.float32),
+            embedding_model=self.face_analyzer.embedding_model
+        )
+        if not self.db_manager.add_student(student):
+            self._remove_stored_image(stored_image_path)
+            return False, f"Student '{student_name}' could not be saved."
+
+        self.progress.emit(job_id, "Done", 100)
+        return True, f"Student '{student_name}' enrolled."
+
+    def _store_image(self, student_id: str, image_path: str, thumbnail: np.ndarray) -> str:
+        os.makedirs(self.students_dir, exist_ok=True)
+        extension = os.path.splitext(image_path)[1].lower() or ".jpg"
+        stored_image_path = os.path.join(self.students_dir, f"{student_id}{extension}")
+        shutil.copyfile(image_path, stored_image_path)
+
+        import cv2
+        if thumbnail is not None and not cv2.imwrite(thumbnail_path_for(stored_image_path), thumbnail):
+            # The UI falls back to the photo itself when there is no thumbnail
+            logger.warning(f"Could not write the thumbnail of '{stored_image_path}'.")
+        return stored_image_path
+
+    @staticmethod
+    def _remove_stored_image(stored_image_path: str):
+        for path in (stored_image_path, thumbnail_path_for(stored_image_path)):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
@@ -1,10 +1,13 @@
-import cv2
 import numpy as np
-from PIL.Image import Image as PILImage
-from insightface.app import FaceAnalysis
-from sort_tracker import Sort
 
 import logging
+import time
+
+from .face_quality import score_faces
+from .frame_result import FACE_DTYPE, NO_TRACK, FrameResult
+from .model_loader import load_face_analysis
+from utils.config import ModelConfig, OnnxRuntimeConfig, QualityConfig, TrackingConfig, load_config
+from utils.latency import LatencyMetrics
 
 
 logger = logging.getLogger(__name__)
@@ -13,30 +16,72 @@ logger = logging.getLogger(__name__)
 class FaceAnalyzer:
     """
     A class to handle face detection and recognition using InsightFace.
+
+    OpenCV, InsightFace, ONNX Runtime and the tracker are imported on first use
+    (in `prepare`, on the loading thread) rather than at application start.
+
+    `process_frame` scores every detected face (`face_quality.score_faces`)
+    and only runs the landmark, attribute and recognition models on faces
+    that pass `quality_config`; the others have no embedding.
+
+    Faces are tracked with the backend chosen in `tracking_config`, by default
+    the vectorized `KalmanTracker`.
     """
-    def __init__(self):
+    def __init__(self, quality_config: QualityConfig = None, tracking_config: TrackingConfig = None):
         self.app = None
-
-        self.tracker = Sort(max_age=20, min_hits=3, iou_threshold=0.3)
+        self.tracker = None
+        self.embedding_model = None
+        self.metrics = LatencyMetrics("analyzer", enabled=False)
+        self.quality_config = quality_config or load_config().quality
+        self.tracking_config = tracking_config or load_config().tracking
         
-    def prepare(self, providers=['CUDAExecutionProvider', 'CPUExecutionProvider']):
+    def prepare(self, session_config: OnnxRuntimeConfig = None, model_config: ModelConfig = None):
         """
         Loads the InsightFace models. This can take some time.
         
         Args:
-            providers: A list of ONNX Runtime execution providers.
-                       Defaults to ['CPUExecutionProvider'].
-                       Use ['CUDAExecutionProvider', 'CPUExecutionProvider'] for GPU.
+            session_config: ONNX Runtime session settings (providers, thread counts,
+                            optimization level, ...). Defaults to the `onnxruntime`
+                            section of the deployment config.
+            model_config: The model pack, detector size and whether to use the
+                          int8 variants. Defaults to the `models` section.
         """
         if self.app is not None:
             return
             
+        session_config = session_config or load_config().onnxruntime
+        model_config = model_config or load_config().models
         logger.info("Loading InsightFace models... This may take a moment.")
-        self.app = FaceAnalysis(name='buffalo_l', root="./model_cache", providers=providers)
-        self.app.prepare(ctx_id=0, det_size=(640, 640))
-        logger.info("InsightFace models loaded.")
+        logger.info(f"ONNX Runtime session settings: {session_config.model_dump()}")
+        start = time.perf_counter()
+
+        self.tracker = self.create_tracker()
+        imported = time.perf_counter()
 
-    def get_face_embeddings(self, image: np.ndarray | PILImage) -> list[np.ndarray]:
+        app = load_face_analysis(name=model_config.name, root=model_config.root,
+                                 session_config=session_config, quantized=model_config.quantized)
+        loaded = time.perf_counter()
+
+        app.prepare(ctx_id=0, det_size=(model_config.det_size, model_config.det_size))
+        self.app = app
+        self.embedding_model = model_config.embedding_model
+        prepared = time.perf_counter()
+
+        logger.info(f"InsightFace models loaded in {(prepared - start) * 1000:.0f} ms "
+                    f"(imports {(imported - start) * 1000:.0f} ms, sessions {(loaded - imported) * 1000:.0f} ms, "
+                    f"prepare {(prepared - loaded) * 1000:.0f} ms).")
+
+    def create_tracker(self):
+        """Returns a new tracker of the configured backend, both following the `Sort.update` contract."""
+        tracking = self.tracking_config
+        if tracking.backend == "sort":
+            from sort_tracker import Sort
+            return Sort(max_age=tracking.max_age, min_hits=tracking.min_hits, iou_threshold=tracking.iou_threshold)
+
+        from .kalman_tracker import KalmanTracker
+        return KalmanTracker(max_age=tracking.max_age, min_hits=tracking.min_hits, iou_threshold=tracking.iou_threshold)
+
+    def get_face_embeddings(self, image) -> list[np.ndarray]:
         """
         Processes a single image to return face embeddings.
 
@@ -48,35 +93,84 @@ class FaceAnalyzer:
             - The face embeddings found in the image.
         """
 
-        if isinstance(image, PILImage):
+        if not isinstance(image, np.ndarray):
+            import cv2
             image = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
         
+        return [face.embedding for face in self.detect_faces(image)]
+
+    def detect_faces(self, image: np.ndarray) -> list:
+        """
+        Detects and embeds every face in a single BGR image, without tracking.
+
+        Returns:
+            A list of 'face' objects from InsightFace, empty if the models are not loaded.
+        """
         if self.app is None:
-            return image, []
+            return []
+
+        return self.app.get(image)
+
+    def embed_largest_faces(self, images: list[np.ndarray], min_face_size: float = 0,
+                            min_det_score: float = 0) -> list[np.ndarray | None]:
+        """
+        Embeds the largest face of each image, e.g. a batch of profile photos.
+
+        Detection runs per image, but the aligned crops of all images go through
+        the recognition model in a single batched call. Only the detector and
+        the recognition model run.
+
+        Returns:
+            One normalized embedding per image, None where no face of at least
+            `min_face_size` pixels and `min_det_score` was found.
+        """
+        from insightface.utils import face_align
 
-        faces = self.app.get(image)
+        recognition = self.app.models['recognition']
+        crops, owners = [], []
+        for i, image in enumerate(images):
+            bboxes, kpss = self.app.det_model.detect(image, max_num=0, metric='default')
+            if bboxes.shape[0] == 0 or kpss is None:
+                continue
+            widths, heights = bboxes[:, 2] - bboxes[:, 0], bboxes[:, 3] - bboxes[:, 1]
+            largest = int(np.argmax(widths * heights))
+            if min(widths[largest], heights[largest]) < min_face_size or bboxes[largest, 4] < min_det_score:
+                continue
+            crops.append(face_align.norm_crop(image, landmark=kpss[largest], image_size=recognition.input_size[0]))
+            owners.append(i)
 
-        return [face.embedding for face in faces]
+        embeddings = [None] * len(images)
+        if crops:
+            features = recognition.get_feat(crops)
+            features /= np.linalg.norm(features, axis=1, keepdims=True)
+            for i, feature in zip(owners, features.astype(np.float32)):
+                embeddings[i] = feature
+        return embeddings
 
-    def process_frame(self, frame: np.ndarray) -> tuple[np.ndarray, list]:
+    def process_frame(self, frame: np.ndarray, metrics: LatencyMetrics = None) -> tuple[np.ndarray, list]:
         """
         Processes a frame to detect and analyze faces.
 
         Args:
             frame: The input video frame as a NumPy array.
+            metrics: Where to record the detection, recognition, tracking and
+                     association times. Defaults to `self.metrics`.
 
         Returns:
             A tuple containing:
-            - The frame with bounding boxes and information drawn on it.
+            - The input frame, left unmodified. Use `build_frame_result` to get
+              the boxes and labels to paint over it.
             - A list of 'face' objects from InsightFace for each detected face.
         """
         if self.app is None:
             return frame, []
 
-        faces = self.app.get(frame)
+        metrics = metrics or self.metrics
+        faces = self._analyze(frame, metrics)
 
         if not faces:
-            tracked_objects = self.tracker.update(np.empty((0, 5)))
+            with metrics.time("tracking"):
+                tracked_objects = self.tracker.update(np.empty((0, 5)))
             return frame, []
 
         detections = np.array([
@@ -84,35 +178,101 @@ class FaceAnalyzer:
             for face in faces
         ])
 
-        tracked_objects = self.tracker.update(detections)
+        with metrics.time("tracking"):
+            tracked_objects = self.tracker.update(detections)
 
-        self.associate_tracker_ids(faces, tracked_objects)
-        
-        processed_frame = self.draw_on_frame(frame, faces)
+        with metrics.time("association"):
+            self.associate_tracker_ids(faces, tracked_objects)
 
-        return processed_frame, faces
+        return frame, faces
+
+    def _analyze(self, image: np.ndarray, metrics: LatencyMetrics) -> list:
+        """
+        Same as `FaceAnalysis.get`, split so detection and the per-face models
+        (landmarks, attributes, recognition) are timed separately, and with the
+        per-face models skipped for faces failing the quality gate.
+
+        Every face gets `quality` (0-1), `quality_passed` and, when it failed,
+        `quality_reason`.
+        """
+        from insightface.app.common import Face
+
+        with metrics.time("detection"):
+            bboxes, kpss = self.app.det_model.detect(image, max_num=0, metric='default')
+
+        with metrics.time("quality"):
+            quality = score_faces(image, bboxes[:, 0:4], bboxes[:, 4], kpss, self.quality_config)
+
+        faces = []
+        with metrics.time("recognition"):
+            for i in range(bboxes.shape[0]):
+                face = Face(bbox=bboxes[i, 0:4], kps=kpss[i] if kpss is not None else None, det_score=bboxes[i, 4])
+                face.quality = float(quality.score[i])
+                face.quality_passed = bool(quality.passed[i])
+                if face.quality_passed:
+                    for taskname, model in self.app.models.items():
+                        if taskname == 'detection':
+                            continue
+                        model.get(image, face)
+                else:
+                    face.quality_reason = quality.reasons[i]
+                faces.append(face)
+        return faces
+
+    def build_frame_result(self, faces: list) -> FrameResult:
+        """
+        Reduces the detected faces to the compact `FrameResult` handed to other
+        threads. Faces identified by a recognizer (a `student_name` attribute)
+        are labelled with the name, faces that failed the quality gate with the
+        reason.
+        """
+        if not faces:
+            return FrameResult.EMPTY
+
+        records = np.empty(len(faces), dtype=FACE_DTYPE)
+        student_ids, labels = [], []
+        for i, face in enumerate(faces):
+            track_id = face.track_id
+            similarity = getattr(face, "similarity", None)
+            quality = getattr(face, "quality", None)
+            records[i] = (
+                face.bbox[:4], face.det_score, NO_TRACK if track_id is None else track_id,
+                np.nan if similarity is None else similarity, np.nan if quality is None else quality,
+            )
+
+            student_name = getattr(face, "student_name", None)
+            label = f"{face.det_score * 100:.2f}% id: {track_id}"
+            quality_reason = getattr(face, "quality_reason", None)
+            if quality_reason:
+                label = f"{label} ({quality_reason})"
+            student_ids.append(getattr(face, "student_id", None))
+            labels.append(f"{student_name} ({label})" if student_name else label)
+        return FrameResult(records, student_ids, labels)
     
     def associate_tracker_ids(self, faces, tracked_objects):
         """
-        Assigns the track_id from SORT to the corresponding insightface Face object.
+        Assigns the track_id from the tracker to the corresponding insightface Face object.
+        The id is the last column of each tracked row.
+
+        Each face, in order, takes the unclaimed track overlapping it most, if
+        their IoU exceeds 0.3. The IoUs of all pairs are computed at once.
         """
-        
-        unmatched_tracks = list(tracked_objects)
+        from .kalman_tracker import iou_matrix
 
-        for face in faces:
-            best_match_iou = 0
-            best_match_track = None
-            
-            for track in unmatched_tracks:
-                track_bbox = track[:4]
-                iou = self.calculate_iou(face.bbox, track_bbox)
-                if iou > best_match_iou:
-                    best_match_iou = iou
-                    best_match_track = track
-            
-            if best_match_track is not None and best_match_iou > 0.3:
-                face.track_id = int(best_match_track[4])
-                unmatched_tracks.remove(best_match_track)
+        if len(tracked_objects) == 0:
+            for face in faces:
+                face.track_id = None
+            return
+
+        tracked_objects = np.asarray(tracked_objects)
+        ious = iou_matrix(np.array([face.bbox[:4] for face in faces]), tracked_objects)
+        unclaimed = np.ones(len(tracked_objects), dtype=bool)
+        for face, face_ious in zip(faces, ious):
+            face_ious = np.where(unclaimed, face_ious, 0)
+            best = int(np.argmax(face_ious))
+            if face_ious[best] > 0.3:
+                face.track_id = int(tracked_objects[best, -1])
+                unclaimed[best] = False
             else:
                 face.track_id = None
 
@@ -133,7 +293,12 @@ class FaceAnalyzer:
     def draw_on_frame(self, frame: np.ndarray, faces: list):
         """
         Draws bounding boxes and keypoints on the frame.
+
+        The live view paints `build_frame_result` output with QPainter instead; this is
+        kept for writing annotated frames to disk.
         """
+        import cv2
+
         for face in faces:
             bbox = face.bbox.astype(int)
             cv2.rectangle(frame, (bbox[0], bbox[1]), (bbox[2], bbox[3]), (0, 255, 0), 2)
@@ -0,0 +1,140 @@
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+from utils.config import QualityConfig
+
+
+# Where the nose tip sits between the eyes (0) and the mouth (1) on a frontal face
+FRONTAL_NOSE_HEIGHT = 0.55
+
+
+class FaceQuality(NamedTuple):
+    """Quality measures of N detected faces, one array entry per face"""
+
+    size: np.ndarray
+    det_score: np.ndarray
+    yaw: np.ndarray
+    pitch: np.ndarray
+    sharpness: np.ndarray
+    score: np.ndarray
+    passed: np.ndarray
+    reasons: list
+
+
+def estimate_pose(kpss: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Estimates how far faces are turned from their 5 detector landmarks
+    (left eye, right eye, nose, left and right mouth corner).
+
+    Returns:
+        (yaw, pitch): Yaw is the nose's horizontal offset from the eye midpoint
+        relative to the eye distance, pitch is its vertical offset from where
+        it sits on a frontal face relative to the eye-to-mouth distance. Both
+        are 0 for a frontal face and grow towards +-0.5 for a profile view.
+    """
+    left_eye, right_eye, nose = kpss[:, 0], kpss[:, 1], kpss[:, 2]
+    mouth = (kpss[:, 3] + kpss[:, 4]) / 2
+    eyes = (left_eye + right_eye) / 2
+
+    eye_distance = np.maximum(np.linalg.norm(right_eye - left_eye, axis=1), 1e-6)
+    face_height = np.maximum(np.linalg.norm(mouth - eyes, axis=1), 1e-6)
+
+    # Rotate into the eye line's frame so in-plane roll doesn't count as yaw
+    eye_axis = (right_eye - left_eye) / eye_distance[:, None]
+    up_axis = np.stack([-eye_axis[:, 1], eye_axis[:, 0]], axis=1)
+    nose_offset = nose - eyes
+
+    yaw = np.einsum("ij,ij->i", nose_offset, eye_axis) / eye_distance
+    pitch = np.einsum("ij,ij->i", nose_offset, up_axis) / face_height - FRONTAL_NOSE_HEIGHT
+    return yaw, pitch
+
+
+def sharpness(image: np.ndarray, bboxes: np.ndarray, size: int = 64) -> np.ndarray:
+    """
+    Returns the variance of the Laplacian of each face crop, resized to
+    `size` x `size` grayscale so the measure doesn't depend on face size.
+    Low values mean a blurred or out-of-focus face.
+    """
+    import cv2
+
+    if len(bboxes) == 0:
+        return np.empty(0)
+
+    h, w = image.shape[:2]
+    boxes = np.round(bboxes).astype(int)
+    boxes[:, [0, 2]] = np.clip(boxes[:, [0, 2]], 0, w)
+    boxes[:, [1, 3]] = np.clip(boxes[:, [1, 3]], 0, h)
+
+    crops = np.zeros((len(boxes), size, size), dtype=np.float32)
+    for i, (x1, y1, x2, y2) in enumerate(boxes):
+        if x2 - x1 < 2 or y2 - y1 < 2:
+            continue
+        crop = cv2.resize(image[y1:y2, x1:x2], (size, size), interpolation=cv2.INTER_AREA)
+        crops[i] = cv2.cvtColor(crop, cv2.COLOR_BGR2GRAY) if crop.ndim == 3 else crop
+
+    # 4-neighbour Laplacian over the interior of every crop at once
+    laplacian = (crops[:, :-2, 1:-1] + crops[:, 2:, 1:-1] + crops[:, 1:-1, :-2] + crops[:, 1:-1, 2:]
+                 - 4 * crops[:, 1:-1, 1:-1])
+    return laplacian.reshape(len(boxes), -1).var(axis=1)
+
+
+def score_faces(image: np.ndarray, bboxes: np.ndarray, det_scores: np.ndarray, kpss: Optional[np.ndarray],
+                config: QualityConfig) -> FaceQuality:
+    """
+    Scores detected faces and decides which are worth embedding and searching.
+
+    A face passes when it is at least `min_face_size` pixels, scored at least
+    `min_det_score` by the detector, turned less than `max_yaw`/`max_pitch`
+    and sharper than `min_sharpness`. Sharpness is only measured for faces
+    that pass the other checks. With `enabled` off every face passes, but is
+    still scored. `score` combines the measures into 0-1 to rank faces, e.g.
+    when fusing embeddings over time.
+
+    Args:
+        image: The BGR frame.
+        bboxes: (N, 4) boxes as x1, y1, x2, y2.
+        det_scores: (N,) detector scores.
+        kpss: (N, 5, 2) detector landmarks, or None if the detector has none.
+        config: The thresholds.
+    """
+    bboxes = np.asarray(bboxes, dtype=np.float32).reshape(-1, 4)
+    det_scores = np.asarray(det_scores, dtype=np.float32).reshape(-1)
+    n = len(bboxes)
+
+    size = np.minimum(bboxes[:, 2] - bboxes[:, 0], bboxes[:, 3] - bboxes[:, 1])
+    if kpss is not None and n:
+        yaw, pitch = estimate_pose(np.asarray(kpss, dtype=np.float32).reshape(n, 5, 2))
+    else:
+        yaw, pitch = np.zeros(n, dtype=np.float32), np.zeros(n, dtype=np.float32)
+
+    checks = {
+        "small": size < config.min_face_size,
+        "low score": det_scores < config.min_det_score,
+        "turned": (np.abs(yaw) > config.max_yaw) | (np.abs(pitch) > config.max_pitch),
+    }
+    passed = ~np.logical_or.reduce(list(checks.values())) if n else np.zeros(0, dtype=bool)
+
+    blur = np.full(n, np.nan, dtype=np.float32)
+    if passed.any():
+        blur[passed] = sharpness(image, bboxes[passed], config.sharpness_size)
+    checks["blurred"] = np.zeros(n, dtype=bool)
+    checks["blurred"][passed] = blur[passed] < config.min_sharpness
+    passed &= ~checks["blurred"]
+    if not config.enabled:
+        passed = np.ones(n, dtype=bool)
+
+    # Each factor reaches 1 at twice its threshold (half the allowed angle for pose)
+    score = (
+        det_scores
+        * np.clip(size / max(2 * config.min_face_size, 1e-6), 0, 1)
+        * np.clip(1 - np.abs(yaw) / (2 * config.max_yaw), 0, 1)
+        * np.clip(1 - np.abs(pitch) / (2 * config.max_pitch), 0, 1)
+        * np.where(np.isnan(blur), 1.0, np.clip(blur / max(2 * config.min_sharpness, 1e-6), 0, 1))
+    )
+
+    reasons = [
+        ", ".join(reason for reason, failed in checks.items() if failed[i])
+        for i in range(n)
+    ]
+    return FaceQuality(size, det_scores, yaw, pitch, blur, score.astype(np.float32), passed, reasons)
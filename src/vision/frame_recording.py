@@ -0,0 +1,285 @@
+import json
+import struct
+import threading
+import time
+from datetime import datetime
+from typing import Literal, Optional
+
+import numpy as np
+
+from logging import getLogger
+
+
+logger = getLogger(__name__)
+
+RECORDING_SUFFIX = ".frames"
+
+_MAGIC = b"FRAMEREC"
+_VERSION = 1
+_FILE_HEADER = struct.Struct("<8sII")      # magic, version, metadata length
+_CHUNK_HEADER = struct.Struct("<4sIQ")     # magic, frames, chunk length in bytes (0 while being written)
+_CHUNK_MAGIC = b"CHNK"
+_ALIGNMENT = 64
+
+# One record per frame in its chunk's header. Offsets are from the start of the file.
+INDEX_DTYPE = np.dtype([("timestamp", "<f8"), ("offset", "<u8"), ("size", "<u8")])
+
+Compression = Literal["none", "png"]
+
+
+def is_recording(source) -> bool:
+    return isinstance(source, str) and source.lower().endswith(RECORDING_SUFFIX)
+
+
+def _padding(position: int) -> bytes:
+    return b"\0" * (-position % _ALIGNMENT)
+
+
+class FrameRecorder:
+    """
+    Writes frames and their capture timestamps to a recording that
+    `FrameRecording` memory-maps and `ReplaySource` plays back.
+
+    The file is a JSON header (frame shape, compression, source) followed by
+    chunks of up to `chunk_frames` frames. Each chunk starts with its frame
+    index (timestamp, offset, size per frame), patched in when the chunk is
+    complete, so a recording cut short by a crash keeps every complete chunk.
+    Frames are stored raw (`compression="none"`, mapped without decoding) or
+    as PNG (lossless, a fraction of the size, decoded on read), each aligned
+    to 64 bytes.
+
+    Timestamps default to the seconds since the first frame was written.
+    """
+    def __init__(self, path: str, compression: Compression = "none", chunk_frames: int = 30, source: str = None):
+        if compression not in ("none", "png"):
+            raise ValueError(f"Unknown compression '{compression}', use 'none' or 'png'.")
+        self.path = path
+        self.compression = compression
+        self.chunk_frames = chunk_frames
+        self.source = source
+        self.frames_written = 0
+        self.shape = None
+
+        self._file = open(path, "wb")
+        self._start_time = None
+        self._chunk_start = None
+        self._chunk_index = []
+
+    def __enter__(self) -> "FrameRecorder":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def write(self, frame: np.ndarray, timestamp: Optional[float] = None):
+        """
+        Appends a frame. All frames of a recording must have the same shape.
+
+        Args:
+            frame: An (H, W, 3) uint8 BGR image.
+            timestamp: Seconds on any clock, defaults to the time since the first frame.
+        """
+        if timestamp is None:
+            now = time.perf_counter()
+            if self._start_time is None:
+                self._start_time = now
+            timestamp = now - self._start_time
+
+        if self.shape is None:
+            self.shape = frame.shape
+            self._write_header()
+        elif frame.shape != self.shape:
+            raise ValueError(f"Frame shape {frame.shape} differs from the recording's {self.shape}.")
+
+        if self.compression == "png":
+            import cv2
+            ok, encoded = cv2.imencode(".png", frame, [cv2.IMWRITE_PNG_COMPRESSION, 1])
+            if not ok:
+                raise ValueError("Could not encode the frame as PNG.")
+            payload = encoded.data
+        else:
+            payload = np.ascontiguousarray(frame, dtype=np.uint8).data
+
+        if self._chunk_start is None:
+            self._start_chunk()
+        offset = self._file.tell()
+        self._file.write(payload)
+        self._file.write(_padding(payload.nbytes))
+        self._chunk_index.append((timestamp, offset, payload.nbytes))
+        self.frames_written += 1
+        if len(self._chunk_index) == self.chunk_frames:
+            self._finish_chunk()
+
+    def close(self):
+        if self._file.closed:
+            return
+        if self._chunk_start is not None:
+            self._finish_chunk()
+        self._file.close()
+
+    def _write_header(self):
+        height, width, channels = self.shape
+        metadata = json.dumps({
+            "width": width,
+            "height": height,
+            "channels": channels,
+            "compression": self.compression,
+            "source": self.source,
+            "created": datetime.now().isoformat(timespec="seconds"),
+        }).encode()
+        header = _FILE_HEADER.pack(_MAGIC, _VERSION, len(metadata)) + metadata
+        self._file.write(header + _padding(len(header)))
+
+    def _start_chunk(self):
+        self._chunk_start = self._file.tell()
+        reserved = _CHUNK_HEADER.size + self.chunk_frames * INDEX_DTYPE.itemsize
+        self._file.write(b"\0" * (reserved + len(_padding(reserved))))
+
+    def _finish_chunk(self):
+        end = self._file.tell()
+        index = np.array(self._chunk_index, dtype=INDEX_DTYPE)
+        self._file.seek(self._chunk_start)
+        self._file.write(_CHUNK_HEADER.pack(_CHUNK_MAGIC, len(index), end - self._chunk_start) + index.tobytes())
+        self._file.seek(end)
+        self._file.flush()
+        self._chunk_start = None
+        self._chunk_index = []
+
+
+class FrameRecording:
+    """
+    A recording written by `FrameRecorder`, memory-mapped for reading.
+
+    Raw frames are returned as views of the mapping, so reading one costs no
+    copy and no decoding; the OS pages the file in on first access. The
+    mapping is copy-on-write, so writing to a frame never changes the file.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        # A plain array over the mapping, so frames aren't `np.memmap` instances
+        self._map = np.memmap(path, dtype=np.uint8, mode="c").view(np.ndarray)
+
+        magic, version, metadata_length = _FILE_HEADER.unpack_from(self._map, 0)
+        if magic != _MAGIC:
+            raise ValueError(f"{path} is not a frame recording.")
+        if version != _VERSION:
+            raise ValueError(f"{path} is a version {version} recording, expected {_VERSION}.")
+        self.metadata = json.loads(bytes(self._map[_FILE_HEADER.size:_FILE_HEADER.size + metadata_length]))
+        self.shape = (self.metadata["height"], self.metadata["width"], self.metadata["channels"])
+        self.compression = self.metadata["compression"]
+
+        header_length = _FILE_HEADER.size + metadata_length
+        self.index = self._read_index(header_length + len(_padding(header_length)))
+        self.timestamps = self.index["timestamp"]
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    @property
+    def duration(self) -> float:
+        return float(self.timestamps[-1] - self.timestamps[0]) if len(self) > 1 else 0.0
+
+    @property
+    def fps(self) -> float:
+        return (len(self) - 1) / self.duration if self.duration > 0 else 0.0
+
+    def frame(self, i: int) -> np.ndarray:
+        _, offset, size = self.index[i]
+        payload = self._map[offset:offset + size]
+        if self.compression == "png":
+            import cv2
+            return cv2.imdecode(payload, cv2.IMREAD_COLOR)
+        return payload.reshape(self.shape)
+
+    def close(self):
+        # The mapping is closed once the last frame view referencing it is gone
+        self._map = None
+
+    def _read_index(self, position: int) -> np.ndarray:
+        chunks = []
+        size = len(self._map)
+        while position + _CHUNK_HEADER.size <= size:
+            magic, frames, length = _CHUNK_HEADER.unpack_from(self._map, position)
+            if magic != _CHUNK_MAGIC or length == 0 or position + length > size:
+                logger.warning(f"{self.path} ends in an incomplete chunk, it was not closed properly.")
+                break
+            chunks.append(np.frombuffer(self._map, INDEX_DTYPE, count=frames, offset=position + _CHUNK_HEADER.size))
+            position += length
+        return np.concatenate(chunks) if chunks else np.empty(0, dtype=INDEX_DTYPE)
+
+
+class ReplaySource:
+    """
+    Plays a `FrameRecording` back into a `RecognitionPipeline` in place of a
+    `VideoSource`, so the same session can be processed again and again.
+
+    By default frames are delivered as fast as the consumer asks. With
+    `realtime`, each frame is held back until its recorded timestamp, so the
+    original capture timing (including its jitter and gaps) is reproduced.
+    With `loop`, the recording starts over when it ends.
+    """
+    is_file = True
+    is_stream = False
+    is_live = False
+    reconnects = 0
+
+    def __init__(self, path: str, realtime: bool = False, loop: bool = False):
+        self.source = path
+        self.realtime = realtime
+        self.loop = loop
+        self.fps = 0.0
+        self.recording = None
+
+        self._position = 0
+        self._clock_offset = 0.0
+        self._stopping = threading.Event()
+
+    def open(self) -> bool:
+        self._stopping.clear()
+        try:
+            self.recording = FrameRecording(self.source)
+        except (OSError, ValueError) as e:
+            logger.error(f"Could not open recording '{self.source}': {e}")
+            return False
+        self.fps = self.recording.fps
+        self._position = 0
+        self._restart_clock()
+        return len(self.recording) > 0
+
+    def read(self) -> tuple[bool, Optional[np.ndarray]]:
+        """Returns (True, frame), or (False, None) when the recording has ended or replay was stopped."""
+        recording = self.recording
+        if self._position == len(recording) and self.loop:
+            self._position = 0
+            self._restart_clock()
+        if self._position == len(recording) or self._stopping.is_set():
+            return False, None
+
+        if self.realtime:
+            delay = self._clock_offset + recording.timestamps[self._position] - time.perf_counter()
+            if delay > 0 and self._stopping.wait(delay):
+                return False, None
+            if delay < 0:
+                # Running behind, don't try to catch up with a burst of frames
+                self._clock_offset -= delay
+
+        frame = recording.frame(self._position)
+        self._position += 1
+        return True, frame
+
+    def stop(self):
+        """Makes a waiting `read` return. Can be called from any thread."""
+        self._stopping.set()
+
+    def release(self):
+        self.stop()
+        if self.recording is not None:
+            self.recording.close()
+
+    def describe(self) -> str:
+        return f"recording '{self.source}'"
+
+    def _restart_clock(self):
+        # Maps the recording's clock onto perf_counter, frame 0 being due now
+        first = self.recording.timestamps[0] if len(self.recording) else 0.0
+        self._clock_offset = time.perf_counter() - first
@@ -0,0 +1,75 @@
+from typing import Iterator, Optional
+
+import numpy as np
+
+
+# One record per face: everything the views and the daemon's clients read
+FACE_DTYPE = np.dtype([
+    ("box", np.float32, (4,)),
+    ("det_score", np.float32),
+    ("track_id", np.int32),
+    ("similarity", np.float32),
+    ("quality", np.float32),
+])
+
+NO_TRACK = -1
+
+
+class FrameResult:
+    """
+    The per-frame output handed from the pipeline thread to the GUI or the
+    daemon's clients, instead of InsightFace `Face` objects.
+
+    Boxes (x1, y1, x2, y2 in frame pixels), detector scores, track ids
+    (`NO_TRACK` when untracked), similarities and quality scores (NaN when
+    unknown) are one structured array, `faces`. Student ids and overlay labels
+    are the only per-face Python objects. Results are not modified after they
+    are published, so frames without faces all share `FrameResult.EMPTY`.
+    """
+    __slots__ = ("faces", "student_ids", "labels")
+
+    EMPTY: "FrameResult"
+
+    def __init__(self, faces: np.ndarray, student_ids: list[Optional[str]], labels: list[str]):
+        self.faces = faces
+        self.student_ids = student_ids
+        self.labels = labels
+
+    def __len__(self) -> int:
+        return len(self.faces)
+
+    @property
+    def boxes(self) -> np.ndarray:
+        return self.faces["box"]
+
+    def overlays(self) -> Iterator[tuple[float, float, float, float, str]]:
+        """Yields (x1, y1, x2, y2, label) per face, in frame pixel coordinates."""
+        for (x1, y1, x2, y2), label in zip(self.faces["box"].tolist(), self.labels):
+            yield x1, y1, x2, y2, label
+
+    def to_message(self) -> dict:
+        """Returns the result as JSON-serializable columns, see `from_message`."""
+        return {
+            "boxes": self.faces["box"].tolist(),
+            "det_scores": self.faces["det_score"].tolist(),
+            "track_ids": self.faces["track_id"].tolist(),
+            "similarities": [None if np.isnan(v) else v for v in self.faces["similarity"].tolist()],
+            "quality": [None if np.isnan(v) else v for v in self.faces["quality"].tolist()],
+            "student_ids": self.student_ids,
+            "labels": self.labels,
+        }
+
+    @classmethod
+    def from_message(cls, message: dict) -> "FrameResult":
+        if not message["labels"]:
+            return cls.EMPTY
+        faces = np.empty(len(message["labels"]), dtype=FACE_DTYPE)
+        faces["box"] = message["boxes"]
+        faces["det_score"] = message["det_scores"]
+        faces["track_id"] = message["track_ids"]
+        faces["similarity"] = [np.nan if v is None else v for v in message["similarities"]]
+        faces["quality"] = [np.nan if v is None else v for v in message["quality"]]
+        return cls(faces, list(message["student_ids"]), list(message["labels"]))
+
+
+FrameResult.EMPTY = FrameResult(np.empty(0, dtype=FACE_DTYPE), [], [])
@@ -0,0 +1,269 @@
+import sys
+import threading
+import time
+from typing import Optional, Union
+
+import numpy as np
+
+from utils.config import CaptureConfig
+from .frame_recording import ReplaySource, is_recording
+
+from logging import getLogger
+
+
+logger = getLogger(__name__)
+
+STREAM_SCHEMES = ("rtsp://", "rtsps://", "rtmp://", "http://", "https://", "udp://", "tcp://")
+
+
+def parse_source(source: Union[int, str]) -> Union[int, str]:
+    """Turns a camera index given as text (e.g. from the command line) into an int, leaving paths and URLs as is."""
+    if isinstance(source, str) and source.isdigit():
+        return int(source)
+    return source
+
+
+def is_stream_url(source: Union[int, str]) -> bool:
+    return isinstance(source, str) and source.lower().startswith(STREAM_SCHEMES)
+
+
+def create_source(source: Union[int, str], realtime: bool = False, loop: bool = False,
+                  capture_config: CaptureConfig = None) -> Union["VideoSource", ReplaySource]:
+    """Returns a `ReplaySource` for `.frames` recordings, else a `VideoSource`."""
+    if is_recording(source):
+        return ReplaySource(source, realtime=realtime, loop=loop)
+    return VideoSource(source, realtime=realtime, loop=loop, capture_config=capture_config)
+
+
+class FrameBufferPool:
+    """
+    Frame arrays that captures decode into again once nobody holds them.
+
+    Frames are handed to the analyzer, the GUI and the daemon's clients without
+    copies, so a buffer can only be reused when the pool holds the last
+    reference to it. At most `size` buffers are kept; frames read while all of
+    them are in use are allocated as usual and left to the garbage collector.
+    """
+    def __init__(self, size: int = 4):
+        self.size = size
+        self._buffers = []
+
+    def acquire(self) -> Optional[np.ndarray]:
+        """Returns a buffer no one else references, or None."""
+        for buffer in self._buffers:
+            # The pool's list, the loop variable and getrefcount's own argument
+            if sys.getrefcount(buffer) <= 3:
+                return buffer
+        return None
+
+    def keep(self, frame: np.ndarray):
+        """Adds a newly allocated frame to the pool if there is room."""
+        if len(self._buffers) < self.size and not any(frame is buffer for buffer in self._buffers):
+            self._buffers.append(frame)
+
+    def clear(self):
+        self._buffers.clear()
+
+    def read(self, cap) -> tuple[bool, Optional[np.ndarray]]:
+        """Reads the next frame from `cap` into a free buffer when there is one."""
+        buffer = self.acquire() if self.size else None
+        ret, frame = cap.read() if buffer is None else cap.read(buffer)
+        if ret and frame is not buffer and self.size:
+            # A first frame, or the capture reallocated because the frame size changed
+            if buffer is not None:
+                self._buffers.remove(buffer)
+            self.keep(frame)
+        return ret, frame
+
+
+class VideoSource:
+    """
+    Frames from a camera index, a network stream (RTSP/HTTP URL) or a video
+    file, read with OpenCV.
+
+    Cameras and streams are live: they deliver frames at their own pace, are
+    opened with the `CaptureConfig` settings (resolution, FPS, FOURCC and a
+    one-frame driver buffer) and, with `grab_thread`, are drained by a
+    background thread so `read` returns the newest frame instead of one that
+    waited in a buffer. When a live source fails it is reopened with
+    exponential backoff instead of ending the stream.
+
+    Files are read as fast as the consumer asks unless `realtime` is set, in
+    which case they are paced to the file's frame rate to behave like a camera.
+    With `loop`, a file starts over when it ends instead of ending the stream.
+
+    Frames are decoded into arrays from a `FrameBufferPool` of
+    `frame_buffers`, so a steady stream doesn't allocate a new frame per read.
+    """
+    def __init__(self, source: Union[int, str], realtime: bool = False, loop: bool = False,
+                 capture_config: CaptureConfig = None):
+        self.source = parse_source(source)
+        self.is_stream = is_stream_url(self.source)
+        self.is_file = not isinstance(self.source, int) and not self.is_stream
+        self.realtime = realtime
+        self.loop = loop
+        self.config = capture_config or CaptureConfig()
+        self.fps = 0.0
+        self.reconnects = 0
+        self.buffers = FrameBufferPool(self.config.frame_buffers)
+
+        self._cap = None
+        self._next_frame_time = 0.0
+        self._stopping = threading.Event()
+        self._grabber = None
+        self._grabbed = threading.Condition()
+        self._frame = None
+        self._frame_sequence = 0
+        self._read_sequence = 0
+        self._grabber_done = False
+
+    @property
+    def is_live(self) -> bool:
+        return not self.is_file
+
+    def open(self) -> bool:
+        self._stopping.clear()
+        if not self._connect():
+            return False
+        self._next_frame_time = time.perf_counter()
+
+        if self.is_live and self.config.grab_thread:
+            self._frame, self._frame_sequence, self._read_sequence = None, 0, 0
+            self._grabber_done = False
+            self._grabber = threading.Thread(target=self._grab_frames, name="frame-grabber", daemon=True)
+            self._grabber.start()
+        return True
+
+    def read(self) -> tuple[bool, Optional[np.ndarray]]:
+        """
+        Returns (True, frame), or (False, None) when the stream has ended, was
+        stopped, or a live source could not be reconnected.
+        """
+        if self._grabber is not None:
+            return self._take_grabbed_frame()
+
+        import cv2
+
+        ret, frame = self.buffers.read(self._cap)
+        if not ret and self.is_file and self.loop:
+            self._cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ret, frame = self.buffers.read(self._cap)
+        while not ret and self.is_live and self._reconnect():
+            ret, frame = self.buffers.read(self._cap)
+
+        if ret and self.is_file and self.realtime and self.fps > 0:
+            self._next_frame_time += 1 / self.fps
+            delay = self._next_frame_time - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                # Running behind, don't try to catch up with a burst of frames
+                self._next_frame_time = time.perf_counter()
+        return ret, frame
+
+    def stop(self):
+        """Makes a blocked `read` return and cancels reconnecting. Can be called from any thread."""
+        self._stopping.set()
+        with self._grabbed:
+            self._grabbed.notify_all()
+
+    def release(self):
+        self.stop()
+        if self._grabber is not None:
+            self._grabber.join()
+            self._grabber = None
+        if self._cap is not None and self._cap.isOpened():
+            self._cap.release()
+
+    def describe(self) -> str:
+        if self.is_file:
+            return f"file '{self.source}'"
+        return f"stream '{self.source}'" if self.is_stream else f"camera {self.source}"
+
+    def _open_capture(self):
+        import cv2
+
+        params = []
+        if self.is_stream and hasattr(cv2, "CAP_PROP_OPEN_TIMEOUT_MSEC"):
+            timeout = int(self.config.open_timeout * 1000)
+            params = [cv2.CAP_PROP_OPEN_TIMEOUT_MSEC, timeout, cv2.CAP_PROP_READ_TIMEOUT_MSEC, timeout]
+        return cv2.VideoCapture(self.source, cv2.CAP_ANY, params)
+
+    def _connect(self) -> bool:
+        import cv2
+
+        self.buffers.clear()
+        self._cap = self._open_capture()
+        if not self._cap.isOpened():
+            return False
+
+        config = self.config
+        if self.is_live:
+            # The FOURCC goes first, some V4L2 drivers only offer high resolutions in MJPG
+            if config.fourcc and not self.is_stream:
+                self._cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*config.fourcc))
+            if config.width and config.height and not self.is_stream:
+                self._cap.set(cv2.CAP_PROP_FRAME_WIDTH, config.width)
+                self._cap.set(cv2.CAP_PROP_FRAME_HEIGHT, config.height)
+            if config.fps and not self.is_stream:
+                self._cap.set(cv2.CAP_PROP_FPS, config.fps)
+            if config.buffer_size:
+                self._cap.set(cv2.CAP_PROP_BUFFERSIZE, config.buffer_size)
+
+        self.fps = self._cap.get(cv2.CAP_PROP_FPS) or 0.0
+        if self.is_live:
+            logger.info(f"Opened {self.describe()} at {int(self._cap.get(cv2.CAP_PROP_FRAME_WIDTH))}x"
+                        f"{int(self._cap.get(cv2.CAP_PROP_FRAME_HEIGHT))}, {self.fps:.0f} FPS")
+        return True
+
+    def _reconnect(self) -> bool:
+        """Reopens a failed live source with exponential backoff. Returns False if stopped or out of attempts."""
+        config = self.config
+        if not config.reconnect:
+            return False
+
+        delay = config.reconnect_delay
+        attempt = 0
+        while not self._stopping.is_set():
+            if config.max_reconnect_attempts and attempt >= config.max_reconnect_attempts:
+                logger.error(f"Giving up on {self.describe()} after {attempt} reconnect attempts.")
+                return False
+            attempt += 1
+            logger.warning(f"Lost {self.describe()}, reconnecting in {delay:.1f}s (attempt {attempt}).")
+            if self._stopping.wait(delay):
+                return False
+
+            self._cap.release()
+            if self._connect():
+                self.reconnects += 1
+                logger.info(f"Reconnected to {self.describe()}.")
+                return True
+            delay = min(delay * 2, config.max_reconnect_delay)
+        return False
+
+    def _grab_frames(self):
+        try:
+            while not self._stopping.is_set():
+                ret, frame = self.buffers.read(self._cap)
+                if not ret:
+                    if self._reconnect():
+                        continue
+                    break
+                with self._grabbed:
+                    self._frame = frame
+                    self._frame_sequence += 1
+                    self._grabbed.notify_all()
+        finally:
+            with self._grabbed:
+                self._grabber_done = True
+                self._grabbed.notify_all()
+
+    def _take_grabbed_frame(self) -> tuple[bool, Optional[np.ndarray]]:
+        with self._grabbed:
+            self._grabbed.wait_for(
+                lambda: self._frame_sequence > self._read_sequence or self._grabber_done or self._stopping.is_set()
+            )
+            if self._frame_sequence == self._read_sequence:
+                return False, None
+            self._read_sequence = self._frame_sequence
+            return True, self._frame
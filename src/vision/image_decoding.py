@@ -0,0 +1,99 @@
+import numpy as np
+import os
+from typing import NamedTuple, Optional
+
+from logging import getLogger
+
+
+logger = getLogger(__name__)
+
+
+class DecodedImage(NamedTuple):
+    """A photo decoded for face analysis, with a UI thumbnail from the same pass"""
+
+    image: np.ndarray
+    thumbnail: Optional[np.ndarray]
+    original_size: tuple[int, int]
+    reduction: int
+
+
+def reduction_factor(longest_side: int, target_size: int) -> int:
+    """Returns the largest decoder reduction (1, 2, 4 or 8) that keeps the longest side at or above `target_size`."""
+    for factor in (8, 4, 2):
+        if longest_side // factor >= target_size:
+            return factor
+    return 1
+
+
+def decode_image(image_path: str, target_size: int = 1024, thumbnail_size: Optional[int] = 96) -> DecodedImage:
+    """
+    Decodes a photo straight to a BGR array at reduced resolution.
+
+    Phone photos are often 12+ MP while the detector works at 640 px. The image
+    header is read first to pick an `IMREAD_REDUCED_*` mode, letting the JPEG
+    decoder skip most of the work (DCT scaling) instead of decoding at full size
+    and resizing. OpenCV applies the EXIF orientation and decodes to BGR, so no
+    colour conversion or extra copy is needed. Formats OpenCV cannot read fall
+    back to PIL with `draft` mode.
+
+    Args:
+        image_path: Path to the image file.
+        target_size: Minimum length of the longest side after reduction.
+        thumbnail_size: Longest side of the thumbnail, or None to skip it.
+    """
+    import cv2
+    from PIL import Image
+
+    reduced_read_flags = {
+        1: cv2.IMREAD_COLOR,
+        2: cv2.IMREAD_REDUCED_COLOR_2,
+        4: cv2.IMREAD_REDUCED_COLOR_4,
+        8: cv2.IMREAD_REDUCED_COLOR_8,
+    }
+
+    try:
+        with Image.open(image_path) as header:
+            original_size = header.size
+    except (OSError, ValueError):
+        original_size = (0, 0)
+
+    reduction = reduction_factor(max(original_size), target_size)
+    image = cv2.imread(image_path, reduced_read_flags[reduction])
+
+    if image is None:
+        logger.info(f"OpenCV could not decode '{image_path}', falling back to PIL.")
+        image, reduction = _decode_with_pil(image_path, target_size)
+
+    thumbnail = make_thumbnail(image, thumbnail_size) if thumbnail_size else None
+    return DecodedImage(image, thumbnail, original_size, reduction)
+
+
+def make_thumbnail(image: np.ndarray, size: int) -> np.ndarray:
+    """Downscales an image so its longest side is at most `size` pixels."""
+    import cv2
+
+    h, w = image.shape[:2]
+    scale = size / max(h, w)
+    if scale >= 1:
+        return image
+    return cv2.resize(image, (max(1, round(w * scale)), max(1, round(h * scale))), interpolation=cv2.INTER_AREA)
+
+
+def thumbnail_path_for(image_path: str) -> str:
+    """Returns where the UI thumbnail of a stored student photo is kept."""
+    root, _ = os.path.splitext(image_path)
+    return f"{root}.thumb.jpg"
+
+
+def _decode_with_pil(image_path: str, target_size: int) -> tuple[np.ndarray, int]:
+    import cv2
+    from PIL import Image, ImageOps
+
+    with Image.open(image_path) as pil_image:
+        full_width = pil_image.size[0]
+        # draft() lets the JPEG decoder scale down by 1/2, 1/4 or 1/8 while decoding
+        pil_image.draft("RGB", (target_size, target_size))
+        reduction = max(1, full_width // pil_image.size[0])
+        pil_image = ImageOps.exif_transpose(pil_image).convert("RGB")
+        image = cv2.cvtColor(np.asarray(pil_image), cv2.COLOR_RGB2BGR)
+    return image, reduction
@@ -0,0 +1,149 @@
+import glob
+import json
+import os
+import time
+
+from .quantization import quantized_pack_name
+from utils.config import OnnxRuntimeConfig
+
+from logging import getLogger
+
+
+logger = getLogger(__name__)
+
+
+def load_face_analysis(name: str = "buffalo_l", root: str = "./model_cache",
+                       session_config: OnnxRuntimeConfig = None, optimized_cache: bool = True,
+                       quantized: bool = False):
+    """
+    Builds an InsightFace `FaceAnalysis` for a model pack, reusing ONNX graphs
+    optimized on a previous launch.
+
+    `FaceAnalysis` creates plain sessions, so ONNX Runtime re-runs its graph
+    optimizations on every start. Here each model's first session is created
+    with `optimized_model_filepath`, which writes the optimized graph under
+    `<root>/optimized/`. Later launches load that file with optimizations
+    disabled. Cached graphs are keyed by ONNX Runtime version, providers
+    (extended optimizations can be provider specific) and optimization level,
+    and rebuilt when the source model changes.
+
+    Thread counts, execution mode, memory arena and providers come from
+    `session_config`, so each deployment can size inference to its machine.
+
+    With `quantized`, each model that has an int8 variant in
+    `<root>/models/<name>_int8/` (see `quantization.quantize_model_pack`) is run
+    from that file instead; the others stay float.
+
+    Models are still routed and configured from the original files, so
+    InsightFace's input normalization detection sees the unmodified graph.
+
+    Args:
+        name: The model pack name under `<root>/models`.
+        root: The InsightFace model root, downloaded into if missing.
+        session_config: ONNX Runtime session settings, defaults to `OnnxRuntimeConfig()`.
+        optimized_cache: Set to False to always optimize in memory only.
+        quantized: Load the int8 variants where available.
+    """
+    import onnxruntime
+    from insightface.app import FaceAnalysis
+    from insightface.utils import ensure_available
+
+    session_config = session_config or OnnxRuntimeConfig()
+    providers = session_config.providers
+    provider_options = session_config.build_provider_options()
+    onnxruntime.set_default_logger_severity(3)
+
+    model_dir = ensure_available('models', name, root=root)
+    quantized_dir = os.path.join(root, 'models', quantized_pack_name(name)) if quantized else None
+    provider_tag = '-'.join(p.replace('ExecutionProvider', '') for p in providers)
+    cache_dir = os.path.join(
+        root, "optimized", f"ort-{onnxruntime.__version__}-{provider_tag}-{session_config.graph_optimization_level}",
+        quantized_pack_name(name) if quantized else name
+    )
+    os.makedirs(cache_dir, exist_ok=True)
+    manifest_path = os.path.join(cache_dir, "manifest.json")
+    manifest = _read_manifest(manifest_path)
+
+    app = FaceAnalysis.__new__(FaceAnalysis)
+    app.models = {}
+    app.model_dir = model_dir
+
+    for onnx_file in sorted(glob.glob(os.path.join(model_dir, '*.onnx'))):
+        start = time.perf_counter()
+        source_file = onnx_file
+        if quantized_dir and os.path.exists(os.path.join(quantized_dir, os.path.basename(onnx_file))):
+            source_file = os.path.join(quantized_dir, os.path.basename(onnx_file))
+        source_key = _source_key(source_file)
+        optimized_file = os.path.join(cache_dir, os.path.basename(onnx_file))
+        is_cached = optimized_cache and manifest.get(os.path.basename(onnx_file)) == source_key and os.path.exists(optimized_file)
+
+        sess_options = session_config.build_session_options(cached=is_cached)
+        if is_cached:
+            session_file = optimized_file
+        else:
+            if optimized_cache:
+                sess_options.optimized_model_filepath = optimized_file
+            session_file = source_file
+
+        session = onnxruntime.InferenceSession(
+            session_file, sess_options=sess_options, providers=providers, provider_options=provider_options
+        )
+        if optimized_cache and not is_cached:
+            manifest[os.path.basename(onnx_file)] = source_key
+
+        model = _route_model(onnx_file, session)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if model is None:
+            logger.warning(f"Model not recognized, skipping: {onnx_file}")
+            continue
+        if model.taskname in app.models:
+            logger.warning(f"Duplicated model task type '{model.taskname}', skipping: {onnx_file}")
+            continue
+
+        app.models[model.taskname] = model
+        logger.info(f"Loaded {model.taskname} model {os.path.basename(onnx_file)} in {elapsed_ms:.0f} ms "
+                    f"({'int8, ' if source_file != onnx_file else ''}"
+                    f"{'cached optimized graph' if is_cached else 'optimized now'}).")
+
+    if optimized_cache:
+        with open(manifest_path, "w") as f:
+            json.dump(manifest, f, indent=2)
+
+    assert 'detection' in app.models
+    app.det_model = app.models['detection']
+    return app
+
+
+def _route_model(onnx_file: str, session):
+    """Mirrors `insightface.model_zoo.ModelRouter`, but with a session created by the caller."""
+    from insightface.model_zoo.arcface_onnx import ArcFaceONNX
+    from insightface.model_zoo.retinaface import RetinaFace
+    from insightface.model_zoo.landmark import Landmark
+    from insightface.model_zoo.attribute import Attribute
+
+    inputs = session.get_inputs()
+    input_shape = inputs[0].shape
+    outputs = session.get_outputs()
+
+    if len(outputs) >= 5:
+        return RetinaFace(model_file=onnx_file, session=session)
+    elif input_shape[2] == 192 and input_shape[3] == 192:
+        return Landmark(model_file=onnx_file, session=session)
+    elif input_shape[2] == 96 and input_shape[3] == 96:
+        return Attribute(model_file=onnx_file, session=session)
+    elif input_shape[2] == input_shape[3] and input_shape[2] >= 112 and input_shape[2] % 16 == 0:
+        return ArcFaceONNX(model_file=onnx_file, session=session)
+    return None
+
+
+def _source_key(onnx_file: str) -> str:
+    stat = os.stat(onnx_file)
+    return f"{stat.st_size}-{int(stat.st_mtime)}"
+
+
+def _read_manifest(manifest_path: str) -> dict:
+    try:
+        with open(manifest_path) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
@@ -0,0 +1,147 @@
+import threading
+import time
+from typing import Callable, Optional
+
+import numpy as np
+
+from .face_analyzer import FaceAnalyzer
+from .frame_result import FrameResult
+from .frame_sources import VideoSource
+from utils import startup_timing
+from utils.latency import LatencyMetrics
+
+from logging import getLogger
+
+
+logger = getLogger(__name__)
+
+
+class RecognitionPipeline:
+    """
+    The capture -> analyze -> publish loop, without any Qt dependency, so it
+    can run inside the GUI's camera thread or in the headless daemon.
+
+    `run` blocks on the calling thread until `stop` is called or the source
+    ends. Processed frames are published latest-wins: `take_latest_frame`
+    empties a single slot (a slow consumer drops stale frames rather than
+    queueing them) and `on_frame` is only called when that slot was empty.
+    `wait_for_frame` lets any number of readers follow the stream without
+    consuming it.
+
+    Args:
+        face_analyzer: A prepared `FaceAnalyzer`.
+        source: Where frames come from.
+        metrics: Where stage latencies are recorded.
+        on_frame: Called from the pipeline thread when a frame is waiting in an empty slot.
+        on_faces: Called from the pipeline thread with each frame and its tracked faces,
+                  before the frame result is built, e.g. to identify them.
+    """
+    def __init__(self, face_analyzer: FaceAnalyzer, source: VideoSource, metrics: LatencyMetrics = None,
+                 on_frame: Optional[Callable[[], None]] = None,
+                 on_faces: Optional[Callable[[np.ndarray, list], None]] = None):
+        self.face_analyzer = face_analyzer
+        self.source = source
+        self.metrics = metrics or LatencyMetrics("pipeline", enabled=False)
+        self.on_frame = on_frame
+        self.on_faces = on_faces
+
+        self.is_running = False
+        self.frames_processed = 0
+        self.dropped_frames = 0
+        self.faces_in_view = 0
+
+        self._condition = threading.Condition()
+        self._latest = None
+        self._latest_time = 0.0
+        self._current = None
+        self._sequence = 0
+
+    def run(self) -> Optional[str]:
+        """
+        Runs the loop until stopped or the source ends.
+
+        Returns:
+            An error message if the source could not be opened or read, else None.
+        """
+        if self.is_running:
+            return None
+
+        self.is_running = True
+        if not self.source.open():
+            self.is_running = False
+            return f"Error: Could not open {self.source.describe()}."
+
+        error = None
+        metrics = self.metrics
+        try:
+            while self.is_running:
+                with metrics.time("capture"):
+                    ret, frame = self.source.read()
+                if not ret:
+                    if self.source.is_file:
+                        logger.info(f"Reached the end of {self.source.describe()}.")
+                    elif self.is_running:
+                        # Not stopped, so the source failed and could not be reconnected
+                        error = f"Error: Could not read from {self.source.describe()}."
+                    break
+
+                with metrics.time("processing"):
+                    processed_frame, faces = self.face_analyzer.process_frame(frame, metrics)
+                    if self.on_faces is not None:
+                        self.on_faces(processed_frame, faces)
+                    with metrics.time("overlays"):
+                        result = self.face_analyzer.build_frame_result(faces)
+                if faces:
+                    startup_timing.mark("first face processed", once=True)
+
+                self.frames_processed += 1
+                self.faces_in_view = len(faces)
+                self._publish(processed_frame, result)
+        finally:
+            self.is_running = False
+            self.source.release()
+        return error
+
+    def stop(self):
+        """Stops the loop after the current frame. Can be called from any thread."""
+        self.is_running = False
+        self.source.stop()
+
+    def take_latest_frame(self) -> tuple[np.ndarray, FrameResult] | None:
+        """
+        Returns the newest (frame, result) pair and empties the slot, or None
+        if no new frame arrived since the last call. Safe to call from any thread.
+        """
+        with self._condition:
+            latest, self._latest = self._latest, None
+            published = self._latest_time
+        if latest is not None:
+            self.metrics.record("queue wait", time.perf_counter() - published)
+        return latest
+
+    def wait_for_frame(self, after: int = 0, timeout: float = 1.0) -> tuple[int, np.ndarray, FrameResult] | None:
+        """
+        Waits for a frame newer than sequence number `after`, without taking it
+        from the slot.
+
+        Returns:
+            (sequence, frame, result), or None if no newer frame arrived within `timeout` seconds.
+        """
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._sequence > after, timeout):
+                return None
+            return self._current
+
+    def _publish(self, frame: np.ndarray, result: FrameResult):
+        with self._condition:
+            is_pending = self._latest is not None
+            if is_pending:
+                self.dropped_frames += 1
+            self._latest = (frame, result)
+            self._latest_time = time.perf_counter()
+            self._sequence += 1
+            self._current = (self._sequence, frame, result)
+            self._condition.notify_all()
+
+        if not is_pending and self.on_frame is not None:
+            self.on_frame()
@@ -0,0 +1,211 @@
+import glob
+import os
+import shutil
+import tempfile
+import time
+from typing import List, NamedTuple, Optional
+
+import numpy as np
+
+from logging import getLogger
+
+
+logger = getLogger(__name__)
+
+QUANTIZED_SUFFIX = "int8"
+
+
+def quantized_pack_name(name: str) -> str:
+    """Returns the directory name, under `<root>/models`, of a pack's int8 variants."""
+    return f"{name}_{QUANTIZED_SUFFIX}"
+
+
+def quantize_model_pack(name: str = "buffalo_l", root: str = "./model_cache", models: Optional[List[str]] = None,
+                        per_channel: bool = False) -> str:
+    """
+    Writes int8 dynamic-quantized copies of a model pack's ONNX files to
+    `<root>/models/<name>_int8/`.
+
+    Weights are quantized to int8 ahead of time and activations on the fly, so
+    no calibration data is needed. Models are shape-inferred first where
+    possible, which lets the quantizer cover more operators. Models left out of
+    `models` are not copied; the loader falls back to the float file for them.
+
+    Args:
+        name: The model pack name under `<root>/models`.
+        root: The InsightFace model root.
+        models: File names to quantize (e.g. ['det_10g.onnx', 'w600k_r50.onnx']), all by default.
+        per_channel: Quantize weights per output channel, slower to run but usually more accurate.
+
+    Returns:
+        The directory the quantized models were written to.
+    """
+    from insightface.utils import ensure_available
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+    from onnxruntime.quantization.shape_inference import quant_pre_process
+
+    model_dir = ensure_available('models', name, root=root)
+    output_dir = os.path.join(root, 'models', quantized_pack_name(name))
+    os.makedirs(output_dir, exist_ok=True)
+
+    for onnx_file in sorted(glob.glob(os.path.join(model_dir, '*.onnx'))):
+        file_name = os.path.basename(onnx_file)
+        if models and file_name not in models:
+            continue
+
+        start = time.perf_counter()
+        output_file = os.path.join(output_dir, file_name)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            prepared_file = os.path.join(tmp_dir, file_name)
+            try:
+                quant_pre_process(onnx_file, prepared_file, skip_symbolic_shape=True)
+            except Exception as e:
+                logger.warning(f"Shape inference failed for {file_name}, quantizing it as is: {e}")
+                shutil.copyfile(onnx_file, prepared_file)
+
+            quantize_dynamic(prepared_file, output_file, weight_type=QuantType.QInt8, per_channel=per_channel)
+
+        logger.info(f"Quantized {file_name} in {(time.perf_counter() - start):.1f} s "
+                    f"({os.path.getsize(onnx_file) / 1e6:.1f} MB -> {os.path.getsize(output_file) / 1e6:.1f} MB).")
+
+    return output_dir
+
+
+def cosine_agreement(reference: np.ndarray, candidate: np.ndarray) -> np.ndarray:
+    """
+    Returns the cosine similarity between matching rows of two embedding matrices,
+    e.g. float and quantized embeddings of the same faces.
+    """
+    reference = reference / np.linalg.norm(reference, axis=1, keepdims=True)
+    candidate = candidate / np.linalg.norm(candidate, axis=1, keepdims=True)
+    return np.einsum("ij,ij->i", reference, candidate)
+
+
+def top1_match_rate(queries: np.ndarray, gallery: np.ndarray, labels: np.ndarray) -> float:
+    """
+    Returns the fraction of queries whose most similar gallery row is the expected one.
+
+    Args:
+        queries: One embedding per row.
+        gallery: One embedding per enrolled student.
+        labels: For each query, the index of its student in `gallery`.
+    """
+    if len(queries) == 0:
+        return 0.0
+    queries = queries / np.linalg.norm(queries, axis=1, keepdims=True)
+    gallery = gallery / np.linalg.norm(gallery, axis=1, keepdims=True)
+    return float(np.mean(np.argmax(queries @ gallery.T, axis=1) == labels))
+
+
+class QuantizationReport(NamedTuple):
+    """Accuracy and speed of the int8 model pack against the float one"""
+
+    faces: int
+    cosine_mean: float
+    cosine_min: float
+    top1_quantized: float
+    detection_agreement: float
+    detection_ms_float: float
+    detection_ms_quantized: float
+    recognition_ms_float: float
+    recognition_ms_quantized: float
+
+    @property
+    def detection_speedup(self) -> float:
+        return self.detection_ms_float / self.detection_ms_quantized if self.detection_ms_quantized else 0.0
+
+    @property
+    def recognition_speedup(self) -> float:
+        return self.recognition_ms_float / self.recognition_ms_quantized if self.recognition_ms_quantized else 0.0
+
+
+def check_quantized_pack(image_paths: List[str], name: str = "buffalo_l", root: str = "./model_cache",
+                         session_config=None, det_size: int = 640) -> QuantizationReport:
+    """
+    Compares the int8 pack with the float pack on enrolled profile photos.
+
+    Each photo is one student of the gallery. Faces are detected with both
+    detectors (detection agreement: the largest faces overlap with IoU > 0.5),
+    then the float face is embedded by both recognizers, so the cosine agreement
+    and top-1 rate measure the recognizer alone. Top-1 searches the float
+    gallery, as a quantized deployment would until students are re-embedded.
+
+    Args:
+        image_paths: The enrolled students' photos.
+        name: The model pack name under `<root>/models`.
+        root: The InsightFace model root.
+        session_config: ONNX Runtime session settings for both packs.
+        det_size: The detector input size.
+    """
+    from .image_decoding import decode_image
+    from .model_loader import load_face_analysis
+
+    apps = []
+    for quantized in (False, True):
+        app = load_face_analysis(name=name, root=root, session_config=session_config, quantized=quantized)
+        app.prepare(ctx_id=0, det_size=(det_size, det_size))
+        apps.append(app)
+    float_app, quantized_app = apps
+
+    float_embeddings, quantized_embeddings = [], []
+    detection_matches = 0
+    timings = {"det_float": [], "det_quantized": [], "rec_float": [], "rec_quantized": []}
+
+    def largest_face(app, image, timing_key):
+        t0 = time.perf_counter()
+        bboxes, kpss = app.det_model.detect(image, max_num=0, metric='default')
+        timings[timing_key].append((time.perf_counter() - t0) * 1000)
+        if bboxes.shape[0] == 0:
+            return None
+        i = int(np.argmax((bboxes[:, 2] - bboxes[:, 0]) * (bboxes[:, 3] - bboxes[:, 1])))
+        return bboxes[i, :4], kpss[i] if kpss is not None else None
+
+    def embed(app, image, kps, timing_key):
+        from insightface.utils import face_align
+        recognizer = app.models['recognition']
+        t0 = time.perf_counter()
+        aligned = face_align.norm_crop(image, landmark=kps, image_size=recognizer.input_size[0])
+        embedding = recognizer.get_feat(aligned).flatten()
+        timings[timing_key].append((time.perf_counter() - t0) * 1000)
+        return embedding
+
+    for image_path in image_paths:
+        image = decode_image(image_path, thumbnail_size=None).image
+        float_face = largest_face(float_app, image, "det_float")
+        quantized_face = largest_face(quantized_app, image, "det_quantized")
+        if float_face is None:
+            logger.warning(f"No face found in '{image_path}' by the float detector, skipping it.")
+            continue
+        if quantized_face is not None and _iou(float_face[0], quantized_face[0]) > 0.5:
+            detection_matches += 1
+
+        float_embeddings.append(embed(float_app, image, float_face[1], "rec_float"))
+        quantized_embeddings.append(embed(quantized_app, image, float_face[1], "rec_quantized"))
+
+    if not float_embeddings:
+        raise ValueError("No faces found in any of the images.")
+
+    float_embeddings = np.stack(float_embeddings)
+    quantized_embeddings = np.stack(quantized_embeddings)
+    labels = np.arange(len(float_embeddings))
+    agreement = cosine_agreement(float_embeddings, quantized_embeddings)
+
+    return QuantizationReport(
+        faces=len(float_embeddings),
+        cosine_mean=float(agreement.mean()),
+        cosine_min=float(agreement.min()),
+        top1_quantized=top1_match_rate(quantized_embeddings, float_embeddings, labels),
+        detection_agreement=detection_matches / len(float_embeddings),
+        detection_ms_float=float(np.median(timings["det_float"])),
+        detection_ms_quantized=float(np.median(timings["det_quantized"])),
+        recognition_ms_float=float(np.median(timings["rec_float"])),
+        recognition_ms_quantized=float(np.median(timings["rec_quantized"])),
+    )
+
+
+def _iou(box_a: np.ndarray, box_b: np.ndarray) -> float:
+    width = max(0.0, min(box_a[2], box_b[2]) - max(box_a[0], box_b[0]))
+    height = max(0.0, min(box_a[3], box_b[3]) - max(box_a[1], box_b[1]))
+    intersection = width * height
+    union = (box_a[2] - box_a[0]) * (box_a[3] - box_a[1]) + (box_b[2] - box_b[0]) * (box_b[3] - box_b[1]) - intersection
+    return float(intersection / union) if union > 0 else 0.0
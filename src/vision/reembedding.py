@@ -0,0 +1,164 @@
+import multiprocessing
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Callable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from database.database_manager import DatabaseManager
+from utils.config import ModelConfig, OnnxRuntimeConfig
+
+from logging import getLogger
+
+
+logger = getLogger(__name__)
+
+# (student rowid, embedding or None, error or None)
+EmbeddingResult = Tuple[int, Optional[np.ndarray], Optional[str]]
+
+
+class ReembeddingReport(NamedTuple):
+    """The outcome of one `reembed_gallery` run"""
+
+    embedding_model: str
+    students: int
+    resumed: int
+    embedded: int
+    failed: int
+    seconds: float
+    swapped: bool
+
+
+class GalleryEmbedder:
+    """
+    Embeds batches of profile photos with a model pack, for `reembed_gallery`.
+
+    Instances are sent to the worker processes, so the models are only loaded
+    on the first call, inside the worker. The enrollment thresholds apply: a
+    photo whose largest face is smaller than `min_face_size` or scored below
+    `min_det_score` fails.
+    """
+    def __init__(self, model_config: ModelConfig, session_config: OnnxRuntimeConfig = None,
+                 decode_size: int = 1024, min_face_size: int = 64, min_det_score: float = 0.6):
+        self.model_config = model_config
+        self.session_config = session_config or OnnxRuntimeConfig()
+        self.decode_size = decode_size
+        self.min_face_size = min_face_size
+        self.min_det_score = min_det_score
+        self._analyzer = None
+
+    @property
+    def embedding_model(self) -> str:
+        return self.model_config.embedding_model
+
+    def __call__(self, batch: List[Tuple[int, str]]) -> List[EmbeddingResult]:
+        from .face_analyzer import FaceAnalyzer
+        from .image_decoding import decode_image
+
+        if self._analyzer is None:
+            self._analyzer = FaceAnalyzer()
+            self._analyzer.prepare(self.session_config, self.model_config)
+
+        results, images, owners = [], [], []
+        for rowid, image_path in batch:
+            try:
+                images.append(decode_image(image_path, target_size=self.decode_size, thumbnail_size=None).image)
+                owners.append(rowid)
+            except Exception as e:
+                results.append((rowid, None, f"Could not read {image_path}: {e}"))
+
+        embeddings = self._analyzer.embed_largest_faces(images, self.min_face_size, self.min_det_score)
+        for rowid, embedding in zip(owners, embeddings):
+            results.append((rowid, embedding, None if embedding is not None else "No usable face in the photo"))
+        return results
+
+
+_worker_embedder = None
+
+
+def _init_worker(embedder: Callable[[List[Tuple[int, str]]], List[EmbeddingResult]]):
+    global _worker_embedder
+    _worker_embedder = embedder
+
+
+def _embed_in_worker(batch: List[Tuple[int, str]]) -> List[EmbeddingResult]:
+    return _worker_embedder(batch)
+
+
+def reembed_gallery(db_manager: DatabaseManager, embedder: Callable[[List[Tuple[int, str]]], List[EmbeddingResult]],
+                    embedding_model: str, workers: Optional[int] = None, batch_size: int = 16,
+                    swap: bool = True, retry_failed: bool = False,
+                    on_progress: Optional[Callable[[int, int], None]] = None) -> ReembeddingReport:
+    """
+    Re-embeds every student's profile photo with a new model and swaps the new
+    vectors in atomically.
+
+    Photos are streamed from `students.student_image_path` in batches and
+    embedded by a pool of `workers` processes (one batch per task, with batched
+    recognition inside `GalleryEmbedder`). Each finished batch is written to
+    the shadow table as a checkpoint (see `DatabaseManager.start_reembedding`),
+    so running again after an interruption resumes. The live gallery keeps
+    serving the old vectors until every student has a new one; then
+    `swap_reembedded_gallery` replaces them in one transaction. Students whose
+    photo failed are reported and block the swap until they are fixed.
+
+    Args:
+        db_manager: The gallery to re-embed.
+        embedder: Turns a batch of (rowid, image path) into `EmbeddingResult`s,
+                  e.g. a `GalleryEmbedder`. Must be picklable when `workers` > 0.
+        embedding_model: The tag of the model `embedder` uses.
+        workers: Worker processes, 0 embeds on the calling thread. Defaults to
+                 the number of CPUs.
+        batch_size: Photos per task.
+        swap: Swap the new gallery in once complete.
+        retry_failed: Retry students whose photo failed in an earlier run.
+        on_progress: Called with (processed, students) after every batch.
+    """
+    start = time.perf_counter()
+    resumed = db_manager.start_reembedding(embedding_model, retry_failed=retry_failed)
+    students, _, _ = db_manager.reembedding_progress()
+    if resumed:
+        logger.info(f"Resuming re-embedding with '{embedding_model}': {resumed} of {students} students already done.")
+
+    embedded = failed = 0
+
+    def store(results: List[EmbeddingResult]):
+        nonlocal embedded, failed
+        embeddings = [(rowid, embedding) for rowid, embedding, _ in results if embedding is not None]
+        failures = [(rowid, error) for rowid, embedding, error in results if embedding is None]
+        db_manager.save_reembedded(embeddings, failures)
+        embedded += len(embeddings)
+        failed += len(failures)
+        if on_progress is not None:
+            on_progress(resumed + embedded + failed, students)
+
+    batches = db_manager.iter_reembedding_batches(batch_size)
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    if workers == 0:
+        for batch in batches:
+            store(embedder(batch))
+    else:
+        # Spawned, not forked: the parent may hold threads (logging, ONNX Runtime) that don't survive a fork
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(workers, mp_context=context, initializer=_init_worker, initargs=(embedder,)) as pool:
+            pending = set()
+            for batch in batches:
+                pending.add(pool.submit(_embed_in_worker, batch))
+                # Bounded so a huge gallery isn't read into memory ahead of the workers
+                if len(pending) >= 2 * workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        store(future.result())
+            for future in pending:
+                store(future.result())
+
+    _, done, failed_total = db_manager.reembedding_progress()
+    swapped = False
+    if failed_total:
+        logger.warning(f"{failed_total} students could not be re-embedded, the old gallery stays in use.")
+    elif swap and done == students:
+        db_manager.swap_reembedded_gallery()
+        swapped = True
+
+    return ReembeddingReport(embedding_model, students, resumed, embedded, failed, time.perf_counter() - start, swapped)
@@ -0,0 +1,185 @@
+from collections import Counter
+from typing import Callable, NamedTuple, Optional
+
+import numpy as np
+
+from utils.config import RecognitionConfig
+
+
+class TrackIdentity(NamedTuple):
+    """The identity committed to a track"""
+
+    track_id: int
+    student_id: Optional[str]
+    student_name: Optional[str]
+    similarity: Optional[float]
+    votes: int
+    searches: int
+    samples: int
+    ended: bool
+
+
+class TrackState:
+    """The fused embedding and search votes of one track"""
+
+    def __init__(self, track_id: int, frame_number: int):
+        self.track_id = track_id
+        self.weighted_sum = None
+        self.fused = None
+        self.weight = 0.0
+        self.samples = 0
+        self.drift = 1.0
+        self.last_seen = frame_number
+        self.searched_at = None
+        self.searches = 0
+        self.votes = Counter()
+        self.best = {}
+        self.identity = None
+
+    def add(self, embedding: np.ndarray, weight: float):
+        """Folds one embedding into the quality-weighted running mean and updates the drift"""
+        embedding = np.asarray(embedding, dtype=np.float32)
+        if self.weighted_sum is None:
+            self.weighted_sum = np.zeros_like(embedding)
+        self.weighted_sum += weight * embedding
+        self.weight += weight
+        self.samples += 1
+
+        norm = np.linalg.norm(self.weighted_sum)
+        if norm == 0:
+            return
+        fused = self.weighted_sum / norm
+        if self.fused is not None:
+            self.drift = 1.0 - float(np.dot(fused, self.fused))
+        self.fused = fused
+
+
+class TrackFusion:
+    """
+    Identifies tracks from their fused embeddings instead of single frames.
+
+    Every embedded face of a track is added to the track's running mean,
+    weighted by its quality score, so sharp frontal frames count more than
+    marginal ones. The gallery is searched with the normalised mean only when
+    it is stable (at least `min_samples` faces and the last one moved it by
+    less than `max_drift` in cosine distance), at most every `research_frames`
+    frames and `max_searches` times per track, plus once more when the track
+    ends. Each search votes for the student it matched above
+    `match_threshold`, or for nobody. A student is committed once they hold
+    `min_votes` votes and the majority, and then the track is not searched
+    again; a track that ends uncommitted is committed to its majority vote.
+
+    The faces of committed tracks get `student_id`, `student_name` and
+    `similarity`; uncommitted tracks stay unlabelled rather than flip between
+    candidates.
+
+    Args:
+        search: Returns the best gallery match of a normalised embedding, e.g. a
+            `StudentMatch`, or None if the gallery is empty.
+        config: The thresholds.
+    """
+    def __init__(self, search: Callable[[np.ndarray], Optional[object]], config: RecognitionConfig = None):
+        self.search = search
+        self.config = config or RecognitionConfig()
+        self.searches = 0
+        self._tracks = {}
+
+    @property
+    def committed_tracks(self) -> int:
+        return sum(1 for track in list(self._tracks.values()) if track.identity and track.identity.student_id)
+
+    def update(self, frame_number: int, faces: list) -> list[TrackIdentity]:
+        """
+        Adds the embedded faces of one frame, searches stable tracks, labels the
+        faces and ends tracks unseen for `track_timeout` frames.
+
+        Returns:
+            The identities committed during this frame, including those of
+            tracks that ended.
+        """
+        committed = []
+        for face in faces:
+            if face.track_id is None:
+                continue
+            track = self._tracks.get(face.track_id)
+            if track is None:
+                track = self._tracks[face.track_id] = TrackState(face.track_id, frame_number)
+            track.last_seen = frame_number
+
+            # Faces that failed the quality gate have no embedding to fuse
+            embedding = getattr(face, "normed_embedding", None)
+            if track.identity is None and embedding is not None:
+                track.add(embedding, max(float(getattr(face, "quality", 1.0) or 0.0), 1e-3))
+                if self._should_search(track, frame_number):
+                    self._search(track, frame_number)
+                    if self._commit(track, ended=False):
+                        committed.append(track.identity)
+
+            if track.identity is not None:
+                face.student_id = track.identity.student_id
+                face.student_name = track.identity.student_name
+                face.similarity = track.identity.similarity
+
+        lost = [track for track in self._tracks.values() if frame_number - track.last_seen > self.config.track_timeout]
+        committed.extend(self._end(lost, frame_number))
+        return committed
+
+    def finish(self, frame_number: int) -> list[TrackIdentity]:
+        """Ends every open track, e.g. when the source ends. Returns the identities committed."""
+        return self._end(list(self._tracks.values()), frame_number)
+
+    def _should_search(self, track: TrackState, frame_number: int) -> bool:
+        config = self.config
+        if track.fused is None or track.samples < config.min_samples or track.searches >= config.max_searches:
+            return False
+        if track.searched_at is not None and frame_number - track.searched_at < config.research_frames:
+            return False
+        return track.samples == 1 or track.drift <= config.max_drift
+
+    def _search(self, track: TrackState, frame_number: int):
+        match = self.search(track.fused)
+        self.searches += 1
+        track.searches += 1
+        track.searched_at = frame_number
+
+        if match is None or match.similarity_score < self.config.match_threshold:
+            track.votes[None] += 1
+            return
+        track.votes[match.student_id] += 1
+        best = track.best.get(match.student_id)
+        if best is None or match.similarity_score > best.similarity_score:
+            track.best[match.student_id] = match
+
+    def _commit(self, track: TrackState, ended: bool) -> bool:
+        if not track.votes:
+            return False
+        student_id, votes = track.votes.most_common(1)[0]
+        total = sum(track.votes.values())
+        if 2 * votes <= total or (not ended and votes < self.config.min_votes):
+            return False
+
+        match = track.best.get(student_id)
+        track.identity = TrackIdentity(
+            track_id=track.track_id,
+            student_id=student_id,
+            student_name=match.student_name if match else None,
+            similarity=float(match.similarity_score) if match else None,
+            votes=votes,
+            searches=track.searches,
+            samples=track.samples,
+            ended=ended,
+        )
+        return True
+
+    def _end(self, tracks: list[TrackState], frame_number: int) -> list[TrackIdentity]:
+        committed = []
+        for track in tracks:
+            del self._tracks[track.track_id]
+            if track.identity is not None or track.fused is None:
+                continue
+            # One last look with everything the track has seen, unless it was just searched
+            if track.searched_at != frame_number:
+                self._search(track, frame_number)
+            if self._commit(track, ended=True):
+                committed.append(track.identity)
+        return committed
@@ -0,0 +1,175 @@
+import pytest
+import numpy as np
+import os
+import sqlite3
+import uuid
+from datetime import datetime
+
+from src.database.database_manager import DatabaseManager
+from src.database.db_models import Student, AttendanceRecord
+from src.database.partitions import partition_for
+
+
+def populate(manager: DatabaseManager):
+    """Adds one student attending once on the first of every month from Sep 2025 to Mar 2026."""
+    manager.add_student(Student(
+        student_id="S01",
+        student_name="Alice",
+        student_image_path="path/to/image.png",
+        student_face_embedding=np.random.rand(512).astype(np.float32)
+    ))
+    for year, month in [(2025, 9), (2025, 10), (2025, 11), (2025, 12), (2026, 1), (2026, 2), (2026, 3)]:
+        manager.add_attendance_record(AttendanceRecord(
+            attend_id=str(uuid.uuid4()),
+            student_id="S01",
+            recorded_frame="/path/to/frame.jpg",
+            attend_datetime=datetime(year, month, 1, 9, 0, 0),
+            hall="Hall A"
+        ))
+
+
+@pytest.fixture(scope="function", params=["memory", "file"])
+def db_manager(request, tmp_path):
+    """
+    Pytest fixture providing a populated DatabaseManager, both in-memory and
+    file-backed, with its archive directory under tmp_path.
+    """
+    db_path = ":memory:" if request.param == "memory" else str(tmp_path / "attendance.db")
+    manager = DatabaseManager(db_path=db_path, archive_dir=str(tmp_path / "archive"))
+    populate(manager)
+    yield manager
+    manager.close()
+
+
+class TestArchive:
+
+    def test_partition_for(self):
+        """
+        Tests month and academic term partition boundaries.
+        """
+        assert partition_for(datetime(2025, 12, 31), "month") == ("2025_12", datetime(2025, 12, 1), datetime(2026, 1, 1))
+        assert partition_for(datetime(2026, 1, 15), "term").key == "2025_fall"
+        assert partition_for(datetime(2026, 3, 1), "term").key == "2026_spring"
+        assert partition_for(datetime(2026, 8, 1), "term").key == "2026_summer"
+
+        with pytest.raises(ValueError):
+            partition_for(datetime(2026, 1, 1), "week")
+
+    def test_archive_attendance_moves_rows(self, db_manager: DatabaseManager):
+        """
+        Tests that archiving moves old rows into per-month files and keeps the hot table small.
+        """
+        archived = db_manager.archive_attendance(before=datetime(2026, 1, 1), scheme="month")
+
+        partitions = db_manager.list_partitions()
+        hot_rows = db_manager.conn.execute("SELECT COUNT(*) FROM attendance").fetchone()[0]
+
+        assert archived == 4
+        assert hot_rows == 3
+        assert [p['partition_key'] for p in partitions] == ["2025_09", "2025_10", "2025_11", "2025_12"]
+        assert all(os.path.exists(p['file_path']) for p in partitions)
+
+    def test_export_reads_archived_partitions(self, db_manager: DatabaseManager):
+        """
+        Tests that the export stream transparently covers archived partitions in order.
+        """
+        db_manager.archive_attendance(before=datetime(2026, 2, 1), scheme="term")
+
+        rows = [row for chunk in db_manager.iter_attendance_export(chunk_size=2) for row in chunk]
+        hot_only = [row for chunk in db_manager.iter_attendance_export(include_archive=False) for row in chunk]
+        filtered = [row for chunk in db_manager.iter_attendance_export(
+            start=datetime(2025, 11, 1), end=datetime(2026, 3, 1)
+        ) for row in chunk]
+
+        assert len(rows) == 7
+        assert [row[4] for row in rows] == sorted(row[4] for row in rows)
+        assert len(hot_only) == 2
+        assert len(filtered) == 4
+
+    def test_attendance_reads_include_archived_partitions(self, db_manager: DatabaseManager):
+        """
+        Tests that the paged attendance reads cover archived partitions, newest first.
+        """
+        db_manager.archive_attendance(before=datetime(2026, 1, 1), scheme="month")
+
+        rows = db_manager.get_attendance_rows(page_size=5, include_archive=True) + \
+            db_manager.get_attendance_rows(page=2, page_size=5, include_archive=True)
+        records = db_manager.get_all_attendance(page_size=10, include_archive=True)
+        hot_only = db_manager.get_attendance_rows(page_size=10)
+
+        assert [row.attend_datetime[:7] for row in rows] == \
+            ["2026-03", "2026-02", "2026-01", "2025-12", "2025-11", "2025-10", "2025-09"]
+        assert [record.attend_id for record in records] == [row.attend_id for row in rows]
+        assert len(hot_only) == 3
+
+    @pytest.mark.parametrize("order_by", ["attend_datetime", "student_id", "hall"])
+    @pytest.mark.parametrize("descending", [True, False])
+    def test_attendance_page_visits_archived_partitions(self, db_manager: DatabaseManager, order_by: str, descending: bool):
+        """
+        Tests keyset paging across partitions whose rows tie on the sort column and share rowids.
+        """
+        db_manager.archive_attendance(before=datetime(2026, 1, 1), scheme="month")
+
+        seen, after = [], None
+        while True:
+            rows, after = db_manager.get_attendance_page(order_by=order_by, descending=descending, after=after, page_size=2)
+            seen.extend(rows)
+            if after is None:
+                break
+        filtered, _ = db_manager.get_attendance_page(start=datetime(2025, 10, 1), end=datetime(2026, 2, 1))
+        hot_only, _ = db_manager.get_attendance_page(include_archive=False)
+
+        assert len({row[0] for row in seen}) == len(seen) == 7
+        assert [row[4] for row in seen] == sorted((row[4] for row in seen), reverse=descending)
+        assert [row[4][:7] for row in filtered] == ["2026-01", "2025-12", "2025-11", "2025-10"]
+        assert len(hot_only) == 3
+
+    def test_interrupted_archive_keeps_rows_visible(self, db_manager: DatabaseManager):
+        """
+        Tests that rows moved before an archive job fails stay readable, and a rerun finishes the job.
+        """
+        # Fails every delete after the first batch
+        db_manager.conn.execute("""
+            CREATE TRIGGER fail_archive BEFORE DELETE ON attendance WHEN (SELECT COUNT(*) FROM attendance) < 7
+            BEGIN SELECT RAISE(ABORT, 'disk full'); END
+        """)
+
+        with pytest.raises(sqlite3.DatabaseError):
+            db_manager.archive_attendance(before=datetime(2026, 1, 1), scheme="term", batch_size=1)
+
+        rows, _ = db_manager.get_attendance_page()
+        exported = [row for chunk in db_manager.iter_attendance_export() for row in chunk]
+        hot_rows = db_manager.conn.execute("SELECT COUNT(*) FROM attendance").fetchone()[0]
+        assert hot_rows == 6
+        assert len(rows) == len(exported) == 7
+        assert [p['partition_key'] for p in db_manager.list_partitions()] == ["2025_fall"]
+
+        db_manager.conn.execute("DROP TRIGGER fail_archive")
+        archived = db_manager.archive_attendance(before=datetime(2026, 1, 1), scheme="term", batch_size=1)
+
+        rows, _ = db_manager.get_attendance_page()
+        assert archived == 3
+        assert len(rows) == 7
+        assert db_manager.list_partitions()[0]['row_count'] == 4
+
+    def test_archive_rejects_mixed_schemes(self, db_manager: DatabaseManager):
+        """
+        Tests that a second archive run cannot switch partition schemes.
+        """
+        db_manager.archive_attendance(before=datetime(2025, 11, 1), scheme="month")
+
+        with pytest.raises(ValueError):
+            db_manager.archive_attendance(before=datetime(2026, 2, 1), scheme="term")
+
+    def test_prune_archives(self, db_manager: DatabaseManager):
+        """
+        Tests that pruning removes expired partitions and their files.
+        """
+        db_manager.archive_attendance(before=datetime(2026, 1, 1), scheme="month")
+        file_paths = [p['file_path'] for p in db_manager.list_partitions()]
+
+        pruned = db_manager.prune_archives(before=datetime(2025, 11, 1))
+
+        assert pruned == 2
+        assert [p['partition_key'] for p in db_manager.list_partitions()] == ["2025_11", "2025_12"]
+        assert not os.path.exists(file_paths[0])
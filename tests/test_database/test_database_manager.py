@@ -4,8 +4,8 @@ import uuid
 from datetime import datetime
 import sqlite3
 
-from src.database.database_manager import DatabaseManager
-from src.database.db_models import Student, AttendanceRecord
+from src.database.database_manager import DatabaseManager, GalleryModelError
+from src.database.db_models import Student, AttendanceRecord, StudentMatch, rows_to_columns
 
 
 @pytest.fixture(scope="function")
@@ -210,4 +210,253 @@ class TestDatabaseManager:
         records = db_manager.get_all_attendance()
 
         assert result is False
-        assert len(records) == 0
\ No newline at end of file
+        assert len(records) == 0
+
+    def test_get_student_rows_matches_pydantic_path(self, db_manager: DatabaseManager):
+        """
+        Tests that the lightweight student rows carry the same data as get_all_students.
+        """
+        for _ in range(5):
+            db_manager.add_student(create_dummy_student())
+
+        records = db_manager.get_all_students(page_size=10)
+        rows = db_manager.get_student_rows(page_size=10)
+
+        assert [tuple(record.model_dump().values()) for record in records] == [tuple(row) for row in rows]
+
+    def test_get_student_row(self, db_manager: DatabaseManager):
+        """
+        Tests looking a student up by ID.
+        """
+        student = create_dummy_student()
+        db_manager.add_student(student)
+
+        row = db_manager.get_student_row(student.student_id)
+
+        assert row == (student.student_id, student.student_name, student.student_image_path)
+        assert db_manager.get_student_row("missing") is None
+
+    def test_find_similar_student_rows_embeddings_on_request(self, db_manager: DatabaseManager):
+        """
+        Tests that the lightweight search only returns embeddings when asked for.
+        """
+        student = create_dummy_student()
+        db_manager.add_student(student)
+
+        without_embeddings = db_manager.find_similar_student_rows(student.student_face_embedding, k=1)
+        with_embeddings = db_manager.find_similar_student_rows(student.student_face_embedding, k=1, include_embeddings=True)
+
+        assert without_embeddings[0].student_id == student.student_id
+        assert without_embeddings[0].student_face_embedding is None
+        assert np.isclose(without_embeddings[0].similarity_score, 1.0, atol=1e-5)
+        assert np.allclose(with_embeddings[0].student_face_embedding, student.student_face_embedding)
+
+    def test_rows_to_columns(self, db_manager: DatabaseManager):
+        """
+        Tests that search rows can be transposed into column-oriented arrays.
+        """
+        for i in range(4):
+            db_manager.add_student(create_dummy_student(f"Student_{i}"))
+
+        rows = db_manager.find_similar_student_rows(np.random.rand(512).astype(np.float32), k=3, include_embeddings=True)
+        columns = rows_to_columns(rows, StudentMatch)
+
+        assert columns["similarity_score"].dtype == np.float32
+        assert columns["student_face_embedding"].shape == (3, 512)
+        assert list(columns["student_id"]) == [row.student_id for row in rows]
+
+    def test_rows_to_columns_missing_embeddings(self, db_manager: DatabaseManager):
+        """
+        Tests that rows without embeddings keep the embedding column as long as the others.
+        """
+        for i in range(4):
+            db_manager.add_student(create_dummy_student(f"Student_{i}"))
+
+        query = np.random.rand(512).astype(np.float32)
+        rows = db_manager.find_similar_student_rows(query, k=3)
+        mixed = rows[:2] + db_manager.find_similar_student_rows(query, k=1, include_embeddings=True)
+        columns = rows_to_columns(rows, StudentMatch)
+        mixed_columns = rows_to_columns(mixed, StudentMatch)
+        empty_columns = rows_to_columns([], StudentMatch)
+
+        assert columns["student_face_embedding"].shape == (3,)
+        assert list(columns["student_face_embedding"]) == [None, None, None]
+        assert mixed_columns["student_face_embedding"].dtype == object
+        assert mixed_columns["student_face_embedding"][:2].tolist() == [None, None]
+        assert mixed_columns["student_face_embedding"][2].shape == (512,)
+        assert empty_columns["student_face_embedding"].shape == (0, 512)
+        assert all(len(column) == 0 for column in empty_columns.values())
+
+    def test_get_attendance_page_keyset_paging(self, db_manager: DatabaseManager):
+        """
+        Tests that following next_key visits every record exactly once, in order.
+        """
+        student = create_dummy_student()
+        db_manager.add_student(student)
+        for minute in range(25):
+            db_manager.add_attendance_record(AttendanceRecord(
+                attend_id=str(uuid.uuid4()),
+                student_id=student.student_id,
+                recorded_frame="/path/to/frame.jpg",
+                attend_datetime=datetime(2025, 9, 1, 9, minute % 10),
+                hall="Hall A" if minute % 2 else None
+            ))
+
+        for order_by in ("attend_datetime", "student_id", "hall"):
+            seen, after = [], None
+            while True:
+                rows, after = db_manager.get_attendance_page(order_by=order_by, after=after, page_size=10)
+                seen.extend(rows)
+                if after is None:
+                    break
+
+            assert len(seen) == 25
+            assert len({row[0] for row in seen}) == 25
+
+        rows, _ = db_manager.get_attendance_page(descending=False, page_size=25)
+        assert [row[4] for row in rows] == sorted(row[4] for row in rows)
+
+    def test_get_attendance_page_invalid_order_by_raises_error(self, db_manager: DatabaseManager):
+        """
+        Tests that an unknown sort column raises a ValueError.
+        """
+        with pytest.raises(ValueError):
+            db_manager.get_attendance_page(order_by="recorded_frame")
+
+    def test_get_attendance_page_filters(self, db_manager: DatabaseManager):
+        """
+        Tests that the hall, student and date range filters narrow every page.
+        """
+        alice, bob = create_dummy_student("Alice"), create_dummy_student("Bob")
+        db_manager.add_student(alice)
+        db_manager.add_student(bob)
+        for day in range(1, 7):
+            for student in (alice, bob):
+                db_manager.add_attendance_record(AttendanceRecord(
+                    attend_id=str(uuid.uuid4()),
+                    student_id=student.student_id,
+                    recorded_frame="/path/to/frame.jpg",
+                    attend_datetime=datetime(2025, 9, day, 9, 0),
+                    hall="Hall A" if day % 2 else "Hall B"
+                ))
+
+        rows, next_key = db_manager.get_attendance_page(
+            hall="Hall A", student_id=alice.student_id,
+            start=datetime(2025, 9, 2), end=datetime(2025, 9, 6)
+        )
+
+        # Days 3 and 5 are in Hall A inside [2nd, 6th)
+        assert next_key is None
+        assert [row[4][:10] for row in rows] == ["2025-09-05", "2025-09-03"]
+        assert {(row[1], row[2], row[3]) for row in rows} == {(alice.student_id, alice.student_name, "Hall A")}
+
+    def test_get_attendance_page_orders_missing_halls_first(self, db_manager: DatabaseManager):
+        """
+        Tests that records without a hall sort as '' and keyset paging across them neither skips nor repeats rows.
+        """
+        student = create_dummy_student()
+        db_manager.add_student(student)
+        halls = [None, "Hall B", None, "Hall A", None, "Hall B", "Hall A"]
+        for minute, hall in enumerate(halls):
+            db_manager.add_attendance_record(AttendanceRecord(
+                attend_id=str(uuid.uuid4()),
+                student_id=student.student_id,
+                recorded_frame="/path/to/frame.jpg",
+                attend_datetime=datetime(2025, 9, 1, 9, minute),
+                hall=hall
+            ))
+
+        seen, after = [], None
+        while True:
+            rows, after = db_manager.get_attendance_page(order_by="hall", descending=False, after=after, page_size=2)
+            seen.extend(rows)
+            if after is None:
+                break
+
+        assert [row[3] for row in seen] == [None, None, None, "Hall A", "Hall A", "Hall B", "Hall B"]
+        assert len({row[0] for row in seen}) == len(halls)
+        # Within a hall, rows follow the tie-breaking datetime
+        assert [row[4] for row in seen[:3]] == sorted(row[4] for row in seen[:3])
+
+    def test_scoped_search_only_finds_enrolled_students(self, db_manager: DatabaseManager):
+        """
+        Tests that a scoped search is limited to the scope's students and scores like the full search.
+        """
+        hall_b = [create_dummy_student("HallB") for _ in range(3)]
+        elsewhere = create_dummy_student("Elsewhere")
+        for student in hall_b[:2]:
+            student.scopes = ["Hall B", "CS101"]
+            db_manager.add_student(student)
+        db_manager.add_student(hall_b[2])
+        db_manager.add_student(elsewhere)
+        assert db_manager.add_students_to_scope("Hall B", [hall_b[2].student_id, "missing-id"]) == 1
+
+        query = elsewhere.student_face_embedding
+        scoped = db_manager.find_similar_student_rows(query, k=10, scope="Hall B")
+        everyone = db_manager.find_similar_student_rows(query, k=10)
+
+        assert {match.student_id for match in scoped} == {student.student_id for student in hall_b}
+        assert everyone[0].student_id == elsewhere.student_id
+        full_scores = {match.student_id: match.similarity_score for match in everyone}
+        for match in scoped:
+            assert np.isclose(match.similarity_score, full_scores[match.student_id], atol=1e-4)
+        assert [match.similarity_score for match in scoped] == sorted((m.similarity_score for m in scoped), reverse=True)
+        assert db_manager.find_similar_students(query, k=1, scope="CS101")[0].student_id in {s.student_id for s in hall_b[:2]}
+
+    def test_scope_changes_refresh_the_index(self, db_manager: DatabaseManager):
+        student = create_dummy_student()
+        db_manager.add_student(student)
+
+        assert db_manager.find_similar_student_rows(student.student_face_embedding, k=1, scope="Hall A") == []
+        db_manager.add_students_to_scope("Hall A", [student.student_id])
+        assert db_manager.find_similar_student_rows(student.student_face_embedding, k=1, scope="Hall A")[0].student_id == student.student_id
+        assert db_manager.list_scopes() == [("Hall A", 1)]
+        assert db_manager.get_student_scopes(student.student_id) == ["Hall A"]
+
+        assert db_manager.remove_students_from_scope("Hall A", [student.student_id]) == 1
+        assert db_manager.find_similar_student_rows(student.student_face_embedding, k=1, scope="Hall A") == []
+
+    def test_scope_index_sees_changes_from_another_connection(self, tmp_path):
+        """
+        Tests that a cached scope index is rebuilt after another process enrolls or removes students.
+        """
+        db_path = str(tmp_path / "attendance.db")
+        daemon, cli = DatabaseManager(db_path), DatabaseManager(db_path)
+        try:
+            first, second = create_dummy_student(), create_dummy_student()
+            first.scopes = ["Hall A"]
+            daemon.add_student(first)
+            assert len(daemon.find_similar_student_rows(first.student_face_embedding, k=5, scope="Hall A")) == 1
+
+            second.scopes = ["Hall A"]
+            cli.add_student(second)
+            matches = daemon.find_similar_student_rows(second.student_face_embedding, k=5, scope="Hall A")
+            assert matches[0].student_id == second.student_id and len(matches) == 2
+
+            cli.remove_students_from_scope("Hall A", [first.student_id])
+            matches = daemon.find_similar_student_rows(first.student_face_embedding, k=5, scope="Hall A")
+            assert [match.student_id for match in matches] == [second.student_id]
+        finally:
+            daemon.close()
+            cli.close()
+
+    def test_gallery_model_tags_refuse_mixing(self, db_manager: DatabaseManager):
+        """
+        Tests that embeddings of another model are refused and that a mixed gallery fails the check.
+        """
+        legacy = create_dummy_student()
+        tagged = create_dummy_student()
+        tagged.embedding_model = "buffalo_l"
+        other = create_dummy_student()
+        other.embedding_model = "antelopev2"
+
+        assert db_manager.add_student(legacy) is True
+        assert db_manager.add_student(tagged) is True
+        assert db_manager.add_student(other) is False
+        db_manager.check_gallery_model("buffalo_l")
+        with pytest.raises(GalleryModelError, match="embedded with 'buffalo_l'"):
+            db_manager.check_gallery_model("antelopev2")
+
+        db_manager.conn.execute("UPDATE students SET embedding_model = 'antelopev2' WHERE student_id = ?", (legacy.student_id,))
+        with pytest.raises(GalleryModelError, match="mixes"):
+            db_manager.check_gallery_model("buffalo_l")
@@ -0,0 +1,88 @@
+import pytest
+import numpy as np
+import csv
+import uuid
+from datetime import datetime, timedelta
+
+from src.database.database_manager import DatabaseManager
+from src.database.db_models import Student, AttendanceRecord
+from src.database.export import export_attendance, EXPORT_FIELDS
+
+
+@pytest.fixture(scope="function")
+def db_manager():
+    """
+    Pytest fixture providing an in-memory DatabaseManager with two students
+    and attendance spread over two halls and four days.
+    """
+    manager = DatabaseManager(db_path=":memory:")
+
+    for student_id in ("S01", "S02"):
+        manager.add_student(Student(
+            student_id=student_id,
+            student_name=f"Name {student_id}",
+            student_image_path=f"path/to/{student_id}.png",
+            student_face_embedding=np.random.rand(512).astype(np.float32)
+        ))
+
+    start = datetime(2025, 9, 1, 9, 0, 0)
+    for day in range(4):
+        for student_id, hall in (("S01", "Hall A"), ("S02", "Hall B")):
+            manager.add_attendance_record(AttendanceRecord(
+                attend_id=str(uuid.uuid4()),
+                student_id=student_id,
+                recorded_frame="/path/to/frame.jpg",
+                attend_datetime=start + timedelta(days=day),
+                hall=hall
+            ))
+
+    yield manager
+    manager.close()
+
+
+class TestExport:
+
+    def test_iter_attendance_export_chunks(self, db_manager: DatabaseManager):
+        """
+        Tests that the export generator yields bounded chunks covering every row.
+        """
+        chunks = list(db_manager.iter_attendance_export(chunk_size=3))
+
+        assert [len(chunk) for chunk in chunks] == [3, 3, 2]
+
+    def test_iter_attendance_export_filters(self, db_manager: DatabaseManager):
+        """
+        Tests the date range, hall and student filters of the export generator.
+        """
+        rows = [row for chunk in db_manager.iter_attendance_export(
+            start=datetime(2025, 9, 2), end=datetime(2025, 9, 4), hall="Hall B"
+        ) for row in chunk]
+
+        assert len(rows) == 2
+        assert all(row[1] == "S02" and row[3] == "Hall B" for row in rows)
+
+        rows = [row for chunk in db_manager.iter_attendance_export(student_id="S01") for row in chunk]
+        assert len(rows) == 4
+
+    def test_export_attendance_csv(self, db_manager: DatabaseManager, tmp_path):
+        """
+        Tests that the CSV export writes a header and one line per record.
+        """
+        output_path = tmp_path / "attendance.csv"
+
+        row_count = export_attendance(db_manager, str(output_path), "csv", chunk_size=3)
+
+        with open(output_path, newline="") as f:
+            lines = list(csv.reader(f))
+
+        assert row_count == 8
+        assert lines[0] == EXPORT_FIELDS
+        assert len(lines) == 9
+        assert lines[1][2] == "Name S01"
+
+    def test_export_attendance_invalid_format_raises_error(self, db_manager: DatabaseManager, tmp_path):
+        """
+        Tests that an unknown export format raises a ValueError.
+        """
+        with pytest.raises(ValueError):
+            export_attendance(db_manager, str(tmp_path / "attendance.xlsx"), "xlsx")
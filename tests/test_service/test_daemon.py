@@ -0,0 +1,249 @@
+import pytest
+import numpy as np
+import threading
+from types import SimpleNamespace
+
+import cv2
+
+from src.daemon import load_models
+from src.database.database_manager import DatabaseManager
+from src.database.db_models import Student
+from src.service.ipc_client import DaemonClient, DaemonError
+from src.service.ipc_server import IpcServer
+from src.service.recognition_service import RecognitionService
+from src.utils.config import RecognitionConfig
+from src.vision.face_analyzer import FaceAnalyzer
+from src.vision.frame_recording import FrameRecorder, ReplaySource
+from src.vision.frame_sources import VideoSource
+from src.vision.pipeline import RecognitionPipeline
+
+
+FRAME_COUNT = 12
+
+
+class BrokenAnalyzer(FaceAnalyzer):
+    """A FaceAnalyzer whose models fail to load."""
+
+    def prepare(self, session_config=None, model_config=None):
+        raise RuntimeError("model file is corrupt")
+
+
+class ScriptedAnalyzer(FaceAnalyzer):
+    """A FaceAnalyzer that 'finds' one tracked face with a fixed embedding in every frame, without models."""
+
+    def __init__(self, embedding: np.ndarray):
+        super().__init__()
+        self.app = "scripted"
+        self.embedding = embedding
+
+    def process_frame(self, frame, metrics=None):
+        face = SimpleNamespace(
+            bbox=np.array([10.0, 8.0, 40.0, 38.0]), det_score=0.9, track_id=1, normed_embedding=self.embedding
+        )
+        return frame, [face]
+
+
+@pytest.fixture(scope="function")
+def video_path(tmp_path):
+    path = str(tmp_path / "feed.avi")
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), 25, (64, 48))
+    for i in range(FRAME_COUNT):
+        writer.write(np.full((48, 64, 3), i * 20, dtype=np.uint8))
+    writer.release()
+    return path
+
+
+@pytest.fixture(scope="function")
+def embedding():
+    vector = np.random.default_rng(0).standard_normal(512).astype(np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+@pytest.fixture(scope="function")
+def db_manager(embedding):
+    manager = DatabaseManager(db_path=":memory:")
+    manager.add_student(Student(
+        student_id="S01",
+        student_name="Alice",
+        student_image_path="path/to/image.png",
+        student_face_embedding=embedding
+    ))
+    yield manager
+    manager.close()
+
+
+@pytest.fixture(scope="function")
+def daemon(tmp_path, video_path, db_manager, embedding):
+    service = RecognitionService(ScriptedAnalyzer(embedding), db_manager, VideoSource(video_path, loop=True),
+                                 recognition_config=RecognitionConfig(min_votes=1))
+    server = IpcServer(service, str(tmp_path / "daemon.sock"), heartbeat_interval=0.2)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield service, server
+    server.request_shutdown()
+    thread.join(5)
+    service.stop()
+    server.server_close()
+
+
+class TestRecognitionPipeline:
+
+    def test_file_source_runs_to_the_end(self, video_path, embedding):
+        """
+        Tests that every frame of a video file is processed and the pipeline ends without error.
+        """
+        frame_signals = []
+        pipeline = RecognitionPipeline(ScriptedAnalyzer(embedding), VideoSource(video_path),
+                                       on_frame=lambda: frame_signals.append(1))
+
+        error = pipeline.run()
+
+        assert error is None
+        assert pipeline.frames_processed == FRAME_COUNT
+        sequence, frame, result = pipeline.wait_for_frame(after=0, timeout=0)
+        assert sequence == FRAME_COUNT
+        assert frame.shape == (48, 64, 3)
+        assert len(result) == 1
+        # Nobody took the frames, so only the first one signalled and the rest were dropped
+        assert len(frame_signals) == 1
+        assert pipeline.dropped_frames == FRAME_COUNT - 1
+
+    def test_replays_a_recording(self, tmp_path, video_path, embedding):
+        """
+        Tests that a recorded session replays through the pipeline like its original source.
+        """
+        source = VideoSource(video_path)
+        assert source.open()
+        with FrameRecorder(str(tmp_path / "session.frames")) as recorder:
+            while (frame := source.read()[1]) is not None:
+                recorder.write(frame)
+        source.release()
+
+        pipeline = RecognitionPipeline(ScriptedAnalyzer(embedding), ReplaySource(recorder.path))
+
+        assert pipeline.run() is None
+        assert pipeline.frames_processed == FRAME_COUNT
+        sequence, frame, result = pipeline.wait_for_frame(after=0, timeout=0)
+        assert frame.shape == (48, 64, 3) and len(result) == 1
+
+    def test_missing_file_reports_an_error(self, tmp_path, embedding):
+        pipeline = RecognitionPipeline(ScriptedAnalyzer(embedding), VideoSource(str(tmp_path / "missing.avi")))
+
+        assert "Could not open" in pipeline.run()
+
+
+class TestRecognitionService:
+
+    def test_identifies_tracks_and_broadcasts(self, video_path, db_manager, embedding):
+        """
+        Tests that a track is identified by vote over searches of its fused embedding and reported to subscribers.
+        """
+        config = RecognitionConfig(min_samples=3, research_frames=3, min_votes=2)
+        service = RecognitionService(ScriptedAnalyzer(embedding), db_manager, VideoSource(video_path),
+                                     recognition_config=config)
+        events = service.subscribe()
+
+        service.start()
+        assert service.wait(timeout=10)
+
+        events = [events.get_nowait() for _ in range(events.qsize())]
+        recognitions = [event for event in events if event["type"] == "recognitions"]
+        identities = [event for event in events if event["type"] == "identity"]
+        assert len(recognitions) == FRAME_COUNT
+        assert len(identities) == 1
+        assert identities[0]["frame"] == 5
+        assert identities[0]["student_id"] == "S01"
+        assert identities[0]["votes"] == 2
+        assert identities[0]["similarity"] == pytest.approx(1.0, abs=1e-3)
+        # Unlabelled until the identity is committed, never flipping afterwards
+        assert [event["faces"][0]["student_name"] for event in recognitions] == [None] * 5 + ["Alice"] * 7
+        assert service.status()["gallery_searches"] == 2
+        _, _, result = service.latest_frame(timeout=0)
+        assert result.labels[0].startswith("Alice")
+        assert result.student_ids == ["S01"]
+
+    def test_unknown_face_is_not_identified(self, video_path, db_manager):
+        stranger = np.zeros(512, dtype=np.float32)
+        stranger[0] = 1.0
+        service = RecognitionService(ScriptedAnalyzer(stranger), db_manager, VideoSource(video_path),
+                                     recognition_config=RecognitionConfig(match_threshold=0.9))
+        events = service.subscribe()
+
+        service.start()
+        service.wait(timeout=10)
+
+        assert events.get_nowait()["faces"][0]["student_id"] is None
+        assert service.status()["identified_tracks"] == 0
+
+
+class TestIpc:
+
+    def test_status_and_control(self, daemon):
+        """
+        Tests starting, inspecting and stopping the pipeline over the socket.
+        """
+        service, server = daemon
+        client = DaemonClient(server.socket_path)
+
+        assert client.status()["running"] is False
+        assert client.start() is True
+        # The track is identified by its first search, on the third frame
+        latest = client.latest_frame(after=3, timeout=5)
+        assert client.status()["running"] is True
+        client.stop()
+        client.close()
+
+        sequence, frame, result = latest
+        assert sequence > 3
+        assert frame.shape == (48, 64, 3)
+        assert result.labels[0].startswith("Alice")
+        assert result.student_ids == ["S01"]
+        assert service.is_running is False
+
+    def test_subscribe_streams_recognitions(self, daemon):
+        service, server = daemon
+        client = DaemonClient(server.socket_path)
+        events = client.subscribe()
+
+        heartbeat = next(events)
+        client.start()
+        identity = next(event for event in events if event["type"] == "identity")
+        event = next(event for event in events if event["type"] == "recognitions")
+        events.close()
+        client.close()
+
+        assert heartbeat["type"] == "heartbeat"
+        assert identity["student_name"] == "Alice"
+        assert event["faces"][0]["student_name"] == "Alice"
+
+    def test_errors_and_shutdown(self, daemon):
+        service, server = daemon
+        client = DaemonClient(server.socket_path)
+
+        with pytest.raises(DaemonError, match="Unknown command"):
+            client.request("reboot")
+        client.shutdown()
+
+        with pytest.raises(DaemonError):
+            DaemonClient(server.socket_path, timeout=1).status()
+
+
+class TestDaemon:
+
+    def test_failed_model_load_shuts_down(self, tmp_path, video_path, db_manager):
+        """
+        Tests that the daemon reports a model loading failure and stops serving instead of hanging.
+        """
+        service = RecognitionService(BrokenAnalyzer(), db_manager, VideoSource(video_path))
+        server = IpcServer(service, str(tmp_path / "daemon.sock"))
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+        config = SimpleNamespace(onnxruntime=None, models=None)
+        load_models(service.face_analyzer, service, server, config, autostart=True, exit_at_end=False)
+        thread.join(5)
+        server.server_close()
+
+        assert not thread.is_alive()
+        assert service.last_error == "Could not load the face analysis models: model file is corrupt"
+        assert service.is_running is False
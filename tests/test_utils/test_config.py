@@ -0,0 +1,60 @@
+import pytest
+
+from src.utils.config import AppConfig, OnnxRuntimeConfig, load_config
+
+
+class TestConfig:
+
+    def test_missing_file_uses_defaults(self, tmp_path):
+        """
+        Tests that a missing config file falls back to the defaults.
+        """
+        config = load_config(str(tmp_path / "missing.yaml"))
+
+        assert config == AppConfig()
+        assert config.onnxruntime.providers == ["CPUExecutionProvider"]
+
+    def test_partial_file_overrides_only_given_keys(self, tmp_path):
+        """
+        Tests that keys in the file override the defaults and the rest are kept.
+        """
+        path = tmp_path / "config.yaml"
+        path.write_text("onnxruntime:\n  providers: [CUDAExecutionProvider, CPUExecutionProvider]\n  intra_op_num_threads: 3\n")
+
+        config = load_config(str(path))
+
+        assert config.onnxruntime.providers == ["CUDAExecutionProvider", "CPUExecutionProvider"]
+        assert config.onnxruntime.intra_op_num_threads == 3
+        assert config.onnxruntime.graph_optimization_level == OnnxRuntimeConfig().graph_optimization_level
+
+    def test_invalid_value_is_rejected(self, tmp_path):
+        """
+        Tests that invalid settings fail at load time rather than at session creation.
+        """
+        path = tmp_path / "config.yaml"
+        path.write_text("onnxruntime:\n  execution_mode: fastest\n")
+
+        with pytest.raises(ValueError):
+            load_config(str(path))
+
+    def test_session_options(self):
+        """
+        Tests that the settings are applied to the ONNX Runtime session options.
+        """
+        onnxruntime = pytest.importorskip("onnxruntime")
+        session_config = OnnxRuntimeConfig(
+            providers=["CPUExecutionProvider"], intra_op_num_threads=2, inter_op_num_threads=1,
+            execution_mode="parallel", enable_cpu_mem_arena=False, allow_spinning=False
+        )
+
+        sess_options = session_config.build_session_options()
+        cached_options = session_config.build_session_options(cached=True)
+
+        assert sess_options.intra_op_num_threads == 2
+        assert sess_options.inter_op_num_threads == 1
+        assert sess_options.execution_mode == onnxruntime.ExecutionMode.ORT_PARALLEL
+        assert not sess_options.enable_cpu_mem_arena
+        assert sess_options.get_session_config_entry("session.intra_op.allow_spinning") == "0"
+        assert sess_options.graph_optimization_level == onnxruntime.GraphOptimizationLevel.ORT_ENABLE_EXTENDED
+        assert cached_options.graph_optimization_level == onnxruntime.GraphOptimizationLevel.ORT_DISABLE_ALL
+        assert session_config.build_provider_options() == [{}]
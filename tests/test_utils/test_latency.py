@@ -0,0 +1,71 @@
+import json
+import time
+
+import numpy as np
+
+from src.utils.latency import LatencyMetrics, RollingHistogram, dump_metrics, format_summaries
+
+
+class TestLatencyMetrics:
+
+    def test_histogram_keeps_only_the_window(self):
+        """
+        Tests that the ring buffer drops the oldest samples once full.
+        """
+        histogram = RollingHistogram(window=3)
+        for value in (1.0, 2.0, 3.0, 4.0, 5.0):
+            histogram.record(value)
+
+        samples, count = histogram.snapshot()
+
+        assert sorted(samples) == [3.0, 4.0, 5.0]
+        assert count == 5
+
+    def test_percentiles(self):
+        """
+        Tests that summaries report the percentiles of each stage's window.
+        """
+        metrics = LatencyMetrics("camera0", window=100)
+        for value in range(1, 101):
+            metrics.record("detection", value / 1000)
+        with metrics.time("tracking"):
+            time.sleep(0.001)
+
+        summaries = {summary.stage: summary for summary in metrics.summaries()}
+
+        assert list(summaries) == ["detection", "tracking"]
+        assert summaries["detection"].count == 100
+        assert np.isclose(summaries["detection"].p50, np.percentile(np.arange(1, 101), 50))
+        assert np.isclose(summaries["detection"].p99, np.percentile(np.arange(1, 101), 99))
+        assert summaries["tracking"].p50 >= 1.0
+
+    def test_disabled_metrics_record_nothing(self):
+        """
+        Tests that disabled metrics share a no-op timer and keep no samples.
+        """
+        metrics = LatencyMetrics("camera0", enabled=False)
+
+        with metrics.time("detection"):
+            pass
+        metrics.record("capture", 0.01)
+
+        assert metrics.time("detection") is metrics.time("capture")
+        assert metrics.summaries() == []
+
+    def test_format_and_dump(self, tmp_path):
+        """
+        Tests the status bar text and that each dump appends one JSON line per snapshot.
+        """
+        metrics = LatencyMetrics("camera0")
+        metrics.record("capture", 0.010)
+        metrics.record("detection", 0.020)
+        path = tmp_path / "metrics.jsonl"
+
+        dump_metrics(str(path), [metrics])
+        dump_metrics(str(path), [metrics])
+
+        assert format_summaries(metrics.summaries(), ["detection"]) == "detection 20.0/20.0 ms"
+        lines = path.read_text().splitlines()
+        assert len(lines) == 2
+        snapshot = json.loads(lines[0])
+        assert snapshot["streams"]["camera0"]["capture"]["p95"] == 10.0
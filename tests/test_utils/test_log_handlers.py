@@ -0,0 +1,118 @@
+import csv
+import logging
+import time
+
+from src.utils.log_formatters import CsvFormatter
+from src.utils.log_handlers import BufferedCsvHandler
+
+
+FIELDS = ['date', 'name', 'id', 'hall']
+
+
+def attendance_record(i: int) -> logging.LogRecord:
+    record = logging.LogRecord("attendance", logging.INFO, __file__, 0, "Attendance recorded", None, None)
+    record.csv_data = {'date': '2025-09-01 09:00:00', 'name': f'Student, "{i}"', 'id': f'S{i}', 'hall': 'Hall A'}
+    return record
+
+
+def make_handler(path, **kwargs) -> BufferedCsvHandler:
+    handler = BufferedCsvHandler(str(path), **kwargs)
+    handler.setFormatter(CsvFormatter(FIELDS))
+    return handler
+
+
+def read_rows(path) -> list:
+    with open(path, newline="") as f:
+        return list(csv.reader(f))
+
+
+class TestCsvLogging:
+
+    def test_formatter_output(self):
+        """
+        Tests that the formatter quotes values and no longer prepends a header.
+        """
+        formatter = CsvFormatter(FIELDS)
+
+        assert formatter.format(attendance_record(1)) == '"2025-09-01 09:00:00","Student, ""1""","S1","Hall A"'
+        assert formatter.format(attendance_record(2)).startswith('"2025')
+
+    def test_rows_are_batched(self, tmp_path):
+        """
+        Tests that rows are held back until the batch is full or the handler is flushed.
+        """
+        path = tmp_path / "attendance.csv"
+        handler = make_handler(path, capacity=3, flush_interval=60)
+
+        handler.handle(attendance_record(1))
+        handler.handle(attendance_record(2))
+        assert not path.exists()
+
+        handler.handle(attendance_record(3))
+        assert len(read_rows(path)) == 4
+
+        handler.handle(attendance_record(4))
+        handler.close()
+        assert [row[2] for row in read_rows(path)] == ['id', 'S1', 'S2', 'S3', 'S4']
+
+    def test_header_written_once_across_restarts(self, tmp_path):
+        """
+        Tests that appending to an existing file does not repeat the header.
+        """
+        path = tmp_path / "attendance.csv"
+        for i in range(3):
+            handler = make_handler(path)
+            handler.handle(attendance_record(i))
+            handler.close()
+
+        rows = read_rows(path)
+        assert rows[0] == FIELDS
+        assert [row[2] for row in rows[1:]] == ['S0', 'S1', 'S2']
+
+    def test_periodic_flush(self, tmp_path):
+        path = tmp_path / "attendance.csv"
+        handler = make_handler(path, capacity=1000, flush_interval=0.05)
+
+        handler.handle(attendance_record(1))
+        deadline = time.monotonic() + 5
+        while not path.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        handler.close()
+
+        assert len(read_rows(path)) == 2
+
+    def test_throughput(self, tmp_path):
+        """
+        Tests that the sink keeps up with thousands of events per second.
+        """
+        path = tmp_path / "attendance.csv"
+        handler = make_handler(path)
+        records = [attendance_record(i) for i in range(20000)]
+
+        start = time.perf_counter()
+        for record in records:
+            handler.handle(record)
+        handler.close()
+        elapsed = time.perf_counter() - start
+
+        assert len(read_rows(path)) == 20001
+        assert 20000 / elapsed > 5000
+
+    def test_setup_logging_writes_through_queues(self, tmp_path, monkeypatch):
+        """
+        Tests that records logged after setup_logging reach the files once logging is stopped.
+        """
+        monkeypatch.chdir(tmp_path)
+        from src.utils import logs
+        try:
+            logs.setup_logging()
+            logs.record_attendance("Alice", "S01", "Hall A")
+            logging.getLogger("tests").info("hello")
+        finally:
+            logs.stop_logging()
+            for name in ('', 'attendance'):
+                for handler in list(logging.getLogger(name).handlers):
+                    logging.getLogger(name).removeHandler(handler)
+
+        assert read_rows(tmp_path / "attendance.csv")[1][1:] == ["Alice", "S01", "Hall A"]
+        assert "hello" in (tmp_path / "app.log").read_text()
@@ -0,0 +1,82 @@
+import pytest
+import logging
+import os
+
+from src.utils.log_tail import LogTailer
+
+
+def write(path, text, mode="a"):
+    with open(path, mode) as f:
+        f.write(text)
+
+
+def line(name: str, level: str, message: str) -> str:
+    return f"[2025-09-01 09:00:00,000] - [{name}] - {level} - {message}\n"
+
+
+@pytest.fixture(scope="function")
+def log_path(tmp_path):
+    path = tmp_path / "app.log"
+    write(path, line("views.main_window", "INFO", "first"), mode="w")
+    return str(path)
+
+
+class TestLogTailer:
+
+    def test_poll_reads_only_new_lines(self, log_path):
+        """
+        Tests that each poll returns only what was appended since the previous one.
+        """
+        tailer = LogTailer(log_path)
+
+        assert [entry.message for entry in tailer.poll()] == ["first"]
+        assert tailer.poll() == []
+
+        write(log_path, line("database.database_manager", "ERROR", "second"))
+        entries = tailer.poll()
+
+        assert len(entries) == 1
+        assert entries[0].name == "database.database_manager"
+        assert entries[0].levelno == logging.ERROR
+
+    def test_partial_lines_are_buffered(self, log_path):
+        """
+        Tests that a line written in two parts is only returned once complete.
+        """
+        tailer = LogTailer(log_path)
+        tailer.poll()
+
+        full_line = line("vision.camera_manager", "WARNING", "split")
+        write(log_path, full_line[:20])
+        assert tailer.poll() == []
+
+        write(log_path, full_line[20:])
+        assert [entry.message for entry in tailer.poll()] == ["split"]
+
+    def test_rotation_is_followed(self, log_path):
+        """
+        Tests that lines written just before a rotation and lines in the new file are both read.
+        """
+        tailer = LogTailer(log_path)
+        tailer.poll()
+
+        write(log_path, line("root", "INFO", "before rotation"))
+        os.rename(log_path, f"{log_path}.1")
+        write(log_path, line("root", "INFO", "after rotation"), mode="w")
+
+        assert [entry.message for entry in tailer.poll()] == ["before rotation", "after rotation"]
+
+    def test_ring_buffer_and_filters(self, log_path):
+        """
+        Tests that the buffer is bounded and can be filtered by level and logger.
+        """
+        tailer = LogTailer(log_path, max_entries=3)
+        write(log_path, line("views.main_window", "DEBUG", "a"))
+        write(log_path, line("database.database_manager", "ERROR", "b"))
+        write(log_path, line("views.attendance_dialog", "WARNING", "c"))
+        write(log_path, "Traceback (most recent call last):\n")
+        tailer.poll()
+
+        assert [entry.message for entry in tailer.entries] == ["b", "c", "Traceback (most recent call last):"]
+        assert [entry.message for entry in tailer.filtered(min_level=logging.ERROR)] == ["b"]
+        assert [entry.message for entry in tailer.filtered(name_prefix="views")] == ["c", "Traceback (most recent call last):"]
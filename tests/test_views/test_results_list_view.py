@@ -0,0 +1,58 @@
+import pytest
+
+from src.views.results_list_view import PixmapCache
+
+
+class FakePixmapCache(PixmapCache):
+    """A PixmapCache that records loads instead of decoding images, so no QApplication is needed."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.loads = []
+
+    def _load(self, image_path: str):
+        self.loads.append(image_path)
+        return f"pixmap of {image_path}"
+
+    def _default(self):
+        return "default pixmap"
+
+
+@pytest.fixture(scope="function")
+def photos(tmp_path):
+    paths = {}
+    for student_id in ("S01", "S02", "S03"):
+        paths[student_id] = str(tmp_path / f"{student_id}.jpg")
+        open(paths[student_id], "wb").close()
+    return paths
+
+
+class TestPixmapCache:
+
+    def test_evicts_least_recently_used(self, photos):
+        """
+        Tests that a hit refreshes an entry, so the least recently used one is evicted.
+        """
+        cache = FakePixmapCache(capacity=2)
+
+        cache.get("S01", photos["S01"])
+        cache.get("S02", photos["S02"])
+        assert cache.get("S01", photos["S01"]) == f"pixmap of {photos['S01']}"
+        cache.get("S03", photos["S03"])
+        cache.get("S01", photos["S01"])
+        cache.get("S02", photos["S02"])
+
+        assert len(cache) == 2
+        assert cache.loads == [photos["S01"], photos["S02"], photos["S03"], photos["S02"]]
+
+    def test_prefers_thumbnail_and_falls_back_to_default(self, photos, tmp_path):
+        """
+        Tests that the enrollment thumbnail is loaded instead of the photo, and missing photos share the default.
+        """
+        thumbnail = str(tmp_path / "S01.thumb.jpg")
+        open(thumbnail, "wb").close()
+        cache = FakePixmapCache()
+
+        assert cache.get("S01", photos["S01"]) == f"pixmap of {thumbnail}"
+        assert cache.get("S04", str(tmp_path / "missing.jpg")) == "default pixmap"
+        assert cache.get("S05", None) == "default pixmap"
@@ -0,0 +1,50 @@
+import pytest
+
+from src.views.video_display_label import RenderStats
+
+
+class TestRenderStats:
+
+    def test_empty_and_single_frame(self):
+        """
+        Tests that no rate is reported until two frames were rendered.
+        """
+        stats = RenderStats()
+        assert stats.fps == 0.0 and stats.gui_ms_per_frame == 0.0
+
+        stats.record(10.0, 0.004)
+
+        assert stats.fps == 0.0
+        assert stats.gui_ms_per_frame == pytest.approx(4.0)
+
+    def test_fps_and_gui_time(self):
+        """
+        Tests the frame rate and mean GUI time over frames rendered at 25 FPS.
+        """
+        stats = RenderStats(window_seconds=2.0)
+        for i in range(26):
+            stats.record(100 + i * 0.04, 0.002 if i % 2 else 0.004)
+
+        assert stats.fps == pytest.approx(25.0)
+        assert stats.gui_ms_per_frame == pytest.approx(3.0, abs=0.1)
+
+    def test_window_drops_old_frames(self):
+        """
+        Tests that frames older than the window no longer count, so a slowdown shows up.
+        """
+        stats = RenderStats(window_seconds=1.0)
+        for i in range(30):
+            stats.record(i / 30, 0.010)
+        for i in range(1, 11):
+            stats.record(1 + i / 10, 0.001)
+
+        # Only the last second, at 10 FPS and 1 ms per frame, remains
+        assert stats.fps == pytest.approx(10.0)
+        assert stats.gui_ms_per_frame == pytest.approx(1.0)
+
+    def test_identical_timestamps(self):
+        stats = RenderStats()
+        stats.record(5.0, 0.001)
+        stats.record(5.0, 0.001)
+
+        assert stats.fps == 0.0
@@ -0,0 +1,89 @@
+from types import SimpleNamespace
+
+import cv2
+import numpy as np
+import pytest
+
+from src.database.database_manager import DatabaseManager
+from src.database.db_models import Student
+from src.utils.config import RecognitionConfig
+from src.vision.camera_manager import CameraWorker, RemoteCameraWorker
+from src.vision.face_analyzer import FaceAnalyzer
+
+
+def make_result(*faces):
+    """Builds a FrameResult from (track id, student id, similarity) triples."""
+    return FaceAnalyzer().build_frame_result([
+        SimpleNamespace(bbox=np.array([0.0, 0.0, 40.0, 40.0]), det_score=0.9, track_id=track_id,
+                        student_id=student_id, similarity=similarity)
+        for track_id, student_id, similarity in faces
+    ])
+
+
+class ScriptedAnalyzer(FaceAnalyzer):
+    """A FaceAnalyzer that 'finds' one tracked face with a fixed embedding in every frame, without models."""
+
+    def __init__(self, embedding: np.ndarray):
+        super().__init__()
+        self.app = "scripted"
+        self.embedding = embedding
+
+    def process_frame(self, frame, metrics=None):
+        face = SimpleNamespace(
+            bbox=np.array([10.0, 8.0, 40.0, 38.0]), det_score=0.9, track_id=1, normed_embedding=self.embedding
+        )
+        return frame, [face]
+
+
+class TestCameraWorker:
+
+    def test_identifies_tracks_in_process(self, tmp_path):
+        """
+        Tests that the local worker fuses and commits track identities like the daemon does.
+        """
+        path = str(tmp_path / "feed.avi")
+        writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), 25, (64, 48))
+        for i in range(12):
+            writer.write(np.full((48, 64, 3), i * 20, dtype=np.uint8))
+        writer.release()
+
+        embedding = np.random.default_rng(0).standard_normal(512).astype(np.float32)
+        embedding /= np.linalg.norm(embedding)
+        db_manager = DatabaseManager(db_path=":memory:")
+        db_manager.add_student(Student(student_id="S01", student_name="Alice", student_image_path="alice.png",
+                                       student_face_embedding=embedding))
+
+        worker = CameraWorker(ScriptedAnalyzer(embedding), source=path, db_manager=db_manager,
+                              recognition_config=RecognitionConfig(min_samples=3, research_frames=3, min_votes=2))
+        identities = []
+        worker.identity_committed.connect(lambda student_id, similarity: identities.append((student_id, similarity)))
+        worker.start_capture()
+        _, result = worker.take_latest_frame()
+        db_manager.close()
+
+        assert len(identities) == 1
+        assert identities[0][0] == "S01" and identities[0][1] == pytest.approx(1.0, abs=1e-3)
+        assert result.student_ids == ["S01"] and result.labels[0].startswith("Alice")
+
+
+class TestRemoteCameraWorker:
+
+    def test_identity_emitted_once_per_track(self):
+        """
+        Tests that a labelled track is reported once, however many frames show it.
+        """
+        worker = RemoteCameraWorker("unused.sock")
+        identities = []
+        worker.identity_committed.connect(lambda student_id, similarity: identities.append((student_id, similarity)))
+        frame = np.zeros((4, 4, 3), dtype=np.uint8)
+
+        worker._publish(frame, make_result((1, None, None), (2, None, None)))
+        for _ in range(30):
+            worker._publish(frame, make_result((1, "S01", 0.8), (2, None, None)))
+        worker._publish(frame, make_result((1, "S01", 0.8), (2, "S02", 0.7), (None, "S03", 0.9)))
+        # The same student seen again on a new track is a new sighting
+        worker._publish(frame, make_result((3, "S01", 0.6)))
+
+        assert [student_id for student_id, _ in identities] == ["S01", "S02", "S01"]
+        assert identities[0][1] == pytest.approx(0.8)
+        assert worker.dropped_frames == 32
@@ -0,0 +1,105 @@
+import os
+import uuid
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from src.database.database_manager import DatabaseManager
+from src.database.db_models import Student
+from src.vision import enrollment_worker as enrollment_module
+from src.vision.enrollment_worker import EnrollmentWorker
+
+
+def make_face(size: float, det_score: float = 0.9) -> SimpleNamespace:
+    embedding = np.random.default_rng(int(size)).standard_normal(512).astype(np.float32)
+    return SimpleNamespace(bbox=np.array([10, 10, 10 + size, 10 + size]), det_score=det_score,
+                           normed_embedding=embedding / np.linalg.norm(embedding))
+
+
+class StubAnalyzer:
+    """Returns the same faces for every image."""
+    embedding_model = "buffalo_l"
+
+    def __init__(self, faces):
+        self.faces = faces
+
+    def detect_faces(self, image):
+        return self.faces
+
+
+@pytest.fixture(scope="function")
+def db_manager():
+    manager = DatabaseManager(db_path=":memory:")
+    yield manager
+    manager.close()
+
+
+@pytest.fixture(scope="function")
+def photo(tmp_path) -> str:
+    path = str(tmp_path / "upload" / "photo.jpg")
+    os.makedirs(os.path.dirname(path))
+    Image.fromarray(np.full((300, 200, 3), 120, dtype=np.uint8)).save(path)
+    return path
+
+
+def make_worker(faces, db_manager: DatabaseManager, tmp_path) -> EnrollmentWorker:
+    return EnrollmentWorker(StubAnalyzer(faces), db_manager, students_dir=str(tmp_path / "students"))
+
+
+class TestEnrollmentWorker:
+
+    def test_no_face(self, db_manager: DatabaseManager, photo: str, tmp_path):
+        """
+        Tests that a photo without faces is rejected without storing anything.
+        """
+        success, message = make_worker([], db_manager, tmp_path)._run("job", "Alice", photo)
+
+        assert not success and "No Faces Found" in message
+        assert db_manager.get_student_rows() == []
+        assert not os.path.exists(tmp_path / "students")
+
+    def test_face_too_small(self, db_manager: DatabaseManager, photo: str, tmp_path):
+        """
+        Tests that the largest face must meet the minimum size.
+        """
+        success, message = make_worker([make_face(40), make_face(30)], db_manager, tmp_path)._run("job", "Alice", photo)
+
+        assert not success and "too small" in message and "40px" in message
+        assert db_manager.get_student_rows() == []
+
+    def test_success(self, db_manager: DatabaseManager, photo: str, tmp_path):
+        """
+        Tests that the largest face is enrolled with a copy of the photo and its thumbnail.
+        """
+        large = make_face(120)
+        success, message = make_worker([make_face(80), large], db_manager, tmp_path)._run("job", "Alice", photo)
+
+        rows = db_manager.get_student_rows()
+        stored_path = rows[0].student_image_path
+        assert success and message == "Student 'Alice' enrolled."
+        assert [row.student_name for row in rows] == ["Alice"]
+        assert os.path.exists(stored_path) and os.path.exists(stored_path.replace(".jpg", ".thumb.jpg"))
+        match = db_manager.find_similar_student_rows(large.normed_embedding, k=1)[0]
+        assert match.similarity_score == pytest.approx(1.0, abs=1e-5)
+
+    @pytest.mark.parametrize("thumbnail_written", [True, False])
+    def test_duplicate_id_removes_stored_files(self, db_manager: DatabaseManager, photo: str, tmp_path,
+                                               monkeypatch, thumbnail_written: bool):
+        """
+        Tests that a student who cannot be saved leaves no files behind, even without a thumbnail.
+        """
+        student_id = uuid.UUID(int=1)
+        db_manager.add_student(Student(student_id=str(student_id), student_name="Bob", student_image_path="bob.jpg",
+                                       student_face_embedding=make_face(100).normed_embedding))
+        monkeypatch.setattr(enrollment_module.uuid, "uuid4", lambda: student_id)
+        if not thumbnail_written:
+            import cv2
+            monkeypatch.setattr(cv2, "imwrite", lambda *args: False)
+
+        success, message = make_worker([make_face(120)], db_manager, tmp_path)._run("job", "Alice", photo)
+
+        assert not success and message == "Student 'Alice' could not be saved."
+        assert os.listdir(tmp_path / "students") == []
+        assert [row.student_name for row in db_manager.get_student_rows()] == ["Bob"]
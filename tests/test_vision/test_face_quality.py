@@ -0,0 +1,76 @@
+import numpy as np
+
+from src.utils.config import QualityConfig
+from src.vision.face_quality import estimate_pose, score_faces
+
+
+def frontal_kps(x1: float, y1: float, size: float) -> np.ndarray:
+    """5-point landmarks of a frontal face filling the box (eyes, nose, mouth corners)."""
+    points = np.array([[0.3, 0.35], [0.7, 0.35], [0.5, 0.57], [0.35, 0.75], [0.65, 0.75]])
+    return points * size + [x1, y1]
+
+
+def textured_image(h: int = 240, w: int = 320) -> np.ndarray:
+    return np.random.default_rng(0).integers(0, 256, (h, w, 3), dtype=np.uint8)
+
+
+class TestFaceQuality:
+
+    def test_pose_of_frontal_and_turned_faces(self):
+        """
+        Tests that a frontal face has no yaw and that moving the nose sideways registers as yaw, not pitch.
+        """
+        frontal = frontal_kps(0, 0, 100)
+        turned = frontal.copy()
+        turned[2, 0] += 30
+
+        yaw, pitch = estimate_pose(np.stack([frontal, turned]))
+
+        np.testing.assert_allclose(yaw, [0.0, 0.75], atol=1e-6)
+        np.testing.assert_allclose(pitch, [0.0, 0.0], atol=1e-6)
+
+    def test_roll_is_not_yaw(self):
+        angle = np.radians(30)
+        rotation = np.array([[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]])
+        rolled = frontal_kps(-50, -50, 100) @ rotation.T
+
+        yaw, pitch = estimate_pose(rolled[None])
+
+        assert abs(yaw[0]) < 1e-6 and abs(pitch[0]) < 1e-6
+
+    def test_gating_reasons(self):
+        """
+        Tests each rejection reason on a batch of faces scored at once.
+        """
+        image = textured_image()
+        image[150:230, 200:280] = 128  # A flat, featureless patch
+        bboxes = np.array([
+            [10, 10, 90, 90],      # good
+            [100, 10, 120, 30],    # small
+            [10, 100, 90, 180],    # low detector score
+            [100, 100, 180, 180],  # turned
+            [200, 150, 280, 230],  # blurred
+        ], dtype=np.float32)
+        det_scores = np.array([0.9, 0.9, 0.3, 0.9, 0.9])
+        kpss = np.stack([frontal_kps(x1, y1, x2 - x1) for x1, y1, x2, _ in bboxes])
+        kpss[3, 2, 0] += 40
+
+        quality = score_faces(image, bboxes, det_scores, kpss, QualityConfig())
+
+        assert quality.passed.tolist() == [True, False, False, False, False]
+        assert quality.reasons == ["", "small", "low score", "turned", "blurred"]
+        assert quality.score[0] > quality.score[1:].max()
+        assert np.isnan(quality.sharpness[1:4]).all()
+
+    def test_disabled_gate_passes_everything(self):
+        bboxes = np.array([[0, 0, 10, 10]], dtype=np.float32)
+
+        quality = score_faces(textured_image(), bboxes, [0.1], None, QualityConfig(enabled=False))
+
+        assert quality.passed.tolist() == [True]
+        assert quality.reasons == ["small, low score"]
+
+    def test_no_faces(self):
+        quality = score_faces(textured_image(), np.empty((0, 4)), np.empty(0), None, QualityConfig())
+
+        assert len(quality.passed) == 0 and quality.reasons == []
@@ -0,0 +1,145 @@
+import os
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from src.record_frames import main as record_frames
+from src.vision.frame_recording import FrameRecorder, FrameRecording, ReplaySource
+from src.vision.frame_sources import VideoSource, create_source
+
+
+def make_frames(count: int) -> list[np.ndarray]:
+    rng = np.random.default_rng(0)
+    return [rng.integers(0, 256, (24, 32, 3), dtype=np.uint8) for _ in range(count)]
+
+
+def write_recording(path: str, frames: list[np.ndarray], interval: float = 0.04, **options) -> str:
+    with FrameRecorder(path, **options) as recorder:
+        for i, frame in enumerate(frames):
+            recorder.write(frame, timestamp=100 + i * interval)
+    return path
+
+
+class TestFrameRecording:
+
+    @pytest.mark.parametrize("compression", ["none", "png"])
+    def test_round_trip(self, tmp_path, compression):
+        """
+        Tests that frames and timestamps come back exactly, across several chunks.
+        """
+        frames = make_frames(10)
+        path = write_recording(str(tmp_path / "session.frames"), frames, compression=compression, chunk_frames=4)
+
+        recording = FrameRecording(path)
+
+        assert len(recording) == 10 and recording.shape == (24, 32, 3)
+        np.testing.assert_allclose(recording.timestamps, 100 + np.arange(10) * 0.04)
+        assert recording.fps == pytest.approx(25)
+        for i, frame in enumerate(frames):
+            np.testing.assert_array_equal(recording.frame(i), frame)
+
+    def test_raw_frames_are_mapped_not_copied(self, tmp_path):
+        path = write_recording(str(tmp_path / "session.frames"), make_frames(3))
+
+        recording = FrameRecording(path)
+        frame = recording.frame(1)
+
+        assert not frame.flags["OWNDATA"] and type(frame) is np.ndarray
+        assert np.shares_memory(frame, recording.frame(1))
+        # Copy-on-write: changing a frame leaves the file alone
+        frame[:] = 0
+        assert FrameRecording(path).frame(1).any()
+
+    def test_keeps_complete_chunks_of_a_cut_recording(self, tmp_path):
+        frames = make_frames(10)
+        path = write_recording(str(tmp_path / "session.frames"), frames, chunk_frames=4)
+        with open(path, "r+b") as f:
+            f.truncate(os.path.getsize(path) - 100)
+
+        recording = FrameRecording(path)
+
+        assert len(recording) == 8
+        np.testing.assert_array_equal(recording.frame(7), frames[7])
+
+    def test_rejects_other_files(self, tmp_path):
+        path = tmp_path / "clip.frames"
+        path.write_bytes(b"not a recording" * 10)
+
+        with pytest.raises(ValueError, match="not a frame recording"):
+            FrameRecording(str(path))
+        assert not ReplaySource(str(path)).open()
+
+    def test_rejects_a_frame_of_another_size(self, tmp_path):
+        with FrameRecorder(str(tmp_path / "session.frames")) as recorder:
+            recorder.write(np.zeros((24, 32, 3), dtype=np.uint8))
+            with pytest.raises(ValueError, match="differs"):
+                recorder.write(np.zeros((48, 64, 3), dtype=np.uint8))
+
+
+class TestReplaySource:
+
+    def test_replays_as_fast_as_possible_and_loops(self, tmp_path):
+        frames = make_frames(4)
+        path = write_recording(str(tmp_path / "session.frames"), frames, interval=1.0)
+
+        source = create_source(path, loop=True)
+        assert isinstance(source, ReplaySource) and source.is_file
+        assert source.open()
+        start = time.perf_counter()
+        replayed = [source.read()[1] for _ in range(10)]
+        source.release()
+
+        assert time.perf_counter() - start < 1.0
+        for i, frame in enumerate(replayed):
+            np.testing.assert_array_equal(frame, frames[i % 4])
+
+    def test_realtime_follows_the_recorded_timestamps(self, tmp_path):
+        path = write_recording(str(tmp_path / "session.frames"), make_frames(5), interval=0.05)
+
+        source = ReplaySource(path, realtime=True)
+        assert source.open()
+        start = time.perf_counter()
+        while source.read()[0]:
+            pass
+        source.release()
+
+        assert time.perf_counter() - start >= 0.19
+
+    def test_stop_interrupts_a_realtime_wait(self, tmp_path):
+        path = write_recording(str(tmp_path / "session.frames"), make_frames(2), interval=30)
+        source = ReplaySource(path, realtime=True)
+        assert source.open()
+        source.read()
+
+        result = []
+        reader = threading.Thread(target=lambda: result.append(source.read()))
+        reader.start()
+        source.stop()
+        reader.join(5)
+
+        assert not reader.is_alive() and result == [(False, None)]
+
+    def test_records_a_source(self, tmp_path):
+        """
+        Tests the record command end to end, from a video file to a recording with the same frames.
+        """
+        import cv2
+
+        video_path = str(tmp_path / "clip.avi")
+        writer = cv2.VideoWriter(video_path, cv2.VideoWriter_fourcc(*"MJPG"), 25, (32, 24))
+        for i in range(6):
+            writer.write(np.full((24, 32, 3), i * 40, dtype=np.uint8))
+        writer.release()
+        output = str(tmp_path / "recordings" / "clip.frames")
+
+        assert record_frames(["record", output, "--source", video_path, "--compression", "png"]) == 0
+
+        recording = FrameRecording(output)
+        video = VideoSource(video_path)
+        assert video.open()
+        assert len(recording) == 6 and recording.metadata["source"] == video_path
+        for i in range(6):
+            np.testing.assert_array_equal(recording.frame(i), video.read()[1])
+        video.release()
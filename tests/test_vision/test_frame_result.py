@@ -0,0 +1,47 @@
+import json
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.vision.face_analyzer import FaceAnalyzer
+from src.vision.frame_result import NO_TRACK, FrameResult
+
+
+def make_face(x: float, track_id=None, **attributes) -> SimpleNamespace:
+    return SimpleNamespace(bbox=np.array([x, 10.0, x + 40, 50.0, 0.0]), det_score=0.9, track_id=track_id, **attributes)
+
+
+class TestFrameResult:
+
+    def test_built_from_faces(self):
+        """
+        Tests that only the boxes, scores, ids and labels of the analyzer's faces are kept.
+        """
+        faces = [
+            make_face(0, track_id=3, student_id="S01", student_name="Alice", similarity=0.8, quality=0.7),
+            make_face(100, quality_reason="blurry"),
+        ]
+
+        result = FaceAnalyzer().build_frame_result(faces)
+
+        assert len(result) == 2
+        np.testing.assert_array_equal(result.boxes, [[0, 10, 40, 50], [100, 10, 140, 50]])
+        assert result.faces["track_id"].tolist() == [3, NO_TRACK]
+        assert result.faces["similarity"][0] == pytest.approx(0.8)
+        assert np.isnan(result.faces["similarity"][1])
+        assert result.student_ids == ["S01", None]
+        assert result.labels == ["Alice (90.00% id: 3)", "90.00% id: None (blurry)"]
+        assert list(result.overlays())[0] == (0, 10, 40, 50, "Alice (90.00% id: 3)")
+
+    def test_message_round_trip(self):
+        result = FaceAnalyzer().build_frame_result([make_face(0, track_id=1, student_id="S01", similarity=0.5)])
+
+        restored = FrameResult.from_message(json.loads(json.dumps(result.to_message())))
+
+        assert restored.faces.tobytes() == result.faces.tobytes()
+        assert restored.student_ids == result.student_ids and restored.labels == result.labels
+
+    def test_no_faces_share_the_empty_result(self):
+        assert FaceAnalyzer().build_frame_result([]) is FrameResult.EMPTY
+        assert FrameResult.from_message(FrameResult.EMPTY.to_message()) is FrameResult.EMPTY
@@ -0,0 +1,182 @@
+import threading
+
+import numpy as np
+import pytest
+
+import cv2
+
+from src.utils.config import CaptureConfig
+from src.vision.frame_sources import FrameBufferPool, VideoSource
+
+
+FAST_RECONNECT = dict(reconnect_delay=0.01, max_reconnect_delay=0.02)
+
+
+class FlakyCapture:
+    """A stand-in for `cv2.VideoCapture` that delivers numbered frames and then drops out."""
+
+    def __init__(self, opened: bool = True, frames: int = 3, first: int = 0):
+        self.opened = opened
+        self.remaining = frames
+        self.next_value = first
+        self.props = {}
+
+    def isOpened(self):
+        return self.opened
+
+    def read(self, image=None):
+        if not self.opened or self.remaining == 0:
+            return False, None
+        self.remaining -= 1
+        self.next_value += 1
+        if image is None:
+            image = np.empty((4, 4, 3), dtype=np.uint8)
+        image[...] = self.next_value
+        return True, image
+
+    def set(self, prop, value):
+        self.props[prop] = value
+        return True
+
+    def get(self, prop):
+        return self.props.get(prop, 0)
+
+    def release(self):
+        self.opened = False
+
+
+class FlakySource(VideoSource):
+    """A camera source whose successive connections are the given `FlakyCapture`s."""
+
+    def __init__(self, captures: list, **config):
+        super().__init__(0, capture_config=CaptureConfig(**config))
+        self.captures = list(captures)
+        self.opened = []
+
+    def _open_capture(self):
+        capture = self.captures.pop(0) if self.captures else FlakyCapture(opened=False)
+        self.opened.append(capture)
+        return capture
+
+
+def read_all(source: VideoSource, limit: int = 100) -> list[int]:
+    values = []
+    while len(values) < limit:
+        ret, frame = source.read()
+        if not ret:
+            break
+        values.append(int(frame[0, 0, 0]))
+    return values
+
+
+@pytest.fixture(scope="function")
+def video_path(tmp_path):
+    path = str(tmp_path / "clip.avi")
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), 25, (32, 24))
+    for i in range(5):
+        writer.write(np.full((24, 32, 3), i * 40, dtype=np.uint8))
+    writer.release()
+    return path
+
+
+class TestVideoSource:
+
+    def test_kinds_of_sources(self, video_path):
+        camera, stream, file = VideoSource("1"), VideoSource("rtsp://10.0.0.5/hall"), VideoSource(video_path)
+
+        assert camera.source == 1 and camera.is_live and not camera.is_stream
+        assert stream.is_live and stream.is_stream
+        assert file.is_file and not file.is_live
+        assert stream.describe() == "stream 'rtsp://10.0.0.5/hall'"
+
+    def test_file_ends_and_loops(self, video_path):
+        source = VideoSource(video_path)
+        assert source.open()
+        assert len(read_all(source)) == 5
+        source.release()
+
+        looping = VideoSource(video_path, loop=True)
+        assert looping.open()
+        assert len(read_all(looping, limit=12)) == 12
+        looping.release()
+
+    @pytest.mark.parametrize("grab_thread", [False, True])
+    def test_reconnects_with_backoff(self, grab_thread):
+        """
+        Tests that a camera that drops out is reopened, retrying a failed reopen, and keeps delivering frames.
+        """
+        source = FlakySource(
+            [FlakyCapture(frames=3), FlakyCapture(opened=False), FlakyCapture(frames=2, first=10)],
+            grab_thread=grab_thread, max_reconnect_attempts=3, **FAST_RECONNECT
+        )
+
+        assert source.open()
+        values = read_all(source)
+        source.release()
+
+        if grab_thread:
+            # The grabber keeps only the newest frame, so a slow reader may skip some
+            assert values and set(values) <= {1, 2, 3, 11, 12} and values[-1] == 12
+        else:
+            assert values == [1, 2, 3, 11, 12]
+        assert source.reconnects == 1
+        # After the second connection dropped, three attempts failed and it gave up
+        assert len(source.opened) == 6
+
+    def test_applies_capture_settings(self):
+        source = FlakySource([FlakyCapture()], width=1280, height=720, fps=30, fourcc="MJPG", buffer_size=1,
+                             grab_thread=False)
+
+        assert source.open()
+        props = source.opened[0].props
+        source.release()
+
+        assert props[cv2.CAP_PROP_FRAME_WIDTH] == 1280
+        assert props[cv2.CAP_PROP_FRAME_HEIGHT] == 720
+        assert props[cv2.CAP_PROP_FPS] == 30
+        assert props[cv2.CAP_PROP_FOURCC] == cv2.VideoWriter_fourcc(*"MJPG")
+        assert props[cv2.CAP_PROP_BUFFERSIZE] == 1
+
+    def test_stop_cancels_reconnecting(self):
+        source = FlakySource([FlakyCapture(frames=0)], grab_thread=False, reconnect_delay=30)
+        assert source.open()
+
+        result = []
+        reader = threading.Thread(target=lambda: result.append(source.read()))
+        reader.start()
+        source.stop()
+        reader.join(5)
+        source.release()
+
+        assert not reader.is_alive()
+        assert result == [(False, None)]
+
+
+class TestFrameBufferPool:
+
+    def test_reuses_released_buffers_only(self):
+        """
+        Tests that frames are decoded into pooled arrays once dropped, and never into one that is still held.
+        """
+        pool = FrameBufferPool(size=2)
+        capture = FlakyCapture(frames=10)
+
+        _, first = pool.read(capture)
+        first_id = id(first)
+        del first
+        _, second = pool.read(capture)
+        assert id(second) == first_id
+
+        _, third = pool.read(capture)
+        _, fourth = pool.read(capture)
+        # Both pooled buffers are held, so a new frame is allocated without evicting them
+        assert len({id(second), id(third), id(fourth)}) == 3
+        assert [int(frame[0, 0, 0]) for frame in (second, third, fourth)] == [2, 3, 4]
+
+    def test_disabled_pool_allocates(self):
+        source = FlakySource([FlakyCapture(frames=3)], grab_thread=False, reconnect=False, frame_buffers=0)
+        assert source.open()
+
+        assert read_all(source) == [1, 2, 3]
+        assert source.buffers.acquire() is None
+        source.release()
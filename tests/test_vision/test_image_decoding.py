@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+from PIL import Image
+
+from src.vision.image_decoding import decode_image, make_thumbnail, reduction_factor, thumbnail_path_for
+
+
+def save_photo(path, width: int, height: int, **options) -> str:
+    """Saves a smooth gradient photo, so lossy formats keep its colours."""
+    x = np.linspace(0, 255, width, dtype=np.uint8)
+    y = np.linspace(0, 255, height, dtype=np.uint8)
+    pixels = np.stack([np.broadcast_to(x, (height, width)), np.broadcast_to(y[:, None], (height, width)),
+                       np.full((height, width), 128, dtype=np.uint8)], axis=-1)
+    Image.fromarray(pixels).save(path, **options)
+    return str(path)
+
+
+class TestImageDecoding:
+
+    def test_reduction_factor(self):
+        """
+        Tests that the largest reduction keeping the longest side at or above the target is picked.
+        """
+        assert reduction_factor(4000, 1024) == 2
+        assert reduction_factor(8192, 1024) == 8
+        assert reduction_factor(1500, 1024) == 1
+        assert reduction_factor(0, 1024) == 1
+
+    def test_large_jpeg_is_decoded_at_reduced_resolution(self, tmp_path):
+        """
+        Tests that a large JPEG is decoded by the reduced decoder straight to the smaller size.
+        """
+        path = save_photo(tmp_path / "large.jpg", 4096, 3072, quality=90)
+
+        decoded = decode_image(path, target_size=1024)
+
+        assert decoded.original_size == (4096, 3072)
+        assert decoded.reduction == 4
+        assert decoded.image.shape == (768, 1024, 3)
+
+    def test_exif_orientation_is_applied(self, tmp_path):
+        """
+        Tests that EXIF orientation 6 (rotated 90 degrees) swaps the decoded dimensions.
+        """
+        exif = Image.Exif()
+        exif[0x0112] = 6
+        path = save_photo(tmp_path / "portrait.jpg", 400, 200, exif=exif)
+
+        decoded = decode_image(path, target_size=200)
+
+        assert decoded.original_size == (400, 200)
+        assert decoded.reduction == 2
+        assert decoded.image.shape == (200, 100, 3)
+
+    def test_pil_fallback_for_formats_opencv_cannot_read(self, tmp_path):
+        """
+        Tests that a format OpenCV does not decode is read through PIL, as BGR.
+        """
+        path = save_photo(tmp_path / "photo.tga", 60, 40)
+
+        decoded = decode_image(path, target_size=1024)
+
+        assert decoded.reduction == 1
+        assert decoded.image.shape == (40, 60, 3)
+        # The gradient's red channel runs along x, so it must end up last in BGR
+        assert decoded.image[0, -1, 2] == 255 and decoded.image[0, -1, 0] == 128
+
+    def test_thumbnail_size(self, tmp_path):
+        """
+        Tests that thumbnails keep the aspect ratio and never upscale.
+        """
+        path = save_photo(tmp_path / "photo.png", 300, 150)
+
+        decoded = decode_image(path, thumbnail_size=96)
+        without_thumbnail = decode_image(path, thumbnail_size=None)
+        small = np.zeros((40, 20, 3), dtype=np.uint8)
+
+        assert decoded.thumbnail.shape == (48, 96, 3)
+        assert without_thumbnail.thumbnail is None
+        assert make_thumbnail(small, 96) is small
+        assert make_thumbnail(small, 10).shape == (10, 5, 3)
+
+    @pytest.mark.parametrize("image_path, expected", [
+        ("students/S01.jpg", "students/S01.thumb.jpg"),
+        ("students/S01.PNG", "students/S01.thumb.jpg"),
+        ("students/s.01/photo", "students/s.01/photo.thumb.jpg"),
+    ])
+    def test_thumbnail_path_for(self, image_path, expected):
+        """
+        Tests where the thumbnail of a stored photo is kept.
+        """
+        assert thumbnail_path_for(image_path) == expected
@@ -0,0 +1,103 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.vision.face_analyzer import FaceAnalyzer
+from src.vision.kalman_tracker import KalmanTracker, iou_matrix
+
+
+def moving_boxes(starts: list, velocity: tuple, frames: int) -> list[np.ndarray]:
+    """Returns per-frame (n, 5) detections of 40x40 boxes moving at a constant velocity."""
+    starts = np.asarray(starts, dtype=np.float64)
+    return [
+        np.column_stack([starts + np.multiply(velocity, i), starts + np.multiply(velocity, i) + 40, np.full(len(starts), 0.9)])
+        for i in range(frames)
+    ]
+
+
+class TestKalmanTracker:
+
+    def test_follows_moving_faces(self):
+        """
+        Tests that moving faces keep their ids and the boxes converge on the detections.
+        """
+        tracker = KalmanTracker(max_age=5, min_hits=3)
+        for dets in moving_boxes([(0, 0), (200, 0), (0, 200)], velocity=(4, 2), frames=20):
+            tracks = tracker.update(dets)
+
+        assert tracks.shape == (3, 6)
+        assert sorted(tracks[:, 5].tolist()) == [1, 2, 3]
+        tracks = tracks[np.argsort(tracks[:, 5])]
+        np.testing.assert_allclose(tracks[:, :4], dets[:, :4], atol=0.5)
+        np.testing.assert_allclose(tracks[:, 4], 0.9)
+
+    def test_batched_tracks_match_single_tracks(self):
+        """
+        Tests that stepping tracks together gives exactly what one tracker per face gives.
+        """
+        starts = [(0, 0), (300, 0), (0, 300)]
+        together = KalmanTracker()
+        alone = [KalmanTracker() for _ in starts]
+        rng = np.random.default_rng(0)
+        for dets in moving_boxes(starts, velocity=(3, -1), frames=15):
+            dets[:, :4] += rng.normal(0, 1, (len(starts), 4))
+            combined = together.update(dets)
+            separate = np.concatenate([tracker.update(dets[i:i + 1]) for i, tracker in enumerate(alone)])
+            np.testing.assert_allclose(combined[:, :5], separate[:, :5])
+
+    def test_confirms_and_forgets_tracks(self):
+        tracker = KalmanTracker(max_age=2, min_hits=3)
+        frames = moving_boxes([(0, 0)], velocity=(0, 0), frames=8)
+        empty = np.empty((0, 5))
+
+        # Reported from the start while the tracker itself is warming up
+        assert len(tracker.update(frames[0])) == 1
+        for dets in frames[1:6]:
+            assert tracker.update(dets)[0, 5] == 1
+        # Unseen frames are not reported, and after max_age the track is gone
+        for _ in range(3):
+            assert len(tracker.update(empty)) == 0
+        assert len(tracker) == 0
+
+        # Once warmed up, a new track needs min_hits matches after the detection that created it
+        assert [len(tracker.update(frames[0])) for _ in range(4)] == [0, 0, 0, 1]
+        assert tracker.update(frames[0])[0, 5] == 2
+
+    def test_resolves_overlapping_faces(self):
+        """
+        Tests that when one detection overlaps two tracks, the optimal assignment keeps both ids.
+        """
+        tracker = KalmanTracker(min_hits=1)
+        base = np.array([[0, 0, 40, 40, 0.9], [24, 0, 64, 40, 0.9]])
+        for _ in range(5):
+            tracker.update(base)
+
+        shifted = base.copy()
+        shifted[0, :4] += (10, 0, 10, 0)
+        tracks = tracker.update(shifted)
+
+        assert iou_matrix(shifted, base)[0, 1] > 0.3
+        assert tracks[np.argsort(tracks[:, 5]), 5].tolist() == [1, 2]
+        first, second = tracks[np.argsort(tracks[:, 5]), 0]
+        assert 5 < first < 10 and second == pytest.approx(24)
+
+
+class TestAssociateTrackerIds:
+
+    def test_faces_take_the_best_unclaimed_track(self):
+        faces = [SimpleNamespace(bbox=np.array([0.0, 0, 40, 40])), SimpleNamespace(bbox=np.array([2.0, 0, 42, 40])),
+                 SimpleNamespace(bbox=np.array([500.0, 0, 540, 40]))]
+        tracks = np.array([[1, 0, 41, 40, 0.9, 7], [30, 0, 70, 40, 0.9, 8]])
+
+        FaceAnalyzer().associate_tracker_ids(faces, tracks)
+
+        # The second face's best track is taken and the other one overlaps too little
+        assert [face.track_id for face in faces] == [7, None, None]
+
+    def test_no_tracks(self):
+        faces = [SimpleNamespace(bbox=np.array([0.0, 0, 40, 40]))]
+
+        FaceAnalyzer().associate_tracker_ids(faces, np.empty((0, 6)))
+
+        assert faces[0].track_id is None
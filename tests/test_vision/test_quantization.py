@@ -0,0 +1,29 @@
+import numpy as np
+
+from src.vision.quantization import cosine_agreement, quantized_pack_name, top1_match_rate
+
+
+class TestQuantizationMetrics:
+
+    def test_cosine_agreement_is_row_wise(self):
+        """
+        Tests that each face is compared with its own counterpart, independent of scale.
+        """
+        reference = np.array([[1.0, 0.0], [0.0, 1.0]])
+        candidate = np.array([[2.0, 0.0], [1.0, 1.0]])
+
+        np.testing.assert_allclose(cosine_agreement(reference, candidate), [1.0, np.sqrt(0.5)])
+
+    def test_top1_match_rate(self):
+        """
+        Tests that only queries whose nearest gallery row is their own student count as matches.
+        """
+        gallery = np.eye(3)
+        queries = np.array([[0.9, 0.1, 0.0], [0.0, 0.2, 0.9], [0.1, 0.0, 0.95]])
+        labels = np.array([0, 1, 2])
+
+        assert top1_match_rate(queries, gallery, labels) == 2 / 3
+        assert top1_match_rate(np.empty((0, 3)), gallery, np.empty(0, dtype=int)) == 0.0
+
+    def test_quantized_pack_name(self):
+        assert quantized_pack_name("buffalo_l") == "buffalo_l_int8"
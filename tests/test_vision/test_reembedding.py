@@ -0,0 +1,105 @@
+import zlib
+
+import numpy as np
+import pytest
+
+from src.database.database_manager import DatabaseManager, GalleryModelError
+from src.database.db_models import Student
+from src.vision.reembedding import reembed_gallery
+
+
+def new_model_embedding(image_path: str) -> np.ndarray:
+    vector = np.random.default_rng(zlib.crc32(image_path.encode())).standard_normal(512).astype(np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+class FakeEmbedder:
+    """Embeds a 'photo' from its path, failing for paths containing 'blurry' and after `fail_after` batches."""
+
+    def __init__(self, fail_after: int = None):
+        self.fail_after = fail_after
+        self.batches = 0
+        self.embedded_paths = []
+
+    def __call__(self, batch):
+        if self.batches == self.fail_after:
+            raise KeyboardInterrupt("Interrupted")
+        self.batches += 1
+        results = []
+        for rowid, image_path in batch:
+            self.embedded_paths.append(image_path)
+            if "blurry" in image_path:
+                results.append((rowid, None, "No usable face in the photo"))
+            else:
+                results.append((rowid, new_model_embedding(image_path), None))
+        return results
+
+
+@pytest.fixture(scope="function")
+def db_manager():
+    manager = DatabaseManager(db_path=":memory:")
+    rng = np.random.default_rng(0)
+    for i in range(7):
+        manager.add_student(Student(
+            student_id=f"S{i}",
+            student_name=f"Student {i}",
+            student_image_path=f"photos/{i}.jpg",
+            student_face_embedding=rng.random(512).astype(np.float32),
+            embedding_model="buffalo_l"
+        ))
+    yield manager
+    manager.close()
+
+
+class TestReembedding:
+
+    def test_reembeds_and_swaps(self, db_manager: DatabaseManager):
+        """
+        Tests that every student gets the new model's vector and tag in one swap.
+        """
+        report = reembed_gallery(db_manager, FakeEmbedder(), "buffalo_l_int8", workers=0, batch_size=2)
+
+        assert report.swapped and report.embedded == 7 and report.failed == 0
+        assert db_manager.gallery_models() == ["buffalo_l_int8"]
+        assert db_manager.reembedding_job() is None
+        match = db_manager.find_similar_student_rows(new_model_embedding("photos/3.jpg"), k=1)[0]
+        assert match.student_id == "S3"
+        assert match.similarity_score == pytest.approx(1.0, abs=1e-5)
+
+    def test_resumes_after_interruption(self, db_manager: DatabaseManager):
+        """
+        Tests that an interrupted job keeps its checkpoints, leaves the live gallery alone, and resumes.
+        """
+        with pytest.raises(KeyboardInterrupt):
+            reembed_gallery(db_manager, FakeEmbedder(fail_after=2), "buffalo_l_int8", workers=0, batch_size=2)
+
+        assert db_manager.reembedding_progress() == (7, 4, 0)
+        assert db_manager.gallery_models() == ["buffalo_l"]
+
+        embedder = FakeEmbedder()
+        report = reembed_gallery(db_manager, embedder, "buffalo_l_int8", workers=0, batch_size=2)
+
+        assert report.resumed == 4 and report.embedded == 3 and report.swapped
+        assert embedder.embedded_paths == ["photos/4.jpg", "photos/5.jpg", "photos/6.jpg"]
+
+    def test_failed_photos_block_the_swap(self, db_manager: DatabaseManager):
+        db_manager.conn.execute("UPDATE students SET student_image_path = 'photos/blurry.jpg' WHERE student_id = 'S5'")
+
+        report = reembed_gallery(db_manager, FakeEmbedder(), "buffalo_l_int8", workers=0)
+
+        assert not report.swapped and report.failed == 1
+        assert db_manager.reembedding_failures() == [("S5", "photos/blurry.jpg", "No usable face in the photo")]
+        with pytest.raises(GalleryModelError, match="1 students"):
+            db_manager.swap_reembedded_gallery()
+
+        db_manager.conn.execute("UPDATE students SET student_image_path = 'photos/5.jpg' WHERE student_id = 'S5'")
+        report = reembed_gallery(db_manager, FakeEmbedder(), "buffalo_l_int8", workers=0, retry_failed=True)
+
+        assert report.swapped and report.embedded == 1
+
+    def test_worker_processes(self, db_manager: DatabaseManager):
+        report = reembed_gallery(db_manager, FakeEmbedder(), "buffalo_l_int8", workers=2, batch_size=2)
+
+        assert report.swapped and report.embedded == 7
+        match = db_manager.find_similar_student_rows(new_model_embedding("photos/6.jpg"), k=1)[0]
+        assert match.student_id == "S6"
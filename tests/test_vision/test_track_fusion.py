@@ -0,0 +1,108 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from src.database.db_models import StudentMatch
+from src.utils.config import RecognitionConfig
+from src.vision.track_fusion import TrackFusion
+
+
+def unit(vector: np.ndarray) -> np.ndarray:
+    return (vector / np.linalg.norm(vector)).astype(np.float32)
+
+
+def face(track_id: int, embedding: np.ndarray = None, quality: float = 1.0) -> SimpleNamespace:
+    return SimpleNamespace(track_id=track_id, normed_embedding=embedding, quality=quality)
+
+
+class Gallery:
+    """A stand-in for the database search that records its queries."""
+
+    def __init__(self, students: dict):
+        self.students = students
+        self.queries = []
+
+    def search(self, embedding: np.ndarray):
+        self.queries.append(embedding)
+        similarities = {student_id: float(np.dot(embedding, vector)) for student_id, vector in self.students.items()}
+        student_id = max(similarities, key=similarities.get)
+        return StudentMatch(student_id, student_id.title(), "", similarities[student_id])
+
+
+class TestTrackFusion:
+
+    def setup_method(self):
+        rng = np.random.default_rng(0)
+        self.alice = unit(rng.standard_normal(512))
+        self.bob = unit(rng.standard_normal(512))
+        self.gallery = Gallery({"alice": self.alice, "bob": self.bob})
+
+    def test_searches_only_when_stable_and_commits_by_vote(self):
+        """
+        Tests that a steady track is searched once it has enough samples, again after
+        `research_frames`, and is committed and no longer searched after `min_votes` votes.
+        """
+        fusion = TrackFusion(self.gallery.search, RecognitionConfig(min_samples=3, research_frames=5, min_votes=2))
+        committed = []
+        labels = []
+        for frame_number in range(30):
+            faces = [face(7, self.alice)]
+            committed += fusion.update(frame_number, faces)
+            labels.append(getattr(faces[0], "student_id", None))
+
+        assert len(self.gallery.queries) == 2
+        assert [(identity.track_id, identity.student_id, identity.votes) for identity in committed] == [(7, "alice", 2)]
+        assert labels == [None] * 7 + ["alice"] * 23
+        assert fusion.committed_tracks == 1
+
+    def test_low_quality_frames_weigh_less(self):
+        """
+        Tests that a few sharp frames outweigh many marginal ones that look more like someone else.
+        """
+        fusion = TrackFusion(self.gallery.search, RecognitionConfig(min_samples=100))
+        marginal = unit(0.4 * self.alice + 0.6 * self.bob)
+        for frame_number in range(10):
+            fusion.update(frame_number, [face(1, marginal, quality=0.05)])
+        for frame_number in range(10, 12):
+            fusion.update(frame_number, [face(1, self.alice, quality=1.0)])
+
+        committed = fusion.finish(12)
+
+        assert len(self.gallery.queries) == 1
+        assert committed[0].student_id == "alice"
+
+    def test_drifting_track_is_not_searched(self):
+        rng = np.random.default_rng(1)
+        fusion = TrackFusion(self.gallery.search, RecognitionConfig(min_samples=2, max_drift=0.001))
+
+        for frame_number in range(10):
+            fusion.update(frame_number, [face(1, unit(rng.standard_normal(512)))])
+
+        assert self.gallery.queries == []
+
+    def test_track_end_commits_majority(self):
+        """
+        Tests that a track that disappears before reaching `min_votes` is searched once more and committed.
+        """
+        fusion = TrackFusion(self.gallery.search, RecognitionConfig(min_samples=2, min_votes=3, track_timeout=5))
+        committed = []
+        for frame_number in range(4):
+            committed += fusion.update(frame_number, [face(3, self.bob)])
+        for frame_number in range(4, 12):
+            committed += fusion.update(frame_number, [])
+
+        assert len(committed) == 1
+        assert committed[0].student_id == "bob" and committed[0].ended
+        assert len(self.gallery.queries) == 2
+        assert fusion.committed_tracks == 0
+
+    def test_unknown_and_unembedded_faces(self):
+        stranger = np.zeros(512, dtype=np.float32)
+        stranger[0] = 1.0
+        fusion = TrackFusion(self.gallery.search, RecognitionConfig(min_samples=1, min_votes=1, match_threshold=0.5))
+
+        committed = fusion.update(0, [face(1, stranger), face(2, None), face(None, self.alice)])
+
+        assert [(identity.track_id, identity.student_id) for identity in committed] == [(1, None)]
+        assert len(self.gallery.queries) == 1
+        assert fusion.finish(1) == []